@@ -41,11 +41,14 @@ from utils.process_logging import create_process_log_start, update_process_log_f
 from utils.platform_analysis.visualization_utils import (
     create_combined_identifier_platform_view,
     create_non_identifier_platform_view,
-    create_identifier_platform_view,
+    create_identifier_platform_view_batch,
     create_platform_composite_with_folders, 
     create_platform_composite,
     create_clean_platform,
-    create_combined_holes_platform_view
+    create_combined_holes_platform_view,
+    create_layer_pool,
+    release_cached_figures,
+    build_shape_columns
 )
 
 from utils.platform_analysis.exclusion_handler import (
@@ -677,6 +680,9 @@ def run_analysis(build_id=None, holes_interval=10, create_composite_views=False)
         # Print summary information
         print_identifier_summary(platform_info["file_identifier_summary"], closed_paths_found)
         
+        # One spawn pool parses the CLF files for every height of the views below (None for a single file)
+        layer_pool = create_layer_pool(len(clf_files))
+        
         # Create composite platform views with original layer heights (conditional)
         if create_composite_views:
             print("\nGenerating platform composite views...")
@@ -686,7 +692,8 @@ def run_analysis(build_id=None, holes_interval=10, create_composite_views=False)
                     composite_file = create_platform_composite_with_folders(clf_files, output_dir, 
                                                             height=height, 
                                                             fill_closed=fill_closed,
-                                                            create_transparent_png=create_composite_transparent_pngs)
+                                                            create_transparent_png=create_composite_transparent_pngs,
+                                                            pool=layer_pool)
                     platform_info["platform_composites"].append({
                         "height": height,
                         "filename": composite_file
@@ -721,7 +728,8 @@ def run_analysis(build_id=None, holes_interval=10, create_composite_views=False)
                         height=height,
                         fill_closed=fill_closed,
                         alignment_style_only=alignment_style_only,
-                        save_clean_png=should_create_png
+                        save_clean_png=should_create_png,
+                        pool=layer_pool
                     )
                     
                     if should_create_png and clean_file:
@@ -737,6 +745,10 @@ def run_analysis(build_id=None, holes_interval=10, create_composite_views=False)
                 except Exception as e:
                     print(f"Error creating clean platform at height {height}mm: {str(e)}")
         
+        # Split each identifier's shapes into numpy columns once for the batched views
+        for shapes_data in shapes_by_identifier.values():
+            shapes_data['columns'] = build_shape_columns(shapes_data['shapes'])
+        
         # =============================================================================
         # PLATFORM VIEW GENERATION - All view generation happens after data collection
         # =============================================================================
@@ -746,6 +758,12 @@ def run_analysis(build_id=None, holes_interval=10, create_composite_views=False)
         
         # Generate identifier and non-identifier platform views
         print("\nGenerating identifier and non-identifier platform views...")
+        
+        # All identifier views share one platform background, drawn once for the batch
+        identifiers = [identifier for identifier in shapes_by_identifier if identifier != 'no_identifier']
+        print(f"Creating platform views for {len(identifiers)} identifiers...")
+        identifier_view_files = create_identifier_platform_view_batch(identifiers, shapes_by_identifier, output_dir)
+        
         for identifier, shapes_data in shapes_by_identifier.items():
             try:
                 if identifier == 'no_identifier':
@@ -761,8 +779,7 @@ def run_analysis(build_id=None, holes_interval=10, create_composite_views=False)
                         }
                         print(f"Created non-identifier view with {shapes_data['count']} shapes")
                 else:
-                    print(f"Creating platform view for identifier {identifier}...")
-                    view_file = create_identifier_platform_view(identifier, shapes_data, output_dir)
+                    view_file = identifier_view_files[identifier]
                     if view_file:
                         from utils.myfuncs.shape_things import should_close_path
                         closed_count = 0
@@ -770,7 +787,11 @@ def run_analysis(build_id=None, holes_interval=10, create_composite_views=False)
                         for shape_info in shapes_data['shapes']:
                             if shape_info['points'] is not None and len(shape_info['points']) > 2:
                                 total_count += 1
-                                if should_close_path(shape_info['points']):
+                                # analyze_layer stores the closure test; recompute only if it is missing
+                                should_close = shape_info.get('should_close')
+                                if should_close is None:
+                                    should_close = should_close_path(shape_info['points'])
+                                if should_close:
                                     closed_count += 1
                         
                         platform_info["identifier_platform_views"].append({
@@ -806,7 +827,7 @@ def run_analysis(build_id=None, holes_interval=10, create_composite_views=False)
 
         # Create combined holes platform view at specific height
         print("\nGenerating combined holes platform view...")
-        holes_view_file, holes_stats = create_combined_holes_platform_view(clf_files, output_dir, height=134.00)
+        holes_view_file, holes_stats = create_combined_holes_platform_view(clf_files, output_dir, height=134.00, pool=layer_pool)
         if holes_view_file:
             platform_info["combined_holes_view"] = {
                 "filename": holes_view_file,
@@ -829,7 +850,7 @@ def run_analysis(build_id=None, holes_interval=10, create_composite_views=False)
         for height in holes_heights:
             try:
                 print(f"Processing holes view at height {height}mm...")
-                holes_view_file, holes_stats = create_combined_holes_platform_view(clf_files, output_dir, height=height)
+                holes_view_file, holes_stats = create_combined_holes_platform_view(clf_files, output_dir, height=height, pool=layer_pool)
                 if holes_view_file:
                     successful_holes_views.append({
                         "height": height,
@@ -932,6 +953,14 @@ def run_analysis(build_id=None, holes_interval=10, create_composite_views=False)
             "build_id": build_id if 'build_id' in locals() else None
         }
     finally:
+        # Shut down the layer parsing pool
+        if locals().get('layer_pool') is not None:
+            layer_pool.close()
+            layer_pool.join()
+        
+        # Close the figures the views kept open for reuse in this thread
+        release_cached_figures()
+        
         # Clean up the logging listener
         if 'listener' in locals():
             logger.info("Shutting down logging listener")
@@ -9,7 +9,10 @@ from .plotTools import (
     add_reference_lines,
     set_platform_limits,
     draw_shape,
+    draw_shapes_batched,
+    draw_shapes_collection,
     draw_aligned_shape,
+    draw_aligned_shapes,
     save_platform_figure
 )
 from .logging_utils import setup_logging
\ No newline at end of file
@@ -1,23 +1,26 @@
-import matplotlib
-# Ensure we use non-interactive backend for web applications
-if matplotlib.get_backend() != 'Agg':
-    matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+import os
+# Default to the non-interactive backend for web applications without overriding a backend
+# the caller already chose. pyplot is imported inside the functions that create figures, so
+# modules that import these helpers without drawing (e.g. CLF ingestion workers) do not pay for it
+os.environ.setdefault('MPLBACKEND', 'Agg')
 import numpy as np
 from matplotlib.patches import Polygon
 
 # Import platform configuration
 from config import PLATFORM_HALF_SIZE_MM
 
+# Platform outline is fixed for the process, so build its vertices once
+_PLATFORM_BOUNDARY_XY = PLATFORM_HALF_SIZE_MM * np.array([[-1, -1], [1, -1], [1, 1], [-1, 1], [-1, -1]], 
+                                                        dtype=float)
+
 def setup_platform_figure(figsize=(15, 15)):
     """Creates and returns a new figure with standard size for platform plots"""
+    import matplotlib.pyplot as plt
     return plt.figure(figsize=figsize)
 
 def draw_platform_boundary(plt, alpha=0.5, label='Platform boundary', linestyle='--', color='k'):
     """Draws the platform boundary using configured platform size"""
-    half_size = PLATFORM_HALF_SIZE_MM
-    return plt.plot([-half_size, half_size, half_size, -half_size, -half_size], 
-                    [-half_size, -half_size, half_size, half_size, -half_size], 
+    return plt.plot(_PLATFORM_BOUNDARY_XY[:, 0], _PLATFORM_BOUNDARY_XY[:, 1], 
                     f'{color}{linestyle}', alpha=alpha, label=label)
 
 def add_reference_lines(plt, alpha=0.3, grid_alpha=0.2):
@@ -40,28 +43,28 @@ def set_platform_limits(plt, margin=5):
 
 def setup_clean_platform_figure(figsize=(15, 15)):
     """Creates a figure specifically for clean platform views with no chart elements"""
+    import matplotlib.pyplot as plt
     fig = plt.figure(figsize=figsize)
     
     # Remove all margins and spacing
     ax = plt.gca()
     ax.set_position([0, 0, 1, 1])
     
-    # Set exact limits for platform size
+    # Set exact, square limits for platform size
     half_size = PLATFORM_HALF_SIZE_MM
-    plt.xlim(-half_size, half_size)
-    plt.ylim(-half_size, half_size)
+    ax.set_xlim(-half_size, half_size)
+    ax.set_ylim(-half_size, half_size)
+    ax.set_aspect('equal', adjustable='box')
     
-    # Turn off all chart elements
-    ax.set_xticks([])
-    ax.set_yticks([])
-    ax.set_xticklabels([])
-    ax.set_yticklabels([])
-    plt.axis('off')
+    # Turn off all chart elements (ticks, labels and frame) in one call
+    ax.set_axis_off()
     
     return fig
 
-def draw_shape(plt, points, color, alpha=0.7, linewidth=0.5):
-    """Draw a shape, closing the path if appropriate"""
+def draw_shape(plt, points, color, alpha=0.7, linewidth=0.5, should_close=None):
+    """Draw a shape, closing the path if appropriate.
+    plt may be pyplot or an Axes; passing the Axes skips pyplot's current-axes lookup per call.
+    Pass should_close when it is already known to skip recomputing should_close_path."""
     from utils.myfuncs.shape_things import should_close_path
     
     if len(points) < 2:
@@ -74,42 +77,124 @@ def draw_shape(plt, points, color, alpha=0.7, linewidth=0.5):
             color=color, linewidth=linewidth, alpha=alpha)
     
     # If should be closed, add closure line
-    if should_close_path(points):
+    if should_close is None:
+        should_close = should_close_path(points)
+    if should_close:
         # Draw closing line
         closure_points = np.vstack([points[-1], points[0]])
         plt.plot(closure_points[:, 0], closure_points[:, 1], '-', 
                 color=color, linewidth=linewidth, alpha=alpha)
 
-def draw_aligned_shape(plt, points, color, midpoints=None, alpha=0.7, linewidth=0.5, tol=1e-6):
-    """Draw only horizontal or vertical segments between points in a path."""
-    for i in range(len(points) - 1):
-        x0, y0 = points[i]
-        x1, y1 = points[i + 1]
-        dx = x1 - x0
-        dy = y1 - y0
-        if abs(dx) < tol and abs(dy) < tol:
-            # Zero-length segment, skip
-            continue
-        elif abs(dx) < tol or abs(dy) < tol:
-            # Vertical or horizontal segment
-            plt.plot([x0, x1], [y0, y1], '-', color=color, linewidth=linewidth, alpha=1)
-            # Compute midpoint
-            xm = (x0 + x1) / 2
-            ym = (y0 + y1) / 2
-            # Store midpoint
-            if midpoints is not None:
-                midpoints.append((xm, ym))
+def _closure_flags(paths, should_close):
+    """Per-path closure flags, computing should_close_path only where the flag is None"""
+    from utils.myfuncs.shape_things import should_close_path
+    
+    if should_close is None:
+        return [should_close_path(points) for points in paths]
+    return [should_close_path(points) if flag is None else flag 
+            for points, flag in zip(paths, should_close)]
+
+def draw_shapes_batched(ax, paths, color, alpha=0.7, linewidth=0.5, should_close=None, **plot_kwargs):
+    """Draw many paths sharing one style as a single Line2D artist.
+    
+    The paths are joined into one vertex stream separated by NaN rows, which
+    matplotlib treats as pen-up. Paths are closed like draw_shape does, so each
+    path needs at least two points. should_close optionally gives each path's
+    precomputed closure flag (None entries are computed).
+    """
+    if not paths:
+        return None
+    
+    separator = np.full((1, 2), np.nan)
+    streams = []
+    for points, closes in zip(paths, _closure_flags(paths, should_close)):
+        streams.append(points[:, :2])
+        if closes:
+            streams.append(points[:1, :2])
+        streams.append(separator)
+    xy = np.concatenate(streams)
+    
+    return ax.plot(xy[:, 0], xy[:, 1], '-', color=color, linewidth=linewidth, alpha=alpha, 
+                   **plot_kwargs)
+
+def draw_shapes_collection(ax, paths, colors, alpha=0.7, linewidth=0.5, should_close=None, 
+                           **collection_kwargs):
+    """Draw many paths, each with its own color, as a single LineCollection.
+    
+    colors is one color per path (or a single color for all of them). Paths are
+    closed like draw_shape does, so each path needs at least two points.
+    should_close optionally gives each path's precomputed closure flag.
+    """
+    from matplotlib.collections import LineCollection
+    
+    if not paths:
+        return None
+    
+    segments = []
+    for points, closes in zip(paths, _closure_flags(paths, should_close)):
+        if closes:
+            segments.append(np.concatenate([points[:, :2], points[:1, :2]]))
         else:
-            # Diagonal segment, do not draw
+            segments.append(points[:, :2])
+    
+    collection = LineCollection(segments, colors=colors, linewidths=linewidth, alpha=alpha,
+                                **collection_kwargs)
+    ax.add_collection(collection, autolim=False)
+    return collection
+
+def _aligned_segments(points, tol=1e-6):
+    """(K, 2, 2) array of a path's horizontal and vertical segments, skipping zero-length ones"""
+    xy = np.asarray(points)[:, :2]
+    segments = np.stack([xy[:-1], xy[1:]], axis=1)
+    span = np.abs(segments[:, 1] - segments[:, 0])
+    flat_x = span[:, 0] < tol
+    flat_y = span[:, 1] < tol
+    return segments[(flat_x | flat_y) & ~(flat_x & flat_y)]
+
+def draw_aligned_shapes(ax, paths, colors, midpoints=None, linewidth=0.5, tol=1e-6):
+    """Draw only the horizontal and vertical segments of many paths as a single LineCollection.
+    colors gives one color per path. If midpoints is a list, the midpoint (x, y) of every drawn
+    segment is appended to it in path order."""
+    from matplotlib.collections import LineCollection
+    
+    segments, segment_colors = [], []
+    for points, color in zip(paths, colors):
+        if len(points) < 2:
             continue
+        aligned = _aligned_segments(points, tol)
+        segments.append(aligned)
+        segment_colors.extend([color] * len(aligned))
+    if not segment_colors:
+        return None
+    
+    segments = np.concatenate(segments)
+    if midpoints is not None:
+        midpoints.extend(map(tuple, segments.mean(axis=1).tolist()))
+    
+    collection = LineCollection(segments, colors=segment_colors, linewidths=linewidth, alpha=1)
+    ax.add_collection(collection, autolim=False)
+    return collection
+
+def draw_aligned_shape(plt, points, color, midpoints=None, alpha=0.7, linewidth=0.5, tol=1e-6):
+    """Draw only horizontal or vertical segments between points in a path (plt may be pyplot or an Axes).
+    Segments are drawn fully opaque whatever alpha is; see draw_aligned_shapes for many paths at once."""
+    ax = plt if hasattr(plt, 'add_collection') else plt.gca()
+    return draw_aligned_shapes(ax, [points], [color], midpoints=midpoints, linewidth=linewidth, tol=tol)
             
-def save_platform_figure(plt, output_path, dpi=300, bbox_inches='tight', pad_inches=0.1):
-    """Saves the figure to the specified path with standard settings"""
-    plt.savefig(output_path, dpi=dpi, bbox_inches=bbox_inches, pad_inches=pad_inches)
-    plt.close()
+def save_platform_figure(plt, output_path, dpi=300, bbox_inches='tight', pad_inches=0.1, close=True, **savefig_kwargs):
+    """Saves the figure to the specified path with standard settings.
+    Pass close=False to keep the figure open for reuse. Extra keyword arguments are passed
+    to savefig; PNGs are written at zlib level 3 unless pil_kwargs says otherwise, which is
+    much faster than Pillow's default level 6 for a slightly larger file."""
+    if str(output_path).lower().endswith('.png'):
+        savefig_kwargs.setdefault('pil_kwargs', {'compress_level': 3})
+    plt.savefig(output_path, dpi=dpi, bbox_inches=bbox_inches, pad_inches=pad_inches, **savefig_kwargs)
+    if close:
+        plt.close()
 
 def setup_standard_platform_view(title=None, figsize=(15, 15)):
     """Creates a standard platform view with boundary, grid, and reference lines"""
+    import matplotlib.pyplot as plt
     from utils.myfuncs.print_utils import add_platform_labels
     
     fig = setup_platform_figure(figsize)
@@ -1,11 +1,10 @@
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
+import os
+# Default to the non-interactive backend without overriding a backend the caller already chose
+os.environ.setdefault('MPLBACKEND', 'Agg')
 import numpy as np
 
 # Import platform configuration
 from config import PLATFORM_HALF_SIZE_MM
-import os
 
 def add_platform_labels(plt):
     """Add standard X and Y axis labels for platform views"""
@@ -29,6 +28,7 @@ def print_analysis_summary(platform_info, closed_paths_found, shape_types, outpu
         
 def create_unclosed_shapes_view(shapes_by_identifier, output_dir):
     """Create a platform view showing all unclosed shapes across all heights"""
+    import matplotlib.pyplot as plt
     try:
         plt.figure(figsize=(15, 15))
         
@@ -53,16 +53,24 @@ def create_unclosed_shapes_view(shapes_by_identifier, output_dir):
         # Draw all unclosed shapes
         shape_colors = plt.cm.viridis(np.linspace(0, 1, len(unclosed_shapes)))
         
+        point_xs, point_ys, point_colors = [], [], []
+        
         for shape_info, color in zip(unclosed_shapes, shape_colors):
             if shape_info['points'] is not None:
                 points = shape_info['points']
                 if shape_info['type'] == 'point':
-                    plt.plot(points[0, 0], points[0, 1], 'o', 
-                            color=color, markersize=2, alpha=0.7)
+                    point_xs.append(points[0, 0])
+                    point_ys.append(points[0, 1])
+                    point_colors.append(color)
                 else:
                     plt.plot(points[:, 0], points[:, 1], '-', 
                             color=color, linewidth=0.5, alpha=0.7)
         
+        # One scatter for all points instead of one Line2D per point
+        if point_xs:
+            plt.scatter(point_xs, point_ys, c=np.array(point_colors), s=4, 
+                       alpha=0.7, edgecolors='none')
+        
         plt.title(f'All Unclosed Shapes Platform View\n'
                  f'Total Unclosed Shapes: {len(unclosed_shapes)}')
         add_platform_labels(plt)
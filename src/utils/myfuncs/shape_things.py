@@ -1,11 +1,15 @@
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
-def should_close_path(points):
-    """Determine if a path should be closed based on endpoints and geometry"""
-    if len(points) < 3:
-        return False
-        
+# Points per tessellated circle ring, shared by circle_vertices and circle_vertices_batch
+CIRCLE_POINTS = 64
+
+
+def _should_close_path_numpy(points):
     # Calculate distance between start and end points
     start_point = points[0]
     end_point = points[-1]
@@ -19,6 +23,253 @@ def should_close_path(points):
     return gap < (total_length * 0.05)  # 5% threshold
 
 
+def _should_close_path_loop(points):
+    # Same test as _should_close_path_numpy, written as plain loops for numba
+    n, dims = points.shape
+    gap_sq = 0.0
+    for d in range(dims):
+        diff = points[n - 1, d] - points[0, d]
+        gap_sq += diff * diff
+    
+    total_length = 0.0
+    for i in range(1, n):
+        seg_sq = 0.0
+        for d in range(dims):
+            diff = points[i, d] - points[i - 1, d]
+            seg_sq += diff * diff
+        total_length += np.sqrt(seg_sq)
+    
+    return np.sqrt(gap_sq) < (total_length * 0.05)
+
+
+def _process_shapes_loop(verts, offsets):
+    # Per-shape closure test, validity and bounding box over a concatenated vertex buffer;
+    # shape i is verts[offsets[i]:offsets[i + 1]]. Plain loops so numba can compile them.
+    num_shapes = len(offsets) - 1
+    should_close = np.zeros(num_shapes, dtype=np.bool_)
+    has_valid = np.zeros(num_shapes, dtype=np.bool_)
+    bbox = np.full((num_shapes, 4), np.nan)
+    
+    for s in range(num_shapes):
+        start = offsets[s]
+        stop = offsets[s + 1]
+        if stop - start < 1:
+            continue
+        
+        x_min = x_max = verts[start, 0]
+        y_min = y_max = verts[start, 1]
+        total_length = 0.0
+        for i in range(start + 1, stop):
+            x = verts[i, 0]
+            y = verts[i, 1]
+            x_min = min(x_min, x)
+            x_max = max(x_max, x)
+            y_min = min(y_min, y)
+            y_max = max(y_max, y)
+            dx = x - verts[i - 1, 0]
+            dy = y - verts[i - 1, 1]
+            total_length += np.sqrt(dx * dx + dy * dy)
+        bbox[s, 0] = x_min
+        bbox[s, 1] = y_min
+        bbox[s, 2] = x_max
+        bbox[s, 3] = y_max
+        
+        if stop - start >= 3:
+            has_valid[s] = True
+            dx = verts[stop - 1, 0] - verts[start, 0]
+            dy = verts[stop - 1, 1] - verts[start, 1]
+            should_close[s] = np.sqrt(dx * dx + dy * dy) < (total_length * 0.05)
+    
+    return should_close, has_valid, bbox
+
+
+def _process_shapes_numpy(verts, offsets):
+    # Vectorized equivalent of _process_shapes_loop for when numba is not installed
+    verts = np.asarray(verts, dtype=np.float64)[:, :2]
+    offsets = np.asarray(offsets)
+    lengths = np.diff(offsets)
+    nonempty = lengths > 0
+    has_valid = lengths >= 3
+    
+    # Running arc length, so a shape's length is the difference at its end and start vertices
+    if len(verts) > 1:
+        seg_lengths = np.sqrt(np.sum(np.diff(verts, axis=0) ** 2, axis=1))
+    else:
+        seg_lengths = np.empty(0)
+    arc = np.concatenate([[0.0], np.cumsum(seg_lengths)])
+    first = np.where(nonempty, offsets[:-1], 0)
+    last = np.where(nonempty, offsets[1:] - 1, 0)
+    total_length = arc[last] - arc[first] if len(verts) else np.zeros(len(lengths))
+    
+    gap = np.sqrt(np.sum((verts[last] - verts[first]) ** 2, axis=1)) if len(verts) else np.zeros(len(lengths))
+    should_close = has_valid & (gap < total_length * 0.05)
+    
+    bbox = np.full((len(lengths), 4), np.nan)
+    if nonempty.any():
+        starts = offsets[:-1][nonempty]
+        bbox[nonempty, :2] = np.minimum.reduceat(verts, starts, axis=0)
+        bbox[nonempty, 2:] = np.maximum.reduceat(verts, starts, axis=0)
+    return should_close, has_valid, bbox
+
+
+def _simplify_mask_loop(points, tol):
+    # Douglas-Peucker keep mask with an explicit stack instead of recursion, so numba can
+    # compile it. A segment whose ends coincide (a ring) measures plain point distance.
+    n = points.shape[0]
+    keep = np.zeros(n, dtype=np.bool_)
+    keep[0] = True
+    keep[n - 1] = True
+    tol_sq = tol * tol
+    
+    stack = np.empty((n, 2), dtype=np.int64)
+    stack[0, 0] = 0
+    stack[0, 1] = n - 1
+    top = 1
+    while top > 0:
+        top -= 1
+        first = stack[top, 0]
+        last = stack[top, 1]
+        if last - first < 2:
+            continue
+        
+        ax = points[first, 0]
+        ay = points[first, 1]
+        dx = points[last, 0] - ax
+        dy = points[last, 1] - ay
+        seg_sq = dx * dx + dy * dy
+        
+        max_dist_sq = -1.0
+        farthest = first
+        for i in range(first + 1, last):
+            px = points[i, 0] - ax
+            py = points[i, 1] - ay
+            if seg_sq > 0.0:
+                cross = px * dy - py * dx
+                dist_sq = cross * cross / seg_sq
+            else:
+                dist_sq = px * px + py * py
+            if dist_sq > max_dist_sq:
+                max_dist_sq = dist_sq
+                farthest = i
+        
+        if max_dist_sq > tol_sq:
+            keep[farthest] = True
+            stack[top, 0] = first
+            stack[top, 1] = farthest
+            stack[top + 1, 0] = farthest
+            stack[top + 1, 1] = last
+            top += 2
+    
+    return keep
+
+
+def _simplify_mask_numpy(points, tol):
+    # Same Douglas-Peucker mask as _simplify_mask_loop, with each span's distances vectorized
+    points = np.asarray(points, dtype=np.float64)[:, :2]
+    n = len(points)
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, n - 1]] = True
+    tol_sq = tol * tol
+    
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        
+        rel = points[first + 1:last] - points[first]
+        d = points[last] - points[first]
+        seg_sq = d @ d
+        if seg_sq > 0.0:
+            dist_sq = (rel[:, 0] * d[1] - rel[:, 1] * d[0]) ** 2 / seg_sq
+        else:
+            dist_sq = np.sum(rel ** 2, axis=1)
+        
+        farthest = int(np.argmax(dist_sq))
+        if dist_sq[farthest] > tol_sq:
+            farthest += first + 1
+            keep[farthest] = True
+            stack.append((first, farthest))
+            stack.append((farthest, last))
+    
+    return keep
+
+
+def _circle_vertices(cx, cy, r, n):
+    theta = np.linspace(0.0, 2.0 * np.pi, n)
+    verts = np.empty((n, 2))
+    verts[:, 0] = cx + r * np.cos(theta)
+    verts[:, 1] = cy + r * np.sin(theta)
+    return verts
+
+
+if njit is not None:
+    _should_close_path_kernel = njit(cache=True)(_should_close_path_loop)
+    _circle_vertices = njit(cache=True)(_circle_vertices)
+    _process_shapes_kernel = njit(cache=True)(_process_shapes_loop)
+    _simplify_mask_kernel = njit(cache=True)(_simplify_mask_loop)
+else:
+    _should_close_path_kernel = _should_close_path_numpy
+    _process_shapes_kernel = _process_shapes_numpy
+    _simplify_mask_kernel = _simplify_mask_numpy
+
+
+def should_close_path(points):
+    """Determine if a path should be closed based on endpoints and geometry"""
+    if len(points) < 3:
+        return False
+    
+    points = np.asarray(points)
+    if points.ndim != 2 or points.dtype.kind != 'f':
+        return _should_close_path_numpy(points)
+    return bool(_should_close_path_kernel(points))
+
+
+def process_shapes(verts, offsets):
+    """
+    Closure test, validity and bounding box for many shapes in one call
+    
+    Args:
+        verts: (N, 2) vertex buffer holding every shape back to back
+        offsets: (M + 1,) offsets; shape i is verts[offsets[i]:offsets[i + 1]]
+        
+    Returns:
+        tuple: (should_close (M,) bool, same test as should_close_path; has_valid (M,) bool,
+        True for shapes with at least 3 points; bbox (M, 4) as x_min, y_min, x_max, y_max,
+        NaN for empty shapes)
+    """
+    verts = np.ascontiguousarray(verts)
+    if verts.dtype != np.float32:
+        verts = verts.astype(np.float64)
+    return _process_shapes_kernel(verts, np.asarray(offsets, dtype=np.int64))
+
+
+def simplify_path(points, tolerance):
+    """Drop vertices with Douglas-Peucker that lie within tolerance of the simplified polyline.
+    The first and last points are always kept; returns (K, 2) with K <= len(points)."""
+    points = np.asarray(points)
+    if len(points) < 3 or tolerance <= 0:
+        return points
+    
+    xy = np.ascontiguousarray(points[:, :2], dtype=np.float64)
+    return xy[_simplify_mask_kernel(xy, float(tolerance))]
+
+
+def circle_vertices(cx, cy, r, n=CIRCLE_POINTS):
+    """Return an (n, 2) array of points around a circle; the last point repeats the first"""
+    return _circle_vertices(float(cx), float(cy), float(r), int(n))
+
+
+def circle_vertices_batch(centers, radii, n=CIRCLE_POINTS):
+    """Tessellate many circles at once: (K, 2) centers and (K,) radii give a (K, n, 2) array,
+    each ring ending on its first point like circle_vertices"""
+    centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+    radii = np.asarray(radii, dtype=float).reshape(-1)
+    theta = np.linspace(0.0, 2.0 * np.pi, n)
+    unit = np.stack([np.cos(theta), np.sin(theta)], axis=-1)
+    return centers[:, None, :] + radii[:, None, None] * unit[None, :, :]
+
+
 def remove_colinear_and_small_segments(points, colinear_tolerance=1e-7, min_segment_length=0.1):
     cleaned = []
     cleaned.append(points[0])
@@ -1,7 +1,7 @@
 import os
+# Default to the non-interactive backend without overriding a backend the caller already chose
+os.environ.setdefault('MPLBACKEND', 'Agg')
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
 
 from utils.myfuncs.shape_things import should_close_path
@@ -37,6 +37,9 @@ def analyze_layer(clf_file, height, output_dir, clf_info, path_counts, shape_typ
         if file_key not in file_identifier_counts:
             file_identifier_counts[file_key] = {}
             
+        closed_paths_count = 0
+        # Point shapes are gathered here and drawn as one scatter after the loop
+        point_xs, point_ys = [], []
                 
         for shape in shapes:
             has_identifier = hasattr(shape, 'model') and hasattr(shape.model, 'id')
@@ -60,7 +63,8 @@ def analyze_layer(clf_file, height, output_dir, clf_info, path_counts, shape_typ
                 'height': height,
                 'file': clf_info['name'],
                 'folder': clf_info['folder'],
-                'is_closed': False
+                'is_closed': False,
+                'should_close': False  # should_close_path result, computed once here for the views
             }
             
             # Extract shape data and determine type
@@ -71,19 +75,23 @@ def analyze_layer(clf_file, height, output_dir, clf_info, path_counts, shape_typ
                     if len(points) == 1:
                         shape_info['type'] = 'point'
                         if draw_points:
-                            plt.plot(points[0, 0], points[0, 1], 'ro', markersize=2, alpha=0.5)
+                            point_xs.append(points[0, 0])
+                            point_ys.append(points[0, 1])
                     elif len(points) == 2:
                         shape_info['type'] = 'line'
                         if draw_lines:
                             plt.plot(points[:, 0], points[:, 1], 'g-', linewidth=0.5, alpha=0.5)
                     else:
                         shape_info['type'] = 'path'
-                        # Use draw_shape function for paths
-                        draw_shape(plt, points, 'b', linewidth=0.5, alpha=0.5)
-                        
                         # Check if path should be closed
-                        if should_close_path(points):
+                        should_close = should_close_path(points)
+                        shape_info['should_close'] = should_close
+                        if should_close:
                             shape_info['is_closed'] = True
+                            closed_paths_count += 1
+                        
+                        # Use draw_shape function for paths
+                        draw_shape(plt, points, 'b', linewidth=0.5, alpha=0.5, should_close=should_close)
             
             elif hasattr(shape, 'radius') and hasattr(shape, 'center'):
                 shape_info['type'] = 'circle'
@@ -191,6 +199,9 @@ def analyze_layer(clf_file, height, output_dir, clf_info, path_counts, shape_typ
                     if shape_info['is_closed']:
                         shapes_by_identifier['no_identifier']['closed_paths'] += 1
                         
+        if point_xs:
+            plt.scatter(point_xs, point_ys, c='r', s=4, alpha=0.5, edgecolors='none')
+                        
         image_path = None          
         if save_layer_partials:
             # Create figure
@@ -219,11 +230,6 @@ def analyze_layer(clf_file, height, output_dir, clf_info, path_counts, shape_typ
             
             image_path = os.path.join("layer_partials", filename)
         
-        # Count closed paths correctly
-        closed_paths_count = sum(1 for s in shapes 
-                               if (hasattr(s, 'points') and 
-                                   len(s.points) > 0 and 
-                                   should_close_path(s.points[0])))
         return {
             "height": height,
             "num_shapes": len(shapes),
@@ -1,1722 +1,2485 @@
-import os
-import sys
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend for web applications
-import matplotlib.pyplot as plt   
-import numpy as np   
-import json
-from matplotlib.patches import Polygon
-
-# Import platform configuration
-from config import PLATFORM_HALF_SIZE_MM, PLATFORM_SIZE_MM
-
-from utils.myfuncs.plotTools import (
-    setup_platform_figure,
-    setup_standard_platform_view,
-    draw_platform_boundary,
-    add_reference_lines,
-    set_platform_limits,
-    draw_shape,
-    draw_aligned_shape,
-    save_platform_figure
-)
-from utils.myfuncs.print_utils import add_platform_labels
-from utils.myfuncs.shape_things import should_close_path
-from utils.pyarcam.clfutil import CLFFile
-
-
-def create_combined_excluded_identifier_platform_view(excluded_shapes_by_identifier, output_dir):
-    """Create a combined platform view showing all excluded identifiers with unique colors"""
-    try:
-        # Skip the 'no_identifier' key if it exists
-        identifiers = [id for id in excluded_shapes_by_identifier.keys() if id != 'no_identifier']
-        
-        if not identifiers:
-            print("No excluded identifiers found for combined view")
-            return None
-            
-        # Generate a color for each identifier
-        colors = plt.cm.tab10(np.linspace(0, 1, len(identifiers)))
-        identifier_colors = dict(zip(identifiers, colors))
-        
-        # Create figure
-        setup_platform_figure()
-        
-        # Add standard platform elements
-        draw_platform_boundary(plt)
-        add_reference_lines(plt)
-        
-        total_shapes = 0
-        height_ranges = []
-        
-        # Plot each identifier with its assigned color
-        for identifier, color in identifier_colors.items():
-            shapes_data = excluded_shapes_by_identifier[identifier]
-            total_shapes += shapes_data['count']
-            height_ranges.append(shapes_data['height_range'])
-            
-            # Draw all shapes for this identifier
-            for shape_info in shapes_data['shapes']:
-                if shape_info['points'] is not None:
-                    points = shape_info['points']
-                    if shape_info['type'] == 'point':
-                        plt.plot(points[0, 0], points[0, 1], 'o', 
-                                color=color, markersize=2, alpha=0.7, 
-                                label=f'ID {identifier}' if identifier not in plt.gca().get_legend_handles_labels()[1] else "")
-                    else:
-                        draw_shape(plt, points, color)
-                        # Add label only once per identifier
-                        if identifier not in [t.get_text().split()[-1] for t in plt.gca().get_legend_handles_labels()[1]]:
-                            plt.plot([], [], color=color, label=f'ID {identifier}')
-                elif shape_info['type'] == 'circle':
-                    circle = plt.Circle(
-                        shape_info['center'], 
-                        shape_info['radius'], 
-                        color=color, 
-                        fill=False, 
-                        alpha=0.7
-                    )
-                    plt.gca().add_artist(circle)
-                    # Add label only once per identifier
-                    if identifier not in [t.get_text().split()[-1] for t in plt.gca().get_legend_handles_labels()[1]]:
-                        plt.plot([], [], color=color, label=f'ID {identifier}')
-        
-        # Calculate overall height range
-        if height_ranges:
-            min_height = min(hr[0] for hr in height_ranges)
-            max_height = max(hr[1] for hr in height_ranges)
-        else:
-            min_height = max_height = 0
-        
-        plt.title(f'Combined EXCLUDED Identifier Platform View\n'
-                 f'Total Identifiers: {len(identifiers)} | Total Shapes: {total_shapes}\n'
-                 f'Height Range: {min_height:.2f}mm to {max_height:.2f}mm')
-        add_platform_labels(plt)
-        set_platform_limits(plt)
-        
-        # Add legend
-        plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left', borderaxespad=0.)
-        
-        # Save to identifier_views directory
-        identifier_dir = os.path.join(output_dir, "identifier_views")
-        os.makedirs(identifier_dir, exist_ok=True)
-        filename = f'combined_excluded_identifier_platform_view.png'
-        output_path = os.path.join(identifier_dir, filename)
-        save_platform_figure(plt, output_path)
-        
-        print(f"Created combined excluded identifier view at: {output_path}")
-        return os.path.join("identifier_views", filename)
-        
-    except Exception as e:
-        print(f"Error creating combined excluded identifier platform view: {str(e)}")
-        return None
-
-
-def create_combined_identifier_platform_view(shapes_by_identifier, output_dir):
-    """Create a single platform view showing all identifiers with different colors"""
-    try:
-        # Create a standard platform view
-        setup_platform_figure()
-        
-        # Add standard platform elements
-        draw_platform_boundary(plt)
-        add_reference_lines(plt)
-        
-        # Skip the 'no_identifier' key if it exists
-        identifiers = [id for id in shapes_by_identifier.keys() if id != 'no_identifier']
-        
-        if not identifiers:
-            print("No identifiers found for combined view")
-            return None
-            
-        # Generate a color for each identifier
-        colors = plt.cm.tab10(np.linspace(0, 1, len(identifiers)))
-        identifier_colors = dict(zip(identifiers, colors))
-        
-        # Track statistics and collect all points for bounding box
-        total_shapes = 0
-        min_height = float('inf')
-        max_height = float('-inf')
-        all_points = []  # Collect all points for bounding box calculation
-        
-        # Plot each identifier with its assigned color
-        for identifier, color in identifier_colors.items():
-            shapes_data = shapes_by_identifier[identifier]
-            
-            # Update statistics
-            total_shapes += shapes_data['count']
-            min_height = min(min_height, shapes_data['height_range'][0])
-            max_height = max(max_height, shapes_data['height_range'][1])
-            
-            # Draw a sample shape for the legend
-            plt.plot([], [], color=color, label=f"ID: {identifier}")
-            
-            # Draw all shapes for this identifier
-            for shape_info in shapes_data['shapes']:
-                if shape_info['points'] is not None:
-                    points = shape_info['points']
-                    if shape_info['type'] == 'point':
-                        plt.plot(points[0, 0], points[0, 1], 'o', 
-                                color=color, markersize=2, alpha=0.7)
-                        # Add point to bounding box calculation
-                        all_points.extend([[points[0, 0], points[0, 1]]])
-                    else:
-                        draw_shape(plt, points, color)
-                        # Add all points to bounding box calculation
-                        if isinstance(points, np.ndarray):
-                            all_points.extend(points.tolist())
-                        else:
-                            all_points.extend(points)
-                elif shape_info['type'] == 'circle':
-                    circle = plt.Circle(
-                        shape_info['center'], 
-                        shape_info['radius'], 
-                        color=color, 
-                        fill=False, 
-                        alpha=0.7
-                    )
-                    plt.gca().add_artist(circle)
-                    # Add circle bounding box to calculation
-                    center = shape_info['center']
-                    radius = shape_info['radius']
-                    all_points.extend([
-                        [center[0] - radius, center[1] - radius],
-                        [center[0] + radius, center[1] + radius]
-                    ])
-        
-        # Calculate and draw bounding box
-        if all_points:
-            all_points = np.array(all_points)
-            bbox_min_x = np.min(all_points[:, 0])
-            bbox_max_x = np.max(all_points[:, 0])
-            bbox_min_y = np.min(all_points[:, 1])
-            bbox_max_y = np.max(all_points[:, 1])
-            
-            # Calculate dimensions
-            bbox_width = bbox_max_x - bbox_min_x
-            bbox_height = bbox_max_y - bbox_min_y
-            
-            # Draw bounding box rectangle
-            bbox_rect = plt.Rectangle((bbox_min_x, bbox_min_y), bbox_width, bbox_height,
-                                    linewidth=2, edgecolor='red', facecolor='none', 
-                                    linestyle='--', alpha=0.8)
-            plt.gca().add_patch(bbox_rect)
-            
-            # Add measurement text annotations
-            # Width annotation (bottom of bbox)
-            plt.annotate(f'Width: {bbox_width:.2f}mm', 
-                        xy=((bbox_min_x + bbox_max_x) / 2, bbox_min_y - 5),
-                        ha='center', va='top', fontsize=10, fontweight='bold',
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.8))
-            
-            # Height annotation (left of bbox)
-            plt.annotate(f'Height: {bbox_height:.2f}mm', 
-                        xy=(bbox_min_x - 5, (bbox_min_y + bbox_max_y) / 2),
-                        ha='right', va='center', fontsize=10, fontweight='bold', rotation=90,
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.8))
-            
-            # Corner coordinates annotation (top-right of bbox)
-            plt.annotate(f'Min: ({bbox_min_x:.1f}, {bbox_min_y:.1f})\nMax: ({bbox_max_x:.1f}, {bbox_max_y:.1f})', 
-                        xy=(bbox_max_x + 5, bbox_max_y),
-                        ha='left', va='top', fontsize=9,
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor='yellow', alpha=0.7))
-            
-            # Update title to include bounding box info
-            title_text = (f'Combined Identifier Platform View\n'
-                         f'Total Identifiers: {len(identifiers)} | Total Shapes: {total_shapes}\n'
-                         f'Height Range: {min_height:.2f}mm to {max_height:.2f}mm\n'
-                         f'Bounding Box: {bbox_width:.2f}mm × {bbox_height:.2f}mm')
-        else:
-            title_text = (f'Combined Identifier Platform View\n'
-                         f'Total Identifiers: {len(identifiers)} | Total Shapes: {total_shapes}\n'
-                         f'Height Range: {min_height:.2f}mm to {max_height:.2f}mm')
-        
-        plt.title(title_text)
-        add_platform_labels(plt)
-        set_platform_limits(plt)
-        
-        # Add a legend for the identifiers
-        plt.legend(loc='upper left', bbox_to_anchor=(1.05, 1), borderaxespad=0.)
-        
-        # Save the plot
-        identifier_dir = os.path.join(output_dir, "identifier_views")
-        os.makedirs(identifier_dir, exist_ok=True)
-        filename = f'combined_identifiers_platform_view.png'
-        output_path = os.path.join(identifier_dir, filename)
-        save_platform_figure(plt, output_path)
-        
-        # Create transparent version with just the paths
-        create_transparent_paths_view(shapes_by_identifier, output_dir)
-        
-        return os.path.join("identifier_views", filename)
-        
-    except Exception as e:
-        print(f"Error creating combined identifier platform view: {str(e)}")
-        return None
-
-
-def create_non_identifier_platform_view(non_id_shapes, output_dir):
-    """Create a platform view showing all shapes that don't have identifiers"""
-    try:        
-        # Create a standard platform view with common elements
-        title = f'Non-Identifier Shapes Platform View\nTotal Shapes: {len(non_id_shapes)}'
-        setup_standard_platform_view(title)
-        
-        # Draw all shapes without identifiers
-        shape_colors = plt.cm.viridis(np.linspace(0, 1, len(non_id_shapes)))
-        
-        for shape_info, color in zip(non_id_shapes, shape_colors):
-            if shape_info['points'] is not None:
-                points = shape_info['points']
-                if shape_info['type'] == 'point':
-                    plt.plot(points[0, 0], points[0, 1], 'o', 
-                            color=color, markersize=2, alpha=0.7)
-                else:
-                    draw_shape(plt, points, color)
-            elif shape_info['type'] == 'circle':
-                circle = plt.Circle(
-                    shape_info['center'], 
-                    shape_info['radius'], 
-                    color=color, 
-                    fill=False, 
-                    alpha=0.7
-                )
-                plt.gca().add_artist(circle)
-        
-        # Save the plot
-        non_id_dir = os.path.join(output_dir, "non_identifier_views")
-        os.makedirs(non_id_dir, exist_ok=True)
-        filename = f'non_identifier_platform_view.png'
-        output_path = os.path.join(non_id_dir, filename)
-        save_platform_figure(plt, output_path)
-        
-        return os.path.join("non_identifier_views", filename)
-        
-    except Exception as e:
-        print(f"Error creating non-identifier platform view: {str(e)}")
-        return None
-
-
-def create_identifier_platform_view(identifier, shapes_data, output_dir):
-    """Create a platform view showing all shapes for a specific identifier"""
-    try:        
-        # Create figure
-        setup_platform_figure()
-        
-        # Add standard platform elements
-        draw_platform_boundary(plt)
-        add_reference_lines(plt)
-        
-        # Draw all shapes for this identifier
-        height_range = shapes_data['height_range']
-        total_shapes = shapes_data['count']
-        
-        shape_colors = plt.cm.viridis(np.linspace(0, 1, len(shapes_data['shapes'])))
-        
-        for shape_info, color in zip(shapes_data['shapes'], shape_colors):
-            if shape_info['points'] is not None:
-                points = shape_info['points']
-                if shape_info['type'] == 'point':
-                    plt.plot(points[0, 0], points[0, 1], 'o', 
-                            color=color, markersize=2, alpha=0.7)
-                else:
-                    draw_shape(plt, points, color)
-            elif shape_info['type'] == 'circle':
-                circle = plt.Circle(
-                    shape_info['center'], 
-                    shape_info['radius'], 
-                    color=color, 
-                    fill=False, 
-                    alpha=0.7
-                )
-                plt.gca().add_artist(circle)
-        
-        plt.title(f'Identifier {identifier} Platform View\n'
-                 f'Total Shapes: {total_shapes}\n'
-                 f'Height Range: {height_range[0]:.2f}mm to {height_range[1]:.2f}mm')
-        add_platform_labels(plt)
-        set_platform_limits(plt)
-        
-        identifier_dir = os.path.join(output_dir, "identifier_views")
-        os.makedirs(identifier_dir, exist_ok=True)
-        filename = f'identifier_{identifier}_platform_view.png'
-        output_path = os.path.join(identifier_dir, filename)
-        save_platform_figure(plt, output_path)
-        
-        return os.path.join("identifier_views", filename)
-        
-    except Exception as e:
-        print(f"Error creating identifier platform view for ID {identifier}: {str(e)}")
-        return None
-
-
-def create_platform_composite_with_folders(clf_files, output_dir, height=1.0, fill_closed=False, create_transparent_png=False):
-    """Create a composite view with unique colors per folder and a legend"""    
-    # Create figure
-    setup_platform_figure()
-    
-    # Get unique folders and assign colors using a colormap
-    folders = sorted(list(set(clf_info['folder'] for clf_info in clf_files)))
-    colors = plt.cm.tab20(np.linspace(0, 1, len(folders)))  # Use tab20 for distinct colors
-    folder_colors = dict(zip(folders, colors))
-    
-    # Add standard platform elements
-    draw_platform_boundary(plt)
-    add_reference_lines(plt)
-    
-    # Track which folders we've seen for legend
-    folders_seen = set()
-    
-    # Collect all shapes to reuse in transparent version
-    all_shapes = []
-    
-    for clf_info in clf_files:
-        try:
-            part = CLFFile(clf_info['path'])
-            if not hasattr(part, 'box'):
-                continue
-                
-            layer = part.find(height)
-            if layer is None:
-                continue
-                
-            folder = clf_info['folder']
-            color = folder_colors[folder]
-            
-            if hasattr(layer, 'shapes'):
-                for shape in layer.shapes:
-                    if hasattr(shape, 'points'):
-                        points = shape.points[0]
-                        if isinstance(points, np.ndarray) and points.shape[1] >= 2:
-                            # Store shape data for transparent version
-                            all_shapes.append({
-                                'points': points.copy(),
-                                'color': color,
-                                'folder': folder,
-                                'should_close': should_close_path(points)
-                            })
-                            
-                            # Draw shape with folder's color
-                            if fill_closed and should_close_path(points):
-                                polygon = Polygon(points, 
-                                               facecolor=color, 
-                                               edgecolor=color, 
-                                               alpha=0.5)
-                                plt.gca().add_patch(polygon)
-                            else:
-                                draw_shape(plt, points, color)
-                                
-                            # Add to legend (only once per folder)
-                            if folder not in folders_seen:
-                                plt.plot([], [], color=color, label=folder)
-                                folders_seen.add(folder)
-            
-        except Exception as e:
-            print(f"Error processing {clf_info['name']} for platform view: {str(e)}")
-    
-    plt.title(f'Platform Composite View at Height {height}mm')
-    add_platform_labels(plt)
-    set_platform_limits(plt)
-    
-    # Create legend with folder names
-    plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left', borderaxespad=0.)
-    
-    filename = f'platform_composite_folders_{height}mm.png'
-    output_path = os.path.join(output_dir, "composite_platforms", filename)
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    save_platform_figure(plt, output_path)
-    
-    # Create transparent version only if enabled
-    if create_transparent_png:
-        create_transparent_composite_folders(all_shapes, output_dir, height, fill_closed)
-    
-    return os.path.join("composite_platforms", filename)
-
-
-def create_transparent_composite_folders(shapes, output_dir, height, fill_closed=False):
-    """Create a transparent composite view with paths from all folders without chart elements"""
-    try:
-        # Create figure with transparent background
-        fig = plt.figure(figsize=(15, 15), facecolor="none")
-        ax = plt.gca()
-        ax.set_position([0, 0, 1, 1])  # Remove all margins
-        ax.patch.set_alpha(0)  # Make axes background transparent
-        
-        # Set platform limits
-        half_size = PLATFORM_HALF_SIZE_MM
-        plt.xlim(-half_size, half_size)
-        plt.ylim(-half_size, half_size)
-        
-        # Turn off all chart elements
-        ax.set_xticks([])
-        ax.set_yticks([])
-        ax.set_xticklabels([])
-        ax.set_yticklabels([])
-        plt.axis('off')
-        
-        # Draw all shapes
-        for shape in shapes:
-            points = shape['points']
-            color = shape['color']
-            
-            if fill_closed and shape['should_close']:
-                polygon = Polygon(points, 
-                              facecolor=color, 
-                              edgecolor=color, 
-                              alpha=0.5)
-                plt.gca().add_patch(polygon)
-            else:
-                draw_shape(plt, points, color)
-        
-        plt.axis('equal')  # Ensure perfect square
-        
-        # Save the transparent plot
-        filename = f'transparent_composite_folders_{height}mm.png'
-        output_path = os.path.join(output_dir, "composite_platforms", filename)
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        save_platform_figure(plt, output_path, pad_inches=0, bbox_inches='tight')
-        plt.close()
-        
-        print(f"Created transparent composite folders view at: {output_path}")
-        return os.path.join("composite_platforms", filename)
-        
-    except Exception as e:
-        print(f"Error creating transparent composite folders view: {str(e)}")
-        return None
-
-
-def create_platform_composite(clf_files, output_dir, height=1.0, fill_closed=False):
-    """Create a composite view of all shapes at specified height"""
-
-    # Create a standard platform view with title
-    title = f'Platform Composite View at Height {height}mm'
-    setup_standard_platform_view(title)
-    
-    colors = {
-        'Part.clf': 'blue',
-        'WaferSupport.clf': 'red',
-        'Net.clf': 'green'
-    }
-    
-    shapes_found = False
-    for clf_info in clf_files:
-        try:
-            part = CLFFile(clf_info['path'])
-            if not hasattr(part, 'box'):
-                continue
-                
-            layer = part.find(height)
-            if layer is None:
-                continue
-                
-            if hasattr(layer, 'shapes'):
-                for shape in layer.shapes:
-                    if hasattr(shape, 'points'):
-                        points = shape.points[0]
-                        if isinstance(points, np.ndarray) and points.shape[1] >= 2:
-                            color = colors.get(clf_info['name'], 'gray')
-                            
-                            # Check if shape should be closed
-                            if fill_closed and should_close_path(points):
-                                # Create polygon for filled shape
-                                polygon = Polygon(points, facecolor='black', edgecolor=color, alpha=0.5)
-                                plt.gca().add_patch(polygon)
-                            else:
-                                # Draw unfilled shape
-                                draw_shape(plt, points, color)
-                                
-                            if not shapes_found:
-                                plt.plot([], [], color=color, label=clf_info['name'])
-                                shapes_found = True
-            
-        except Exception as e:
-            print(f"Error processing {clf_info['name']} for platform view: {str(e)}")
-    
-    # Add legend
-    handles, labels = plt.gca().get_legend_handles_labels()
-    by_label = dict(zip(labels, handles))
-    plt.legend(by_label.values(), by_label.keys())
-    
-    # Save figure
-    filename = f'platform_composite_{height}mm.png'
-    output_path = os.path.join(output_dir, "composite_platforms", filename)
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    save_platform_figure(plt, output_path)
-    
-    return os.path.join("composite_platforms", filename)
-
-
-def process_layer_data(clf_info, height, colors):
-    """Helper function to process a single layer and extract shape data.
-    Used by create_clean_platform for parallel processing.
-    Now includes hole detection using Shape[1] Path[0] logic exactly as in baseline_visualization_test_v2.py."""
-    shape_data_list = []
-    
-    try:
-        part = CLFFile(clf_info['path'])
-        if not hasattr(part, 'box'):
-            return shape_data_list
-            
-        layer = part.find(height)
-        if layer is None:
-            return shape_data_list
-            
-        if hasattr(layer, 'shapes'):
-            shapes = list(layer.shapes)
-            print(f"    Found {len(shapes)} shapes in layer at {height}mm for {clf_info['name']}")
-            
-            # Check if this folder can contain holes (must contain "Skin" in folder name)
-            folder_name = clf_info['folder']
-            can_have_holes = 'Skin' in folder_name
-            
-            # Process each shape in the layer using the exact logic from baseline_visualization_test_v2.py
-            for i, shape in enumerate(shapes):
-                color = colors.get(clf_info['name'], 'gray')
-                shape_identifier = None
-                if hasattr(shape, 'model') and hasattr(shape.model, 'id'):
-                    shape_identifier = shape.model.id
-                    
-                if hasattr(shape, 'points') and shape.points:
-                    # Process each path in the shape
-                    for path_idx, points in enumerate(shape.points):
-                        if isinstance(points, np.ndarray) and points.shape[0] >= 3 and points.shape[1] >= 2:
-                            should_close = False
-                            try:
-                                should_close = should_close_path(points)
-                                if hasattr(should_close, 'item'):
-                                    should_close = should_close.item()
-                            except Exception as e:
-                                print(f"Error in should_close_path for {clf_info['name']}: {str(e)}")
-                                should_close = False
-                            
-                            # Create unique identifier for this path
-                            path_id = f"{shape_identifier}_path_{path_idx}" if shape_identifier else f"shape_{i}_path_{path_idx}"
-                            
-                            # Determine if this path is a hole using exact logic from baseline_visualization_test_v2.py:
-                            # Holes are Shape[1] Path[0] (second shape, first path) in files with at least 2 shapes
-                            # AND the folder must contain "Skin"
-                            is_hole = (i == 1 and path_idx == 0 and len(shapes) >= 2 and can_have_holes)
-                            
-                            if is_hole:
-                                print(f"  Found hole: Shape[1] Path[0] with {len(points)} points in {folder_name}")
-                            
-                            # Create shape data for this path
-                            shape_data = {
-                                'type': 'path',
-                                'shape_type': 'interior' if is_hole else 'exterior',
-                                'points': points.tolist(),
-                                'color': color,
-                                'clf_name': clf_info['name'],
-                                'clf_folder': clf_info['folder'],
-                                'fill_closed': True,  # Will be updated by main function
-                                'should_close': should_close,
-                                'identifier': path_id,
-                                'parent_shape_id': f"{shape_identifier}_path_0" if is_hole else None,
-                                'parent_shape_index': 0 if is_hole else None,  # Parent is Shape[0]
-                                'is_hole': is_hole,
-                                'path_index': path_idx,
-                                'shape_index': i,
-                                'total_paths_in_shape': len(shape.points)
-                            }
-                            shape_data_list.append(shape_data)
-                        
-                elif hasattr(shape, 'radius') and hasattr(shape, 'center'):
-                    # Handle circles (circles cannot be holes in this logic)
-                    shape_data = {
-                        'type': 'circle',
-                        'shape_type': 'exterior',  # Circles are always exterior
-                        'center': shape.center.tolist(),
-                        'radius': shape.radius,
-                        'color': color,
-                        'clf_name': clf_info['name'],
-                        'clf_folder': clf_info['folder'],
-                        'fill_closed': True,
-                        'identifier': shape_identifier,
-                        'parent_shape_id': None,
-                        'is_hole': False,
-                        'shape_index': i,
-                        'total_paths_in_shape': 1
-                    }
-                    shape_data_list.append(shape_data)
-            
-            # Count holes found using the exact same logic
-            holes_found = sum(1 for shape in shape_data_list if shape.get('is_hole', False))
-            print(f"  Processed {len(shapes)} shapes, found {holes_found} holes in {clf_info['name']}")
-                        
-    except Exception as e:
-        print(f"Error processing {clf_info['name']} at height {height}mm: {str(e)}")
-        import traceback
-        traceback.print_exc()
-    
-    return shape_data_list
-
-
-def is_shape_inside_shape(inner_points, outer_points):
-    """
-    Check if inner_points shape is geometrically contained within outer_points shape
-    
-    Args:
-        inner_points: numpy array or list of points for the inner shape
-        outer_points: numpy array or list of points for the outer shape
-        
-    Returns:
-        bool: True if inner shape is inside outer shape
-    """
-    try:
-        import numpy as np
-        from matplotlib.path import Path
-        
-        # Convert to numpy arrays if they're lists
-        if isinstance(inner_points, list):
-            inner_points = np.array(inner_points)
-        if isinstance(outer_points, list):
-            outer_points = np.array(outer_points)
-        
-        # Ensure we have valid 2D arrays
-        if inner_points.ndim != 2 or outer_points.ndim != 2:
-            return False
-        if inner_points.shape[1] != 2 or outer_points.shape[1] != 2:
-            return False
-        if len(inner_points) == 0 or len(outer_points) == 0:
-            return False
-        
-        # Create a path from the outer shape
-        outer_path = Path(outer_points)
-        
-        # Check if all points of the inner shape are inside the outer path
-        # We'll check a few sample points to be efficient
-        num_samples = min(10, len(inner_points))
-        if num_samples <= 1:
-            sample_points = inner_points
-        else:
-            sample_indices = np.linspace(0, len(inner_points)-1, num_samples, dtype=int)
-            sample_points = inner_points[sample_indices]
-        
-        # All sample points should be inside (allowing for edge cases)
-        inside_checks = outer_path.contains_points(sample_points)
-        
-        # Return True if most points are inside (allowing for edge cases)
-        return np.sum(inside_checks) >= len(inside_checks) * 0.8
-        
-    except Exception as e:
-        print(f"Error in geometric containment check: {e}")
-        return False
-
-
-def create_transparent_paths_view(shapes_by_identifier, output_dir):
-    """Create a transparent PNG with just the path data from all identifiers, without any chart elements."""
-    try:
-        # Skip the 'no_identifier' key if it exists
-        identifiers = [id for id in shapes_by_identifier.keys() if id != 'no_identifier']
-        
-        if not identifiers:
-            print("No identifiers found for transparent paths view")
-            return None
-            
-        # Generate a color for each identifier
-        colors = plt.cm.tab10(np.linspace(0, 1, len(identifiers)))
-        identifier_colors = dict(zip(identifiers, colors))
-        
-        # Create figure with transparent background
-        fig = plt.figure(figsize=(15, 15), facecolor="none")
-        ax = plt.gca()
-        ax.set_position([0, 0, 1, 1])  # Remove all margins
-        ax.patch.set_alpha(0)  # Make axes background transparent
-        
-        # Set platform limits
-        half_size = PLATFORM_HALF_SIZE_MM
-        plt.xlim(-half_size, half_size)
-        plt.ylim(-half_size, half_size)
-        
-        # Turn off all chart elements
-        ax.set_xticks([])
-        ax.set_yticks([])
-        ax.set_xticklabels([])
-        ax.set_yticklabels([])
-        plt.axis('off')
-        
-        # Plot each identifier with its assigned color
-        for identifier, color in identifier_colors.items():
-            shapes_data = shapes_by_identifier[identifier]
-            
-            # Draw all shapes for this identifier
-            for shape_info in shapes_data['shapes']:
-                if shape_info['points'] is not None:
-                    points = shape_info['points']
-                    if shape_info['type'] == 'point':
-                        plt.plot(points[0, 0], points[0, 1], 'o', 
-                                color=color, markersize=2, alpha=0.7)
-                    else:
-                        draw_shape(plt, points, color)
-                elif shape_info['type'] == 'circle':
-                    circle = plt.Circle(
-                        shape_info['center'], 
-                        shape_info['radius'], 
-                        color=color, 
-                        fill=False, 
-                        alpha=0.7
-                    )
-                    plt.gca().add_artist(circle)
-        
-        plt.axis('equal')  # Ensure perfect square
-        
-        # Save the transparent plot
-        identifier_dir = os.path.join(output_dir, "identifier_views")
-        os.makedirs(identifier_dir, exist_ok=True)
-        filename = f'transparent_all_pathdata.png'
-        output_path = os.path.join(identifier_dir, filename)
-        save_platform_figure(plt, output_path, pad_inches=0, bbox_inches='tight')
-        plt.close()
-        
-        # ALSO create a 2100x2100 version
-        create_transparent_paths_view_2100px(shapes_by_identifier, output_dir)
-        
-        print(f"Created transparent paths view at: {output_path}")
-        return os.path.join("identifier_views", filename)
-        
-    except Exception as e:
-        print(f"Error creating transparent paths view: {str(e)}")
-        return None
-        
-
-def create_transparent_paths_view_2100px(shapes_by_identifier, output_dir):
-    """Create a 2100x2100 transparent PNG with just the path data from all identifiers, without chart elements."""
-    try:
-        print(f"\n=== DEBUGGING create_transparent_paths_view_2100px ===")
-        
-        # Debug: Show all keys in shapes_by_identifier
-        all_keys = list(shapes_by_identifier.keys())
-        print(f"All keys in shapes_by_identifier: {all_keys}")
-        
-        # Check if 'no_identifier' exists and what it contains
-        if 'no_identifier' in shapes_by_identifier:
-            no_id_data = shapes_by_identifier['no_identifier']
-            print(f"'no_identifier' contains {no_id_data.get('count', 0)} shapes")
-            print(f"'no_identifier' height range: {no_id_data.get('height_range', 'unknown')}")
-        else:
-            print("'no_identifier' key not found in data")
-        
-        # Skip the 'no_identifier' key if it exists
-        identifiers = [id for id in shapes_by_identifier.keys() if id != 'no_identifier']
-        print(f"Identifiers after filtering 'no_identifier': {identifiers}")
-        
-        # ALSO track shapes without identifiers
-        no_identifier_shapes = shapes_by_identifier.get('no_identifier', {}).get('shapes', [])
-        print(f"Number of shapes without identifiers: {len(no_identifier_shapes)}")
-        
-        if not identifiers:
-            print("No identifiers found for 2500px transparent paths view")
-            # But let's still check if we should draw 'no_identifier' shapes
-            if no_identifier_shapes:
-                print(f"WARNING: Found {len(no_identifier_shapes)} shapes without identifiers that are being excluded!")
-            return None
-            
-        # Generate a color for each identifier
-        colors = plt.cm.tab10(np.linspace(0, 1, len(identifiers)))
-        identifier_colors = dict(zip(identifiers, colors))
-        print(f"Generated colors for {len(identifiers)} identifiers")
-        
-        # Create figure with transparent background - size adjusted for 2100px output  
-        # 7.0 inches * 300 DPI = 2100px (for 210mm platform)
-        fig = plt.figure(figsize=(7.0, 7.0), facecolor="none")
-        ax = plt.gca()
-        ax.set_position([0, 0, 1, 1])  # Remove all margins
-        ax.patch.set_alpha(0)  # Make axes background transparent
-        
-        # Set platform limits for 210mm x 210mm platform
-        half_size = PLATFORM_HALF_SIZE_MM
-        plt.xlim(-half_size, half_size)
-        plt.ylim(-half_size, half_size)
-        
-        # Turn off all chart elements
-        ax.set_xticks([])
-        ax.set_yticks([])
-        ax.set_xticklabels([])
-        ax.set_yticklabels([])
-        plt.axis('off')
-        
-        # Tracking variables
-        total_shapes_processed = 0
-        total_paths_drawn = 0
-        total_circles_drawn = 0
-        shapes_with_null_points = 0
-        point_type_shapes = 0
-        other_type_shapes = 0
-        
-        # Plot each identifier with its assigned color
-        for identifier, color in identifier_colors.items():
-            shapes_data = shapes_by_identifier[identifier]
-            print(f"\n--- Processing identifier: {identifier} ---")
-            print(f"  Shapes data keys: {shapes_data.keys()}")
-            print(f"  Number of shapes: {shapes_data.get('count', 'unknown')}")
-            
-            height_range = shapes_data.get('height_range', [0, 0])
-            print(f"  Height range: {height_range[0]:.2f} to {height_range[1]:.2f} mm")
-            
-            # Check if this identifier covers the problematic 141.3mm height
-            if height_range[1] >= 141.0:
-                print(f"  *** This identifier SHOULD include shapes around 141.3mm! ***")
-            
-            shapes_list = shapes_data.get('shapes', [])
-            print(f"  Actual shapes list length: {len(shapes_list)}")
-            
-            # Sample a few shapes to show their heights
-            if len(shapes_list) > 0:
-                print(f"  Sample shape heights:")
-                for i in range(min(3, len(shapes_list))):
-                    shape_height = shapes_list[i].get('height', 'unknown')
-                    print(f"    Shape {i}: height = {shape_height}")
-            
-            identifier_paths_drawn = 0
-            identifier_circles_drawn = 0
-            identifier_null_points = 0
-            identifier_point_types = 0
-            identifier_other_types = 0
-            
-            # Draw all shapes for this identifier
-            for i, shape_info in enumerate(shapes_list):
-                total_shapes_processed += 1
-                
-                # Debug each shape
-                shape_type = shape_info.get('type', 'unknown')
-                has_points = shape_info.get('points') is not None
-                
-                print(f"    Shape {i}: type='{shape_type}', has_points={has_points}")
-                
-                if shape_info.get('points') is not None:
-                    points = shape_info['points']
-                    print(f"      Points shape: {np.array(points).shape if isinstance(points, (list, np.ndarray)) else 'not array-like'}")
-                    
-                    if shape_info.get('type') == 'point':
-                        print(f"      Drawing point at: {points[0] if len(points) > 0 else 'no points'}")
-                        plt.plot(points[0, 0], points[0, 1], 'o', 
-                                color=color, markersize=2, alpha=0.7)
-                        point_type_shapes += 1
-                        identifier_point_types += 1
-                    else:
-                        print(f"      Drawing path with {len(points) if hasattr(points, '__len__') else 'unknown'} points")
-                        draw_shape(plt, points, color)
-                        total_paths_drawn += 1
-                        identifier_paths_drawn += 1
-                        other_type_shapes += 1
-                        identifier_other_types += 1
-                        
-                elif shape_info.get('type') == 'circle':
-                    center = shape_info.get('center', 'unknown')
-                    radius = shape_info.get('radius', 'unknown')
-                    print(f"      Drawing circle at center={center}, radius={radius}")
-                    circle = plt.Circle(
-                        shape_info['center'], 
-                        shape_info['radius'], 
-                        color=color, 
-                        fill=False, 
-                        alpha=0.7
-                    )
-                    plt.gca().add_artist(circle)
-                    total_circles_drawn += 1
-                    identifier_circles_drawn += 1
-                else:
-                    print(f"      SKIPPED: No points and not a circle")
-                    shapes_with_null_points += 1
-                    identifier_null_points += 1
-            
-            print(f"  Identifier {identifier} summary:")
-            print(f"    Paths drawn: {identifier_paths_drawn}")
-            print(f"    Circles drawn: {identifier_circles_drawn}")
-            print(f"    Point types: {identifier_point_types}")
-            print(f"    Other types: {identifier_other_types}")
-            print(f"    Null points: {identifier_null_points}")
-        
-        print(f"\n=== FINAL SUMMARY ===")
-        print(f"Total shapes processed: {total_shapes_processed}")
-        print(f"Total paths drawn: {total_paths_drawn}")
-        print(f"Total circles drawn: {total_circles_drawn}")
-        print(f"Point type shapes: {point_type_shapes}")
-        print(f"Other type shapes: {other_type_shapes}")
-        print(f"Shapes with null points (skipped): {shapes_with_null_points}")
-        print(f"Shapes without identifiers (excluded): {len(no_identifier_shapes)}")
-        
-        # Show details of excluded shapes
-        if no_identifier_shapes:
-            print(f"\n=== EXCLUDED SHAPES WITHOUT IDENTIFIERS ===")
-            for i, shape_info in enumerate(no_identifier_shapes[:5]):  # Show first 5
-                shape_type = shape_info.get('type', 'unknown')
-                has_points = shape_info.get('points') is not None
-                print(f"  Excluded shape {i}: type='{shape_type}', has_points={has_points}")
-            if len(no_identifier_shapes) > 5:
-                print(f"  ... and {len(no_identifier_shapes) - 5} more excluded shapes")
-        print(f"======================\n")
-        
-        plt.axis('equal')  # Ensure perfect square
-        
-        # Save the transparent plot
-        identifier_dir = os.path.join(output_dir, "identifier_views")
-        os.makedirs(identifier_dir, exist_ok=True)
-        filename = f'transparent_all_pathdata_{PLATFORM_SIZE_MM}mmx{PLATFORM_SIZE_MM}mm_2100px.png'
-        output_path = os.path.join(identifier_dir, filename)
-        save_platform_figure(plt, output_path, pad_inches=0, bbox_inches='tight')
-        plt.close()
-        
-        # ALSO create version that includes 'no_identifier' shapes for comparison
-        create_transparent_paths_view_2100px_including_no_id(shapes_by_identifier, output_dir)
-        
-        print(f"Created 2100px transparent paths view at: {output_path}")
-        return os.path.join("identifier_views", filename)
-        
-    except Exception as e:
-        print(f"Error creating 2500px transparent paths view: {str(e)}")
-        return None
-
-
-def create_transparent_paths_view_2100px_including_no_id(shapes_by_identifier, output_dir):
-    """Create a 2100x2100 transparent PNG with path data from ALL shapes, including those without identifiers."""
-    try:
-        print(f"\n=== DEBUGGING create_transparent_paths_view_2100px_including_no_id ===")
-        
-        # Get ALL keys including 'no_identifier'
-        all_keys = list(shapes_by_identifier.keys())
-        print(f"All keys in shapes_by_identifier: {all_keys}")
-        
-        # Process ALL identifiers (including 'no_identifier')
-        identifiers = list(shapes_by_identifier.keys())
-        print(f"Processing ALL identifiers: {identifiers}")
-        
-        if not identifiers:
-            print("No identifiers found at all")
-            return None
-            
-        # Generate a color for each identifier (including special color for no_identifier)
-        colors = plt.cm.tab10(np.linspace(0, 1, len(identifiers)))
-        identifier_colors = dict(zip(identifiers, colors))
-        
-        # Use a distinct color for 'no_identifier' shapes if present
-        if 'no_identifier' in identifier_colors:
-            identifier_colors['no_identifier'] = 'gray'  # Use gray for shapes without IDs
-        
-        print(f"Generated colors for {len(identifiers)} identifiers")
-        
-        # Create figure with transparent background - size adjusted for 2100px output  
-        fig = plt.figure(figsize=(7.0, 7.0), facecolor="none")
-        ax = plt.gca()
-        ax.set_position([0, 0, 1, 1])  # Remove all margins
-        ax.patch.set_alpha(0)  # Make axes background transparent
-        
-        # Set platform limits for 210mm x 210mm platform
-        half_size = PLATFORM_HALF_SIZE_MM
-        plt.xlim(-half_size, half_size)
-        plt.ylim(-half_size, half_size)
-        
-        # Turn off all chart elements
-        ax.set_xticks([])
-        ax.set_yticks([])
-        ax.set_xticklabels([])
-        ax.set_yticklabels([])
-        plt.axis('off')
-        
-        # Tracking variables
-        total_shapes_processed = 0
-        total_paths_drawn = 0
-        total_circles_drawn = 0
-        shapes_with_null_points = 0
-        point_type_shapes = 0
-        other_type_shapes = 0
-        
-        # Plot each identifier with its assigned color
-        for identifier, color in identifier_colors.items():
-            shapes_data = shapes_by_identifier[identifier]
-            print(f"\n--- Processing identifier: {identifier} ---")
-            print(f"  Shapes data keys: {shapes_data.keys()}")
-            print(f"  Number of shapes: {shapes_data.get('count', 'unknown')}")
-            print(f"  Height range: {shapes_data.get('height_range', 'unknown')}")
-            
-            shapes_list = shapes_data.get('shapes', [])
-            print(f"  Actual shapes list length: {len(shapes_list)}")
-            
-            identifier_paths_drawn = 0
-            identifier_circles_drawn = 0
-            identifier_null_points = 0
-            identifier_point_types = 0
-            identifier_other_types = 0
-            
-            # Draw all shapes for this identifier
-            for i, shape_info in enumerate(shapes_list):
-                total_shapes_processed += 1
-                
-                # Debug each shape
-                shape_type = shape_info.get('type', 'unknown')
-                has_points = shape_info.get('points') is not None
-                
-                print(f"    Shape {i}: type='{shape_type}', has_points={has_points}")
-                
-                if shape_info.get('points') is not None:
-                    points = shape_info['points']
-                    print(f"      Points shape: {np.array(points).shape if isinstance(points, (list, np.ndarray)) else 'not array-like'}")
-                    
-                    if shape_info.get('type') == 'point':
-                        print(f"      Drawing point at: {points[0] if len(points) > 0 else 'no points'}")
-                        plt.plot(points[0, 0], points[0, 1], 'o', 
-                                color=color, markersize=2, alpha=0.7)
-                        point_type_shapes += 1
-                        identifier_point_types += 1
-                    else:
-                        print(f"      Drawing path with {len(points) if hasattr(points, '__len__') else 'unknown'} points")
-                        draw_shape(plt, points, color)
-                        total_paths_drawn += 1
-                        identifier_paths_drawn += 1
-                        other_type_shapes += 1
-                        identifier_other_types += 1
-                        
-                elif shape_info.get('type') == 'circle':
-                    center = shape_info.get('center', 'unknown')
-                    radius = shape_info.get('radius', 'unknown')
-                    print(f"      Drawing circle at center={center}, radius={radius}")
-                    circle = plt.Circle(
-                        shape_info['center'], 
-                        shape_info['radius'], 
-                        color=color, 
-                        fill=False, 
-                        alpha=0.7
-                    )
-                    plt.gca().add_artist(circle)
-                    total_circles_drawn += 1
-                    identifier_circles_drawn += 1
-                else:
-                    print(f"      SKIPPED: No points and not a circle")
-                    shapes_with_null_points += 1
-                    identifier_null_points += 1
-            
-            print(f"  Identifier {identifier} summary:")
-            print(f"    Paths drawn: {identifier_paths_drawn}")
-            print(f"    Circles drawn: {identifier_circles_drawn}")
-            print(f"    Point types: {identifier_point_types}")
-            print(f"    Other types: {identifier_other_types}")
-            print(f"    Null points: {identifier_null_points}")
-        
-        print(f"\n=== FINAL SUMMARY (INCLUDING NO_ID) ===")
-        print(f"Total shapes processed: {total_shapes_processed}")
-        print(f"Total paths drawn: {total_paths_drawn}")
-        print(f"Total circles drawn: {total_circles_drawn}")
-        print(f"Point type shapes: {point_type_shapes}")
-        print(f"Other type shapes: {other_type_shapes}")
-        print(f"Shapes with null points (skipped): {shapes_with_null_points}")
-        print(f"============================================\n")
-        
-        plt.axis('equal')  # Ensure perfect square
-        
-        # Save the transparent plot
-        identifier_dir = os.path.join(output_dir, "identifier_views")
-        os.makedirs(identifier_dir, exist_ok=True)
-        filename = f'transparent_all_pathdata_WITH_NO_ID_{PLATFORM_SIZE_MM}mmx{PLATFORM_SIZE_MM}mm_2100px.png'
-        output_path = os.path.join(identifier_dir, filename)
-        save_platform_figure(plt, output_path, pad_inches=0, bbox_inches='tight')
-        plt.close()
-        
-        print(f"Created 2100px transparent paths view (WITH NO_ID) at: {output_path}")
-        return os.path.join("identifier_views", filename)
-        
-    except Exception as e:
-        print(f"Error creating 2100px transparent paths view (WITH NO_ID): {str(e)}")
-        return None
-
-
-def create_clean_platform(clf_files, output_dir, height=1.0, fill_closed=False, alignment_style_only=False, save_clean_png=True):
-    """Create a clean platform view without any chart elements, just shapes, and save raw path data.
-    Processes files sequentially to avoid nested multiprocessing conflicts."""
-    import os
-    import json
-    
-    # Define colors dictionary
-    colors = {
-        'Part.clf': 'blue',
-        'WaferSupport.clf': 'red',
-        'Net.clf': 'green'
-    }
-    
-    # Process all CLF files sequentially (avoiding nested multiprocessing)
-    shape_data_list = []
-    for clf_info in clf_files:
-        try:
-            result = process_layer_data(clf_info, height, colors)
-            shape_data_list.extend(result)
-        except Exception as e:
-            print(f"Error processing {clf_info['name']} at height {height}mm: {str(e)}")
-    
-    # Update fill_closed for all shapes
-    for shape_data in shape_data_list:
-        shape_data['fill_closed'] = fill_closed
-    
-    # Only create plot if save_clean_png is True
-    if save_clean_png:
-        # If alignment_style_only, declare midpoints list
-        if alignment_style_only:
-            midpoints = []
-            
-        # Create figure with equal aspect ratio
-        fig = setup_platform_figure(figsize=(15, 15))
-        
-        # Remove all margins and spacing
-        ax = plt.gca()
-        ax.set_position([0, 0, 1, 1])
-        
-        # Set exact limits for platform size
-        half_size = PLATFORM_HALF_SIZE_MM
-        plt.xlim(-half_size, half_size)
-        plt.ylim(-half_size, half_size)
-        
-        # Turn off all chart elements
-        ax.set_xticks([])
-        ax.set_yticks([])
-        ax.set_xticklabels([])
-        ax.set_yticklabels([])
-        plt.axis('off')
-        
-        # Draw all shapes
-        for shape_data in shape_data_list:
-            if shape_data['type'] == 'path' and 'points' in shape_data:
-                points = np.array(shape_data['points'])
-                color = shape_data['color']
-                
-                if alignment_style_only:
-                    draw_aligned_shape(plt, points, color, midpoints=midpoints)
-                else:
-                    if fill_closed and shape_data.get('should_close', False):
-                        polygon = Polygon(points, facecolor='black', edgecolor=color, alpha=0.5)
-                        plt.gca().add_patch(polygon)
-                    else:
-                        draw_shape(plt, points, color)
-            elif shape_data['type'] == 'circle':
-                circle = plt.Circle(shape_data['center'], shape_data['radius'], 
-                                   color=shape_data['color'], fill=False, alpha=0.7)
-                plt.gca().add_artist(circle)
-                
-        plt.axis('equal')  # Ensure perfect square
-        filename = f'clean_platform_{height}mm.png'
-        output_path = os.path.join(output_dir, "clean_platforms", filename)
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        save_platform_figure(plt, output_path, pad_inches=0)
-        png_path = os.path.join("clean_platforms", filename)
-    else:
-        png_path = None
-    
-    # Save the shape data to a file
-    try:
-        # Extract build number from ABP filename
-        abp_name = os.path.basename(output_dir)
-        build_number = abp_name.split('-')[1].split('.')[0] if '-' in abp_name else ''
-        
-        # Create directory with build number
-        raw_data_dir = os.path.join(output_dir, f"imagePathRawData-{build_number}")
-        os.makedirs(raw_data_dir, exist_ok=True)
-
-        # Construct filename
-        data_filename = f'platform_layer_pathdata_{height}mm.json'
-        data_output_path = os.path.join(raw_data_dir, data_filename)
-        
-        # Add debugging information
-        print(f"\nWriting shape data to: {data_output_path}")
-        print(f"Number of shapes being written: {len(shape_data_list)}")
-        
-        with open(data_output_path, 'w') as f:
-            json.dump(shape_data_list, f, indent=2)
-        
-        print(f"Successfully wrote shape data for height {height}mm")
-        
-    except Exception as e:
-        print(f"Error saving shape data for clean platform at height {height}mm: {str(e)}")
-        
-    return png_path
-
-
-def create_clean_platform_skin_only(clf_files, output_dir, height=1.0, fill_closed=False, alignment_style_only=False, save_clean_png=True, only_skin_files=True):
-    """DEBUG VERSION: Create a clean platform view with option to filter for skin files only.
-    This is a separate function for testing and debugging purposes."""
-    import os
-    import json
-    
-    # Define colors dictionary
-    colors = {
-        'Part.clf': 'blue',
-        'WaferSupport.clf': 'red',
-        'Net.clf': 'green'
-    }
-    
-    # Filter files if only_skin_files is True
-    if only_skin_files:
-        original_count = len(clf_files)
-        clf_files = [clf_info for clf_info in clf_files if 'skin' in clf_info['folder'].lower()]
-        print(f"Filtering for skin files only: {len(clf_files)} out of {original_count} files")
-        if len(clf_files) > 0:
-            print("Example skin files:")
-            for i, clf_info in enumerate(clf_files[:3]):
-                print(f"  {i+1}: {clf_info['name']} in folder {clf_info['folder']}")
-    
-    
-    # Process all CLF files sequentially (avoiding nested multiprocessing)
-    shape_data_list = []
-    for clf_info in clf_files:
-        try:
-            # Log which folder and file are being processed for skin_files_only
-            if only_skin_files:
-                print(f"Processing skin file: '{clf_info['name']}' from folder: '{clf_info['folder']}'")
-            
-            result = process_layer_data(clf_info, height, colors)
-            shape_data_list.extend(result)
-        except Exception as e:
-            print(f"Error processing {clf_info['name']} at height {height}mm: {str(e)}")
-    
-    # Update fill_closed for all shapes
-    for shape_data in shape_data_list:
-        shape_data['fill_closed'] = fill_closed
-    
-    # Only create plot if save_clean_png is True
-    if save_clean_png:
-        # If alignment_style_only, declare midpoints list
-        if alignment_style_only:
-            midpoints = []
-            
-        # Create figure with equal aspect ratio
-        fig = setup_platform_figure(figsize=(15, 15))
-        
-        # Remove all margins and spacing
-        ax = plt.gca()
-        ax.set_position([0, 0, 1, 1])
-        
-        # Set exact limits for platform size
-        plt.xlim(-125, 125)
-        plt.ylim(-125, 125)
-        
-        # Turn off all chart elements
-        ax.set_xticks([])
-        ax.set_yticks([])
-        ax.set_xticklabels([])
-        ax.set_yticklabels([])
-        plt.axis('off')
-        
-        # Draw all shapes with enhanced colorization for debugging
-        for shape_data in shape_data_list:
-            if shape_data['type'] == 'path' and 'points' in shape_data:
-                points = np.array(shape_data['points'])
-                
-                # Enhanced color coding for debugging holes and paths
-                if only_skin_files:
-                    # For skin files, use different colors based on path index and hole status
-                    if shape_data.get('is_hole', False):
-                        # Holes are bright red with thick lines
-                        color = 'red'
-                        linewidth = 3
-                        alpha = 0.9
-                        print(f"  Drawing HOLE: Path {shape_data.get('path_index', '?')} in Shape {shape_data.get('shape_index', '?')} from {shape_data['clf_name']}")
-                    else:
-                        # Exterior paths: color by path index for debugging
-                        path_idx = shape_data.get('path_index', 0)
-                        if path_idx == 0:
-                            color = 'blue'  # First path (exterior) is blue
-                        elif path_idx == 1:
-                            color = 'green'  # Second path is green
-                        elif path_idx == 2:
-                            color = 'orange'  # Third path is orange
-                        else:
-                            color = 'purple'  # Additional paths are purple
-                        linewidth = 2
-                        alpha = 0.7
-                        print(f"  Drawing EXTERIOR: Path {path_idx} in Shape {shape_data.get('shape_index', '?')} from {shape_data['clf_name']} (total paths: {shape_data.get('total_paths_in_shape', '?')})")
-                else:
-                    # For all files, use original color scheme
-                    color = shape_data['color']
-                    linewidth = 1
-                    alpha = 0.7
-                
-                if alignment_style_only:
-                    draw_aligned_shape(plt, points, color, midpoints=midpoints)
-                else:
-                    if fill_closed and shape_data.get('should_close', False):
-                        polygon = Polygon(points, facecolor='black', edgecolor=color, alpha=alpha, linewidth=linewidth)
-                        plt.gca().add_patch(polygon)
-                    else:
-                        # Draw unfilled shapes with custom colors
-                        plt.plot(points[:, 0], points[:, 1], color=color, linewidth=linewidth, alpha=alpha)
-                        if shape_data.get('should_close', False):
-                            # Close the path if needed
-                            plt.plot([points[-1, 0], points[0, 0]], [points[-1, 1], points[0, 1]], color=color, linewidth=linewidth, alpha=alpha)
-                        
-            elif shape_data['type'] == 'circle':
-                color = shape_data['color'] if not only_skin_files else 'cyan'  # Circles in cyan for skin files
-                circle = plt.Circle(shape_data['center'], shape_data['radius'], 
-                                   color=color, fill=False, alpha=0.7)
-                plt.gca().add_artist(circle)
-                
-        plt.axis('equal')  # Ensure perfect square
-        filename = f'clean_platform_enhanced_{height}mm.png'
-        output_path = os.path.join(output_dir, "clean_platforms", filename)
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        save_platform_figure(plt, output_path, pad_inches=0)
-        png_path = os.path.join("clean_platforms", filename)
-    else:
-        png_path = None
-    
-    # Save the shape data to a file
-    try:
-        # Extract build number from ABP filename
-        abp_name = os.path.basename(output_dir)
-        build_number = abp_name.split('-')[1].split('.')[0] if '-' in abp_name else ''
-        
-        # Create directory with build number
-        raw_data_dir = os.path.join(output_dir, f"imagePathRawData-{build_number}")
-        os.makedirs(raw_data_dir, exist_ok=True)
-
-        # Construct filename
-        data_filename = f'platform_layer_pathdata_enhanced_{height}mm.json'
-        data_output_path = os.path.join(raw_data_dir, data_filename)
-        
-        # Add debugging information
-        print(f"\nWriting enhanced shape data to: {data_output_path}")
-        print(f"Number of shapes being written: {len(shape_data_list)}")
-        
-        with open(data_output_path, 'w') as f:
-            json.dump(shape_data_list, f, indent=2)
-        
-        print(f"Successfully wrote enhanced shape data for height {height}mm")
-        
-    except Exception as e:
-        print(f"Error saving enhanced shape data for clean platform at height {height}mm: {str(e)}")
-        
-    return png_path
-
-
-def create_combined_holes_platform_view(clf_files, output_dir, height=134.0):
-    """Create a platform view showing all detected holes across all CLF files at a specific height.
-    Uses the corrected hole detection logic (multiple paths within same shape)."""
-    try:
-        print(f"Creating combined holes platform view at {height}mm...")
-        
-        # Define colors for different CLF files
-        colors = {
-            'Part.clf': '#2E86AB',
-            'WaferSupport.clf': '#A23B72', 
-            'Net.clf': '#F18F01'
-        }
-        
-        all_exteriors = []
-        all_holes = []
-        holes_stats = {
-            'total_files': len(clf_files),
-            'files_with_holes': 0,
-            'total_exteriors': 0,
-            'total_holes': 0,
-            'file_details': []
-        }
-        
-        # Process each CLF file to find holes
-        for clf_info in clf_files:
-            try:
-                part = CLFFile(clf_info['path'])
-                layer = part.find(height)
-                
-                if layer is None or not hasattr(layer, 'shapes'):
-                    continue
-                
-                shapes = list(layer.shapes)
-                color = colors.get(clf_info['name'], '#666666')
-                exteriors_in_file = 0
-                holes_in_file = 0
-                
-                # Check if this file can contain holes (must contain 'skin' in folder name, case-insensitive)
-                can_have_holes = 'skin' in clf_info['folder'].lower()
-                
-                # Process each shape to find holes - use correct hole detection logic (Shape[1] Path[0])
-                for i, shape in enumerate(shapes):
-                    if not hasattr(shape, 'points') or not shape.points:
-                        continue
-                        
-                    # Get identifier for shape
-                    identifier = "unknown"
-                    if hasattr(shape, 'model') and hasattr(shape.model, 'id'):
-                        identifier = str(shape.model.id)
-                    
-                    # Process each path in the shape
-                    for path_idx, points in enumerate(shape.points):
-                        # Check if this is a hole using the correct logic: Shape[1] Path[0]
-                        is_hole = (i == 1 and path_idx == 0 and len(shapes) >= 2 and can_have_holes)
-                        
-                        if is_hole:
-                            # This is a hole: Shape[1] Path[0] in a skin file
-                            print(f"    Found hole: Shape[{i}] Path[{path_idx}] (ID:{identifier}) in {clf_info['name']}")
-                            
-                            hole_info = {
-                                'type': 'hole',
-                                'points': points,
-                                'identifier': f"{identifier}_shape_{i}_path_{path_idx}",
-                                'clf_file': clf_info['name'],
-                                'clf_folder': clf_info['folder'],
-                                'color': color,
-                                'shape_index': i,
-                                'path_index': path_idx,
-                                'parent_shape_index': i,
-                                'parent_identifier': identifier
-                            }
-                            all_holes.append(hole_info)
-                            holes_in_file += 1
-                        else:
-                            # This is a regular exterior shape
-                            exterior_info = {
-                                'type': 'exterior',
-                                'points': points,
-                                'identifier': f"{identifier}_shape_{i}_path_{path_idx}",
-                                'clf_file': clf_info['name'],
-                                'clf_folder': clf_info['folder'],
-                                'color': color,
-                                'shape_index': i,
-                                'path_index': path_idx
-                            }
-                            all_exteriors.append(exterior_info)
-                            exteriors_in_file += 1
-                
-                # Add file statistics
-                if holes_in_file > 0:
-                    holes_stats['files_with_holes'] += 1
-                
-                holes_stats['file_details'].append({
-                    'filename': clf_info['name'],
-                    'folder': clf_info['folder'],
-                    'exteriors': exteriors_in_file,
-                    'holes': holes_in_file,
-                    'can_have_holes': can_have_holes
-                })
-                
-            except Exception as e:
-                print(f"Error processing {clf_info['name']} for holes: {e}")
-                continue
-        
-        # Update summary statistics
-        holes_stats['total_exteriors'] = len(all_exteriors)
-        holes_stats['total_holes'] = len(all_holes)
-        
-        print(f"Holes analysis summary:")
-        print(f"  - Total files: {holes_stats['total_files']}")
-        print(f"  - Files with holes: {holes_stats['files_with_holes']}")
-        print(f"  - Total exterior shapes: {holes_stats['total_exteriors']}")
-        print(f"  - Total holes found: {holes_stats['total_holes']}")
-        
-        # Create the visualization if we found any shapes
-        if all_exteriors or all_holes:
-            # Create figure
-            setup_platform_figure(figsize=(15, 15))
-            
-            # Add standard platform elements
-            draw_platform_boundary(plt)
-            add_reference_lines(plt)
-            
-            # Draw exterior shapes (semi-transparent)
-            for ext_shape in all_exteriors:
-                points = ext_shape['points']
-                color = ext_shape['color']
-                
-                # Draw as a filled polygon with low alpha
-                polygon = Polygon(points, facecolor=color, alpha=0.3, 
-                                edgecolor=color, linewidth=1)
-                plt.gca().add_patch(polygon)
-            
-            # Draw holes (bright red for high visibility)
-            for hole in all_holes:
-                points = hole['points']
-                
-                # Draw holes as solid red polygons for visibility
-                hole_polygon = Polygon(points, facecolor='red', alpha=0.8, 
-                                     edgecolor='darkred', linewidth=2)
-                plt.gca().add_patch(hole_polygon)
-            
-            # Create legend
-            legend_elements = []
-            for clf_name, color in colors.items():
-                if any(ext['clf_file'] == clf_name for ext in all_exteriors):
-                    legend_elements.append(plt.Rectangle((0,0),1,1, facecolor=color, alpha=0.3, 
-                                                       edgecolor=color, label=f'{clf_name} (Exteriors)'))
-            
-            if all_holes:
-                legend_elements.append(plt.Rectangle((0,0),1,1, facecolor='red', alpha=0.8, 
-                                                   edgecolor='darkred', label='Holes'))
-            
-            if legend_elements:
-                plt.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.05, 1), borderaxespad=0.)
-            
-            plt.title(f'Combined Holes Platform View at {height}mm\n'
-                     f'Total Files: {holes_stats["total_files"]} | '
-                     f'Files with Holes: {holes_stats["files_with_holes"]}\n'
-                     f'Exterior Shapes: {holes_stats["total_exteriors"]} | '
-                     f'Holes Found: {holes_stats["total_holes"]}')
-            
-            add_platform_labels(plt)
-            set_platform_limits(plt)
-            
-            # Save the holes view
-            holes_dir = os.path.join(output_dir, "holes_views")
-            os.makedirs(holes_dir, exist_ok=True)
-            filename = f'combined_holes_platform_view_{height}mm.png'
-            output_path = os.path.join(holes_dir, filename)
-            save_platform_figure(plt, output_path)
-            
-            print(f"Created combined holes view at: {output_path}")
-            return os.path.join("holes_views", filename), holes_stats
-        
-        else:
-            print("No shapes found for holes visualization")
-            return None, holes_stats
-            
-    except Exception as e:
-        print(f"Error creating combined holes platform view: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return None, None
-
-
-def create_clean_platform_skin_only_enhanced(clf_files, output_dir, height=1.0, fill_closed=False, alignment_style_only=False, save_clean_png=True, only_skin_files=True):
-    """DEBUG VERSION: Create a clean platform view with enhanced colorization for hole detection debugging.
-    This function adds color coding to distinguish different paths and holes."""
-    
-    # Define colors dictionary
-    colors = {
-        'Part.clf': 'blue',
-        'WaferSupport.clf': 'red',
-        'Net.clf': 'green'
-    }
-    
-    # Filter files if only_skin_files is True
-    if only_skin_files:
-        original_count = len(clf_files)
-        clf_files = [clf_info for clf_info in clf_files if 'skin' in clf_info['folder'].lower()]
-        print(f"Filtering for skin files only: {len(clf_files)} out of {original_count} files")
-        if len(clf_files) > 0:
-            print("Example skin files:")
-            for i, clf_info in enumerate(clf_files[:3]):
-                print(f"  {i+1}: {clf_info['name']} in folder {clf_info['folder']}")
-    
-    # Process all CLF files sequentially (avoiding nested multiprocessing)
-    shape_data_list = []
-    for clf_info in clf_files:
-        try:
-            # Log which folder and file are being processed for skin_files_only
-            if only_skin_files:
-                print(f"Processing skin file: '{clf_info['name']}' from folder: '{clf_info['folder']}'")
-            
-            result = process_layer_data(clf_info, height, colors)
-            shape_data_list.extend(result)
-        except Exception as e:
-            print(f"Error processing {clf_info['name']} at height {height}mm: {str(e)}")
-    
-    # Update fill_closed for all shapes
-    for shape_data in shape_data_list:
-        shape_data['fill_closed'] = fill_closed
-    
-    # Only create plot if save_clean_png is True
-    if save_clean_png:
-        # If alignment_style_only, declare midpoints list
-        if alignment_style_only:
-            midpoints = []
-            
-        # Create figure with equal aspect ratio
-        fig = setup_platform_figure(figsize=(15, 15))
-        
-        # Remove all margins and spacing
-        ax = plt.gca()
-        ax.set_position([0, 0, 1, 1])
-        
-        # Set exact limits for platform size
-        plt.xlim(-125, 125)
-        plt.ylim(-125, 125)
-        
-        # Turn off all chart elements
-        ax.set_xticks([])
-        ax.set_yticks([])
-        ax.set_xticklabels([])
-        ax.set_yticklabels([])
-        plt.axis('off')
-        
-        # Draw all shapes with enhanced colorization for debugging
-        for shape_data in shape_data_list:
-            if shape_data['type'] == 'path' and 'points' in shape_data:
-                points = np.array(shape_data['points'])
-                
-                # Enhanced color coding for debugging holes and paths
-                if only_skin_files:
-                    # For skin files, use different colors based on path index and hole status
-                    if shape_data.get('is_hole', False):
-                        # Holes are bright red with thick lines
-                        color = 'red'
-                        linewidth = 3
-                        alpha = 0.9
-                        print(f"  Drawing HOLE: Path {shape_data.get('path_index', '?')} in Shape {shape_data.get('shape_index', '?')} from {shape_data['clf_name']}")
-                    else:
-                        # Exterior paths: color by path index for debugging
-                        path_idx = shape_data.get('path_index', 0)
-                        if path_idx == 0:
-                            color = 'blue'  # First path (exterior) is blue
-                        elif path_idx == 1:
-                            color = 'green'  # Second path is green
-                        elif path_idx == 2:
-                            color = 'orange'  # Third path is orange
-                        else:
-                            color = 'purple'  # Additional paths are purple
-                        linewidth = 2
-                        alpha = 0.7
-                        print(f"  Drawing EXTERIOR: Path {path_idx} in Shape {shape_data.get('shape_index', '?')} from {shape_data['clf_name']} (total paths: {shape_data.get('total_paths_in_shape', '?')})")
-                else:
-                    # For all files, use original color scheme
-                    color = shape_data['color']
-                    linewidth = 1
-                    alpha = 0.7
-                
-                if alignment_style_only:
-                    draw_aligned_shape(plt, points, color, midpoints=midpoints)
-                else:
-                    if fill_closed and shape_data.get('should_close', False):
-                        polygon = Polygon(points, facecolor='black', edgecolor=color, alpha=alpha, linewidth=linewidth)
-                        plt.gca().add_patch(polygon)
-                    else:
-                        # Draw unfilled shapes with custom colors
-                        plt.plot(points[:, 0], points[:, 1], color=color, linewidth=linewidth, alpha=alpha)
-                        if shape_data.get('should_close', False):
-                            # Close the path if needed
-                            plt.plot([points[-1, 0], points[0, 0]], [points[-1, 1], points[0, 1]], color=color, linewidth=linewidth, alpha=alpha)
-                        
-            elif shape_data['type'] == 'circle':
-                color = shape_data['color'] if not only_skin_files else 'cyan'  # Circles in cyan for skin files
-                circle = plt.Circle(shape_data['center'], shape_data['radius'], 
-                                   color=color, fill=False, alpha=0.7)
-                plt.gca().add_artist(circle)
-                
-        plt.axis('equal')  # Ensure perfect square
-        filename = f'clean_platform_enhanced_{height}mm.png'
-        output_path = os.path.join(output_dir, "clean_platforms", filename)
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        save_platform_figure(plt, output_path, pad_inches=0)
-        png_path = os.path.join("clean_platforms", filename)
-    else:
-        png_path = None
-    
-    # Save the shape data to a file
-    try:
-        # Extract build number from ABP filename
-        abp_name = os.path.basename(output_dir)
-        build_number = abp_name.split('-')[1].split('.')[0] if '-' in abp_name else ''
-        
-        # Create directory with build number
-        raw_data_dir = os.path.join(output_dir, f"imagePathRawData-{build_number}")
-        os.makedirs(raw_data_dir, exist_ok=True)
-
-        # Construct filename
-        data_filename = f'platform_layer_pathdata_enhanced_{height}mm.json'
-        data_output_path = os.path.join(raw_data_dir, data_filename)
-        
-        # Add debugging information
-        print(f"\nWriting enhanced shape data to: {data_output_path}")
-        print(f"Number of shapes being written: {len(shape_data_list)}")
-        
-        with open(data_output_path, 'w') as f:
-            json.dump(shape_data_list, f, indent=2)
-        
-        print(f"Successfully wrote enhanced shape data for height {height}mm")
-        
-    except Exception as e:
-        print(f"Error saving enhanced shape data for clean platform at height {height}mm: {str(e)}")
-        
+import os
+import sys
+# Default to the non-interactive backend for web applications without overriding
+# a backend the caller already chose; pyplot itself is imported inside the views
+os.environ.setdefault('MPLBACKEND', 'Agg')
+import matplotlib
+import numpy as np   
+import json
+import functools
+import hashlib
+import multiprocessing
+import threading
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba, to_rgba_array
+from matplotlib.lines import Line2D
+from matplotlib.path import Path
+from PIL import Image
+
+try:
+    import orjson  # Optional: serializes numpy arrays in C for the path-data JSON
+except ImportError:
+    orjson = None
+
+try:
+    import imagecodecs  # Optional: faster PNG encoder for the transparent overlays
+except ImportError:
+    imagecodecs = None
+
+# Import platform configuration
+from config import PLATFORM_HALF_SIZE_MM, PLATFORM_SIZE_MM
+
+from utils.myfuncs.plotTools import (
+    setup_platform_figure,
+    setup_clean_platform_figure,
+    setup_standard_platform_view,
+    draw_platform_boundary,
+    add_reference_lines,
+    set_platform_limits,
+    draw_shapes_batched,
+    draw_shapes_collection,
+    draw_aligned_shapes,
+    save_platform_figure
+)
+from utils.myfuncs.print_utils import add_platform_labels
+from utils.myfuncs.shape_things import (
+    should_close_path,
+    circle_vertices,
+    circle_vertices_batch,
+    process_shapes,
+    simplify_path
+)
+from utils.pyarcam.clfutil import CLFFile
+
+
+# Figures reused across view calls, per thread so concurrent analyses never draw into each other's
+# figure; each thread's dict is keyed by figsize (or ('clean', figsize) for clean platform axes)
+_FIG_CACHE = threading.local()
+
+# Held for the whole draw-and-save of views that draw through pyplot's current figure, which is
+# shared by all threads, so two threads cannot swap it out from under each other
+_PYPLOT_LOCK = threading.RLock()
+
+# Colors per CLF file name for the composite and clean platform views; the holes view uses its own set
+_CLF_COLORS = {
+    'Part.clf': 'blue',
+    'WaferSupport.clf': 'red',
+    'Net.clf': 'green'
+}
+_HOLE_VIEW_COLORS = {
+    'Part.clf': '#2E86AB',
+    'WaferSupport.clf': '#A23B72', 
+    'Net.clf': '#F18F01'
+}
+
+# Output names of the 2100px transparent overlays
+_TRANSPARENT_2100PX_FILENAME = f'transparent_all_pathdata_{PLATFORM_SIZE_MM}mmx{PLATFORM_SIZE_MM}mm_2100px.png'
+_TRANSPARENT_2100PX_WITH_NO_ID_FILENAME = (
+    f'transparent_all_pathdata_WITH_NO_ID_{PLATFORM_SIZE_MM}mmx{PLATFORM_SIZE_MM}mm_2100px.png')
+
+# Parsed layers of the height last passed to _load_layer_points, keyed by (path, height, mtime_ns, size)
+_LAYER_CACHE = {}
+_LAYER_CACHE_HEIGHT = None
+
+
+def _cached_figures():
+    """This thread's figure cache"""
+    try:
+        return _FIG_CACHE.figures
+    except AttributeError:
+        _FIG_CACHE.figures = {}
+        return _FIG_CACHE.figures
+
+
+def release_cached_figures():
+    """Close the figures this thread cached for reuse, e.g. at the end of an analysis run.
+    The next view call builds a new figure, so this is always safe to call."""
+    import matplotlib.pyplot as plt
+    figures = _cached_figures()
+    for fig in figures.values():
+        plt.close(fig)
+    figures.clear()
+
+
+def _get_cached_figure(figsize=(15, 15)):
+    """Return a cleared, current figure of the given size, reused across calls in this thread.
+    Returns (fig, cached); pool workers get a fresh figure (cached=False) so they do not
+    hold a canvas for their whole lifetime, and should close it after saving."""
+    import matplotlib.pyplot as plt
+    if multiprocessing.current_process().daemon:
+        return setup_platform_figure(figsize=figsize), False
+    
+    figures = _cached_figures()
+    fig = figures.get(figsize)
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig = setup_platform_figure(figsize=figsize)
+        figures[figsize] = fig
+    else:
+        plt.figure(fig.number)  # Make it current for the pyplot calls that follow
+        fig.clear()
+        fig.set_size_inches(*figsize)
+    return fig, True
+
+
+def _get_clean_platform_axes(figsize=(15, 15)):
+    """Return (fig, ax, cached) for a chart-less platform view, reused across heights in this thread.
+    The axes are set up once (no margins, axis off, platform limits); later calls only remove
+    the previous height's shapes, so no figure clear or axes rebuild happens per height.
+    Pool workers get a fresh figure (cached=False) and should close it after saving.
+    Callers draw on the returned ax and fig only, so just the setup here goes through pyplot's
+    current figure and needs _PYPLOT_LOCK."""
+    import matplotlib.pyplot as plt
+    with _PYPLOT_LOCK:
+        if multiprocessing.current_process().daemon:
+            fig = setup_clean_platform_figure(figsize)
+            return fig, fig.axes[0], False
+        
+        figures = _cached_figures()
+        key = ('clean', figsize)
+        fig = figures.get(key)
+        if fig is None or not plt.fignum_exists(fig.number):
+            fig = setup_clean_platform_figure(figsize)
+            figures[key] = fig
+            return fig, fig.axes[0], True
+    
+    ax = fig.axes[0]
+    for artist in list(ax.collections) + list(ax.lines) + list(ax.patches):
+        artist.remove()
+    return fig, ax, True
+
+
+def _scatter_points(ax, point_xy, point_colors, alpha=0.7):
+    """Draw all point-type shapes as one PathCollection instead of one Line2D per point"""
+    if len(point_xy) == 0:
+        return None
+    
+    point_xy = np.asarray(point_xy)
+    return ax.scatter(point_xy[:, 0], point_xy[:, 1], c=to_rgba_array(point_colors), 
+                      s=4, alpha=alpha, linewidths=0)
+
+
+def _add_circle_collection(ax, circles, edgecolors, alpha=0.7):
+    """Add unfilled circles, given as (center, radius) pairs, as one LineCollection of rings.
+    All rings are tessellated in a single vectorized step instead of one Circle patch per circle."""
+    if len(circles) == 0:
+        return None
+    
+    centers, radii = zip(*circles)
+    rings = circle_vertices_batch(np.asarray(centers, dtype=float), np.asarray(radii, dtype=float))
+    collection = LineCollection(rings, colors=to_rgba_array(edgecolors), linewidths=1.0, alpha=alpha)
+    return ax.add_collection(collection)
+
+
+_JSON_BUFFER_SIZE = 1 << 20
+
+
+def _write_json(data, output_path, pretty=False, native_numpy=True):
+    """Write data as JSON through a 1 MiB file buffer, using orjson when it is installed.
+    Output is compact unless pretty=True (2-space indent). With native_numpy, orjson encodes
+    ndarrays itself; otherwise they go through .tolist(), which writes float32 values with the
+    same digits as the stdlib json output."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY if native_numpy else 0
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        with open(output_path, 'wb', buffering=_JSON_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(data, default=lambda o: o.tolist(), option=option))
+    else:
+        with open(output_path, 'w', buffering=_JSON_BUFFER_SIZE) as f:
+            json.dump(data, f, indent=2 if pretty else None, separators=None if pretty else (',', ':'), 
+                      default=lambda o: o.tolist())
+
+
+def _write_shape_data_json(shape_data_list, output_path, pretty=False, quantize=None):
+    """Write shape data as columnar JSON (see shape_data_to_columns), using orjson when it is installed.
+    Output is compact unless pretty=True (2-space indent). Points are passed as ndarrays so orjson
+    can encode them without boxing each coordinate; by default they are float64, which keeps the
+    numbers identical to the stdlib json output. quantize is passed to shape_data_to_columns."""
+    _write_json(shape_data_to_columns(shape_data_list, quantize=quantize), output_path, pretty=pretty)
+
+
+def _save_fig_fast(fig, output_path, dpi=300, compress_level=1):
+    """Save a full-canvas figure straight from the Agg buffer with imagecodecs, or Pillow if it
+    is not installed. Skips savefig's tight-bbox second render and uses a fast zlib level; only
+    for margin-free views (axes at [0, 0, 1, 1]) where the canvas is already the image."""
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    _write_rgba_png(np.asarray(fig.canvas.buffer_rgba()), output_path, compress_level)
+
+
+def _write_rgba_png(rgba, output_path, compress_level=1):
+    """Encode an (H, W, 4) uint8 array as PNG with imagecodecs, or Pillow if it is not installed"""
+    if imagecodecs is not None:
+        with open(output_path, 'wb') as f:
+            f.write(imagecodecs.png_encode(rgba, level=compress_level))
+    else:
+        Image.fromarray(rgba, 'RGBA').save(output_path, format='PNG', compress_level=compress_level, 
+                                           optimize=False)
+
+
+def _rgba_u8(colors, alpha=1.0):
+    """Convert colors to a list of 8-bit (r, g, b, a) tuples once, scaling alpha, for Pillow drawing"""
+    if len(colors) == 0:
+        return []
+    rgba = np.array(to_rgba_array(colors), dtype=np.float64)
+    rgba[:, 3] *= alpha
+    return [tuple(c) for c in np.round(rgba * 255).astype(np.uint8).tolist()]
+
+
+def _rasterize_paths_to_png(paths, path_colors, point_xy, point_colors, circles, circle_colors, 
+                            size_px, output_path, width=1, path_should_close=None, simplify_px=0.5,
+                            polygons=(), polygon_colors=()):
+    """Rasterize a chart-less overlay straight into an RGBA PNG with Pillow's ImageDraw.
+    
+    Coordinates are platform mm mapped onto a size_px square spanning +-PLATFORM_HALF_SIZE_MM
+    (y up), the same framing as the matplotlib transparent views but without the artist and
+    renderer stack. Colors are 8-bit RGBA tuples (see _rgba_u8), one per item; circles are
+    (center, radius) pairs. Paths are closed like draw_shape does; path_should_close may give
+    their precomputed closure flags. Paths are Douglas-Peucker simplified in pixel space to
+    simplify_px first (0 disables it), dropping sub-pixel detail the raster cannot show anyway.
+    polygons are filled and outlined in polygon_colors and drawn first, beneath everything else.
+    """
+    from PIL import ImageDraw
+    
+    scale = size_px / (2.0 * PLATFORM_HALF_SIZE_MM)
+    
+    def to_px(xy):
+        xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        return np.column_stack(((xy[:, 0] + PLATFORM_HALF_SIZE_MM) * scale, 
+                                (PLATFORM_HALF_SIZE_MM - xy[:, 1]) * scale))
+    
+    img = Image.new('RGBA', (size_px, size_px), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    
+    for points, fill in zip(polygons, polygon_colors):
+        px = simplify_path(to_px(points[:, :2]), simplify_px)
+        draw.polygon(px.ravel().tolist(), fill=fill, outline=fill)
+    
+    if path_should_close is None:
+        path_should_close = [None] * len(paths)
+    
+    for points, fill, closes in zip(paths, path_colors, path_should_close):
+        px = to_px(points[:, :2])
+        if closes is None:
+            closes = should_close_path(points)
+        px = simplify_path(px, simplify_px)
+        if closes:
+            px = np.vstack([px, px[:1]])
+        draw.line(px.ravel().tolist(), fill=fill, width=width)
+    
+    for (center, radius), outline in zip(circles, circle_colors):
+        cx, cy = to_px(center)[0]
+        r = radius * scale
+        draw.ellipse([cx - r, cy - r, cx + r, cy + r], outline=outline, width=width)
+    
+    for (x, y), fill in zip(to_px(point_xy).tolist(), point_colors):
+        draw.point((x, y), fill=fill)
+    
+    _write_rgba_png(np.asarray(img), output_path)
+
+
+def _transparent_platform_axes(figsize):
+    """Build a transparent, chart-less figure whose axes fill the canvas and span the platform.
+    Uses Figure and FigureCanvasAgg directly, so no pyplot state is touched and there is
+    nothing to plt.close(); save it with _save_fig_fast."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=figsize, facecolor="none")
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes([0, 0, 1, 1])  # No margins
+    ax.patch.set_alpha(0)  # Make axes background transparent
+    
+    # Platform limits, squared before drawing so there is no limit recompute on save
+    half_size = PLATFORM_HALF_SIZE_MM
+    ax.set_xlim(-half_size, half_size)
+    ax.set_ylim(-half_size, half_size)
+    ax.set_aspect('equal', adjustable='box')
+    ax.set_axis_off()
+    return fig, ax
+
+
+def _add_polygon_collection(ax, verts, facecolors, edgecolors, alpha=0.5, **kwargs):
+    """Add closed shapes as one PolyCollection instead of one Polygon patch per shape"""
+    if not verts:
+        return None
+    
+    collection = PolyCollection(verts, facecolors=facecolors, edgecolors=edgecolors, 
+                                alpha=alpha, **kwargs)
+    return ax.add_collection(collection)
+
+
+def create_combined_excluded_identifier_platform_view(excluded_shapes_by_identifier, output_dir):
+    """Create a combined platform view showing all excluded identifiers with unique colors"""
+    import matplotlib.pyplot as plt
+    try:
+        # Skip the 'no_identifier' key if it exists
+        identifiers = [id for id in excluded_shapes_by_identifier.keys() if id != 'no_identifier']
+        
+        if not identifiers:
+            print("No excluded identifiers found for combined view")
+            return None
+            
+        # One float32 RGBA row per identifier; integer input indexes the tab10 table directly
+        colors = plt.cm.tab10(np.arange(len(identifiers)) % 10).astype(np.float32)
+        identifier_colors = [tuple(map(float, rgba)) for rgba in colors]
+        
+        # Create figure
+        setup_platform_figure()
+        ax = plt.gca()
+        
+        # Add standard platform elements
+        draw_platform_boundary(plt)
+        add_reference_lines(plt)
+        
+        total_shapes = 0
+        min_height = float('inf')
+        max_height = float('-inf')
+        point_xy, point_color_idx = [], []
+        line_paths, line_color_idx = [], []
+        line_closed = []  # Closure flags stored at ingest by analyze_layer
+        legend_handles = []
+        
+        # Identifiers that already have a legend entry
+        labeled_ids = set()
+        
+        # Plot each identifier with its assigned color
+        for id_idx, identifier in enumerate(identifiers):
+            color = identifier_colors[id_idx]
+            shapes_data = excluded_shapes_by_identifier[identifier]
+            total_shapes += shapes_data['count']
+            min_height = min(min_height, shapes_data['height_range'][0])
+            max_height = max(max_height, shapes_data['height_range'][1])
+            
+            # Draw all shapes for this identifier
+            for shape_info in shapes_data['shapes']:
+                if shape_info['points'] is not None:
+                    points = shape_info['points']
+                    if shape_info['type'] == 'point':
+                        point_xy.append(points[0])
+                        point_color_idx.append(id_idx)
+                    else:
+                        line_paths.append(points)
+                        line_closed.append(shape_info.get('should_close'))
+                        line_color_idx.append(id_idx)
+                elif shape_info['type'] == 'circle':
+                    center = shape_info['center']
+                    line_paths.append(circle_vertices(center[0], center[1], shape_info['radius']))
+                    line_closed.append(False)  # The tessellated ring already ends on its start
+                    line_color_idx.append(id_idx)
+                else:
+                    continue
+                
+                # Add label only once per identifier
+                if identifier not in labeled_ids:
+                    legend_handles.append(Line2D([], [], color=color, label=f'ID {identifier}'))
+                    labeled_ids.add(identifier)
+        
+        # One collection per primitive kind instead of an artist per shape
+        draw_shapes_collection(ax, line_paths, colors[line_color_idx], should_close=line_closed)
+        _scatter_points(ax, point_xy, colors[point_color_idx])
+        
+        plt.title(f'Combined EXCLUDED Identifier Platform View\n'
+                 f'Total Identifiers: {len(identifiers)} | Total Shapes: {total_shapes}\n'
+                 f'Height Range: {min_height:.2f}mm to {max_height:.2f}mm')
+        add_platform_labels(plt)
+        set_platform_limits(plt)
+        
+        # Add legend: the labelled boundary plus one proxy handle per identifier
+        boundary_handles, _ = ax.get_legend_handles_labels()
+        plt.legend(handles=boundary_handles + legend_handles, 
+                   bbox_to_anchor=(1.05, 1), loc='upper left', borderaxespad=0.)
+        
+        # Save to identifier_views directory
+        identifier_dir = os.path.join(output_dir, "identifier_views")
+        os.makedirs(identifier_dir, exist_ok=True)
+        filename = f'combined_excluded_identifier_platform_view.png'
+        output_path = os.path.join(identifier_dir, filename)
+        save_platform_figure(plt, output_path)
+        
+        print(f"Created combined excluded identifier view at: {output_path}")
+        return os.path.join("identifier_views", filename)
+        
+    except Exception as e:
+        print(f"Error creating combined excluded identifier platform view: {str(e)}")
+        return None
+
+
+def create_combined_identifier_platform_view(shapes_by_identifier, output_dir):
+    """Create a single platform view showing all identifiers with different colors"""
+    import matplotlib.pyplot as plt
+    try:
+        # Create a standard platform view
+        setup_platform_figure()
+        ax = plt.gca()
+        
+        # Add standard platform elements
+        draw_platform_boundary(plt)
+        add_reference_lines(plt)
+        
+        # The tab10 table as float32 RGBA rows; identifier n uses row n % 10
+        colors = plt.cm.tab10(np.arange(10)).astype(np.float32)
+        identifier_colors = [tuple(map(float, rgba)) for rgba in colors]
+        
+        # Statistics, bounding box and collection inputs are all gathered in one pass
+        num_identifiers = 0
+        total_shapes = 0
+        min_height = float('inf')
+        max_height = float('-inf')
+        bbox_min = np.full(2, np.inf)
+        bbox_max = np.full(2, -np.inf)
+        point_xy, point_color_idx = [], []
+        line_paths, line_color_idx = [], []
+        line_closed = []
+        legend_handles = []
+        
+        # Plot each identifier with its assigned color, skipping the 'no_identifier' key
+        for identifier, shapes_data in shapes_by_identifier.items():
+            if identifier == 'no_identifier':
+                continue
+            color_idx = num_identifiers % 10
+            color = identifier_colors[color_idx]
+            num_identifiers += 1
+            
+            # Update statistics
+            total_shapes += shapes_data['count']
+            min_height = min(min_height, shapes_data['height_range'][0])
+            max_height = max(max_height, shapes_data['height_range'][1])
+            
+            # Proxy handle for the legend
+            legend_handles.append(Line2D([], [], color=color, label=f"ID: {identifier}"))
+            
+            # Draw all shapes for this identifier
+            for shape_info in shapes_data['shapes']:
+                if shape_info['points'] is not None:
+                    points = np.asarray(shape_info['points'])
+                    if shape_info['type'] == 'point':
+                        point_xy.append(points[0])
+                        point_color_idx.append(color_idx)
+                        # Add point to bounding box calculation
+                        bbox_min = np.minimum(bbox_min, points[0, :2])
+                        bbox_max = np.maximum(bbox_max, points[0, :2])
+                    else:
+                        line_paths.append(points)
+                        line_closed.append(shape_info.get('should_close'))
+                        line_color_idx.append(color_idx)
+                        # Add the path's extent to bounding box calculation
+                        bbox_min = np.minimum(bbox_min, points[:, :2].min(axis=0))
+                        bbox_max = np.maximum(bbox_max, points[:, :2].max(axis=0))
+                elif shape_info['type'] == 'circle':
+                    center = shape_info['center']
+                    radius = shape_info['radius']
+                    line_paths.append(circle_vertices(center[0], center[1], radius))
+                    line_closed.append(False)
+                    line_color_idx.append(color_idx)
+                    # Add circle bounding box to calculation
+                    bbox_min = np.minimum(bbox_min, np.asarray(center[:2]) - radius)
+                    bbox_max = np.maximum(bbox_max, np.asarray(center[:2]) + radius)
+        
+        if not num_identifiers:
+            print("No identifiers found for combined view")
+            return None
+        
+        draw_shapes_collection(ax, line_paths, colors[line_color_idx], should_close=line_closed)
+        _scatter_points(ax, point_xy, colors[point_color_idx])
+        
+        # Calculate and draw bounding box
+        if np.all(np.isfinite(bbox_min)):
+            bbox_min_x, bbox_min_y = bbox_min
+            bbox_max_x, bbox_max_y = bbox_max
+            
+            # Calculate dimensions
+            bbox_width = bbox_max_x - bbox_min_x
+            bbox_height = bbox_max_y - bbox_min_y
+            
+            # Draw bounding box rectangle
+            bbox_rect = plt.Rectangle((bbox_min_x, bbox_min_y), bbox_width, bbox_height,
+                                    linewidth=2, edgecolor='red', facecolor='none', 
+                                    linestyle='--', alpha=0.8)
+            ax.add_patch(bbox_rect)
+            
+            # Add measurement text annotations
+            # Width annotation (bottom of bbox)
+            plt.annotate(f'Width: {bbox_width:.2f}mm', 
+                        xy=((bbox_min_x + bbox_max_x) / 2, bbox_min_y - 5),
+                        ha='center', va='top', fontsize=10, fontweight='bold',
+                        bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.8))
+            
+            # Height annotation (left of bbox)
+            plt.annotate(f'Height: {bbox_height:.2f}mm', 
+                        xy=(bbox_min_x - 5, (bbox_min_y + bbox_max_y) / 2),
+                        ha='right', va='center', fontsize=10, fontweight='bold', rotation=90,
+                        bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.8))
+            
+            # Corner coordinates annotation (top-right of bbox)
+            plt.annotate(f'Min: ({bbox_min_x:.1f}, {bbox_min_y:.1f})\nMax: ({bbox_max_x:.1f}, {bbox_max_y:.1f})', 
+                        xy=(bbox_max_x + 5, bbox_max_y),
+                        ha='left', va='top', fontsize=9,
+                        bbox=dict(boxstyle="round,pad=0.3", facecolor='yellow', alpha=0.7))
+            
+            # Update title to include bounding box info
+            title_text = (f'Combined Identifier Platform View\n'
+                         f'Total Identifiers: {num_identifiers} | Total Shapes: {total_shapes}\n'
+                         f'Height Range: {min_height:.2f}mm to {max_height:.2f}mm\n'
+                         f'Bounding Box: {bbox_width:.2f}mm × {bbox_height:.2f}mm')
+        else:
+            title_text = (f'Combined Identifier Platform View\n'
+                         f'Total Identifiers: {num_identifiers} | Total Shapes: {total_shapes}\n'
+                         f'Height Range: {min_height:.2f}mm to {max_height:.2f}mm')
+        
+        plt.title(title_text)
+        add_platform_labels(plt)
+        set_platform_limits(plt)
+        
+        # Add a legend for the identifiers
+        boundary_handles, _ = ax.get_legend_handles_labels()
+        plt.legend(handles=boundary_handles + legend_handles, 
+                   loc='upper left', bbox_to_anchor=(1.05, 1), borderaxespad=0.)
+        
+        # Save the plot
+        identifier_dir = os.path.join(output_dir, "identifier_views")
+        os.makedirs(identifier_dir, exist_ok=True)
+        filename = f'combined_identifiers_platform_view.png'
+        output_path = os.path.join(identifier_dir, filename)
+        save_platform_figure(plt, output_path)
+        
+        # Create transparent version with just the paths
+        create_transparent_paths_view(shapes_by_identifier, output_dir)
+        
+        return os.path.join("identifier_views", filename)
+        
+    except Exception as e:
+        print(f"Error creating combined identifier platform view: {str(e)}")
+        return None
+
+
+def create_non_identifier_platform_view(non_id_shapes, output_dir):
+    """Create a platform view showing all shapes that don't have identifiers"""
+    import matplotlib.pyplot as plt
+    try:        
+        # Create a standard platform view with common elements
+        title = f'Non-Identifier Shapes Platform View\nTotal Shapes: {len(non_id_shapes)}'
+        setup_standard_platform_view(title)
+        ax = plt.gca()
+        
+        # Draw all shapes without identifiers
+        shape_colors = plt.cm.viridis(np.linspace(0, 1, len(non_id_shapes)))
+        point_xy, point_colors = [], []
+        line_paths, line_colors = [], []
+        line_closed = []
+        
+        for shape_info, color in zip(non_id_shapes, shape_colors):
+            if shape_info['points'] is not None:
+                points = shape_info['points']
+                if shape_info['type'] == 'point':
+                    point_xy.append(points[0])
+                    point_colors.append(color)
+                else:
+                    line_paths.append(points)
+                    line_closed.append(shape_info.get('should_close'))
+                    line_colors.append(color)
+            elif shape_info['type'] == 'circle':
+                center = shape_info['center']
+                line_paths.append(circle_vertices(center[0], center[1], shape_info['radius']))
+                line_closed.append(False)
+                line_colors.append(color)
+        
+        draw_shapes_collection(ax, line_paths, line_colors, should_close=line_closed)
+        _scatter_points(ax, point_xy, point_colors)
+        
+        # Save the plot
+        non_id_dir = os.path.join(output_dir, "non_identifier_views")
+        os.makedirs(non_id_dir, exist_ok=True)
+        filename = f'non_identifier_platform_view.png'
+        output_path = os.path.join(non_id_dir, filename)
+        save_platform_figure(plt, output_path)
+        
+        return os.path.join("non_identifier_views", filename)
+        
+    except Exception as e:
+        print(f"Error creating non-identifier platform view: {str(e)}")
+        return None
+
+
+def _setup_identifier_platform_axes():
+    """Draw the parts of an identifier view that are the same for every identifier (boundary,
+    reference lines, labels, limits) on the thread's cached figure and return (fig, ax, cached).
+    The caller holds _PYPLOT_LOCK until the view is saved."""
+    import matplotlib.pyplot as plt
+    
+    # Reuse the thread's cached figure; it comes back cleared and current
+    fig, fig_cached = _get_cached_figure((15, 15))
+    ax = fig.gca()
+    
+    # Add standard platform elements
+    draw_platform_boundary(plt)
+    add_reference_lines(plt)
+    add_platform_labels(plt)
+    set_platform_limits(plt)
+    return fig, ax, fig_cached
+
+
+def _draw_identifier_shapes(ax, identifier, shapes_data):
+    """Draw one identifier's shapes and title onto ax and return the artists added, so a batch
+    can remove them again and keep the platform background for the next identifier"""
+    import matplotlib.pyplot as plt
+    
+    # Draw all shapes for this identifier
+    height_range = shapes_data['height_range']
+    total_shapes = shapes_data['count']
+    
+    shape_colors = plt.cm.viridis(np.linspace(0, 1, len(shapes_data['shapes'])))
+    point_xy, point_colors = [], []
+    line_paths, line_colors = [], []
+    line_closed = []
+    
+    for shape_info, color in zip(shapes_data['shapes'], shape_colors):
+        if shape_info['points'] is not None:
+            points = shape_info['points']
+            if shape_info['type'] == 'point':
+                point_xy.append(points[0])
+                point_colors.append(color)
+            else:
+                line_paths.append(points)
+                line_closed.append(shape_info.get('should_close'))
+                line_colors.append(color)
+        elif shape_info['type'] == 'circle':
+            center = shape_info['center']
+            line_paths.append(circle_vertices(center[0], center[1], shape_info['radius']))
+            line_closed.append(False)
+            line_colors.append(color)
+    
+    artists = [draw_shapes_collection(ax, line_paths, line_colors, should_close=line_closed),
+               _scatter_points(ax, point_xy, point_colors)]
+    
+    ax.set_title(f'Identifier {identifier} Platform View\n'
+                 f'Total Shapes: {total_shapes}\n'
+                 f'Height Range: {height_range[0]:.2f}mm to {height_range[1]:.2f}mm')
+    return [artist for artist in artists if artist is not None]
+
+
+def _save_identifier_platform_view(identifier, output_dir, close):
+    """Save the current identifier view and return its path relative to output_dir"""
+    import matplotlib.pyplot as plt
+    
+    identifier_dir = os.path.join(output_dir, "identifier_views")
+    os.makedirs(identifier_dir, exist_ok=True)
+    filename = f'identifier_{identifier}_platform_view.png'
+    output_path = os.path.join(identifier_dir, filename)
+    save_platform_figure(plt, output_path, close=close)
+    return os.path.join("identifier_views", filename)
+
+
+def create_identifier_platform_view(identifier, shapes_data, output_dir):
+    """Create a platform view showing all shapes for a specific identifier.
+    Successive calls draw into the same cached figure, so a loop over identifiers pays
+    the figure setup once; create_identifier_platform_view_batch also keeps the platform
+    background between identifiers."""
+    try:        
+        with _PYPLOT_LOCK:
+            fig, ax, fig_cached = _setup_identifier_platform_axes()
+            _draw_identifier_shapes(ax, identifier, shapes_data)
+            return _save_identifier_platform_view(identifier, output_dir, close=not fig_cached)
+        
+    except Exception as e:
+        print(f"Error creating identifier platform view for ID {identifier}: {str(e)}")
+        return None
+
+
+def create_identifier_platform_view_batch(identifiers, shapes_by_identifier, output_dir):
+    """Create the platform view of each identifier in turn on the one cached figure.
+    The boundary, reference lines, labels and limits are built once; only each identifier's
+    shapes and title are swapped between saves.
+    Returns {identifier: relative filename, or None if that view failed}."""
+    import matplotlib.pyplot as plt
+    
+    results = {identifier: None for identifier in identifiers}
+    if not identifiers:
+        return results
+    
+    with _PYPLOT_LOCK:
+        try:
+            fig, ax, fig_cached = _setup_identifier_platform_axes()
+        except Exception as e:
+            print(f"Error setting up identifier platform views: {str(e)}")
+            return results
+        
+        for identifier in identifiers:
+            artists = []
+            try:
+                artists = _draw_identifier_shapes(ax, identifier, shapes_by_identifier[identifier])
+                results[identifier] = _save_identifier_platform_view(identifier, output_dir, close=False)
+            except Exception as e:
+                print(f"Error creating identifier platform view for ID {identifier}: {str(e)}")
+            finally:
+                for artist in artists:
+                    artist.remove()
+        
+        if not fig_cached:
+            plt.close(fig)
+    return results
+
+
+def create_layer_pool(num_files):
+    """Return a spawn-context multiprocessing.Pool for parsing the layers of num_files CLF files,
+    or None when there are fewer than two files. The caller owns the pool: create it once around
+    a loop over heights, pass it to the views as pool=..., then close and join it. Spawned workers
+    do not inherit the caller's threads or locks, so this is safe from a threaded server too."""
+    if num_files < 2:
+        return None
+    return multiprocessing.get_context('spawn').Pool(processes=min(num_files, os.cpu_count() or 1))
+
+
+def _load_layer_points(path, height):
+    """Parse the layer at the given height from a CLF file into plain arrays, memoized so views
+    rendered at the same height parse each file once. Entries are keyed on the file's path, mtime
+    and size, so a rewritten CLF file is parsed again, and the cache only holds the most recent
+    height: asking for another height (or clear_layer_cache) drops the previous layers.
+    
+    Returns:
+        tuple: one (model_id, paths) entry per shape in layer order, where model_id is the shape's
+        model id (None if it has none) and paths is a tuple of read-only C-contiguous float32
+        point arrays; None if the file has no layer at that height
+    """
+    key = _layer_cache_key(path, height)
+    try:
+        return _LAYER_CACHE[key]
+    except KeyError:
+        pass
+    
+    layer_shapes = _parse_layer_points(path, height)
+    _LAYER_CACHE[key] = layer_shapes
+    return layer_shapes
+
+
+def _layer_cache_key(path, height):
+    """Key of a CLF file's layer in _LAYER_CACHE; moving to a new height drops the previous layers"""
+    global _LAYER_CACHE_HEIGHT
+    if height != _LAYER_CACHE_HEIGHT:
+        _LAYER_CACHE.clear()
+        _LAYER_CACHE_HEIGHT = height
+    
+    stat = os.stat(path)
+    return (path, height, stat.st_mtime_ns, stat.st_size)
+
+
+def _prefetch_layer_points(clf_files, height, pool=None):
+    """Fill the layer cache of this process for every CLF file at the given height, parsing the
+    files not cached yet on pool (see create_layer_pool). Workers only parse; the views then read
+    the cached arrays here, so later views at the same height parse nothing. Without a pool, or
+    with a single file left to parse, _load_layer_points parses in-line on first use instead.
+    Files whose parse fails in a worker are not cached, so the in-line load reports the error."""
+    if pool is None:
+        return
+    
+    missing = []
+    for clf_info in clf_files:
+        try:
+            key = _layer_cache_key(clf_info['path'], height)
+        except OSError:
+            continue  # Reported when the view loads the file
+        if key not in _LAYER_CACHE:
+            missing.append(key)
+    if len(missing) < 2:
+        return
+    
+    try:
+        results = pool.map(_parse_layer_points_args, [(key[0], height) for key in missing])
+    except Exception as e:
+        print(f"Parallel CLF parsing failed at height {height}mm, parsing files in-line: {str(e)}")
+        return
+    
+    for key, (parsed, layer_shapes) in zip(missing, results):
+        if not parsed:
+            continue
+        # Arrays unpickled from a worker come back writeable; the cache shares them read-only
+        for model_id, paths in (layer_shapes or ()):
+            for points in paths:
+                points.setflags(write=False)
+        _LAYER_CACHE[key] = layer_shapes
+
+
+def clear_layer_cache():
+    """Drop the layers memoized by _load_layer_points, e.g. once a height has been rendered"""
+    global _LAYER_CACHE_HEIGHT
+    _LAYER_CACHE.clear()
+    _LAYER_CACHE_HEIGHT = None
+
+
+def _parse_layer_points_args(args):
+    """_parse_layer_points taking (path, height) as one tuple, for Pool.map.
+    Returns (True, layer) or (False, None) if the file could not be parsed."""
+    try:
+        return True, _parse_layer_points(*args)
+    except Exception:
+        return False, None
+
+
+def _parse_layer_points(path, height):
+    """Uncached body of _load_layer_points"""
+    part = CLFFile(path)
+    if not hasattr(part, 'box'):
+        return None
+        
+    layer = part.find(height)
+    if layer is None or not hasattr(layer, 'shapes'):
+        return None
+    
+    layer_shapes = []
+    for shape in layer.shapes:
+        try:
+            model_id = shape.model.id
+        except AttributeError:
+            model_id = None
+        
+        paths = []
+        for points in (getattr(shape, 'points', None) or []):
+            # CLF coordinates are 4-byte floats, so float32 is lossless
+            points = np.ascontiguousarray(points, dtype=np.float32)
+            points.setflags(write=False)  # Shared between callers through the cache
+            paths.append(points)
+        layer_shapes.append((model_id, tuple(paths)))
+    
+    return tuple(layer_shapes)
+
+
+def _extract_layer_shapes(clf_info, height):
+    """Load the layer at the given height from a single CLF file and return its point arrays.
+    
+    Returns:
+        tuple: (clf_info, list of C-contiguous float32 (N, 2) point arrays)
+    """
+    layer_points = []
+    try:
+        layer_shapes = _load_layer_points(clf_info['path'], height)
+        if layer_shapes is None:
+            return clf_info, layer_points
+            
+        for model_id, paths in layer_shapes:
+            if not paths:
+                continue
+            points = paths[0]
+            if points.ndim == 2 and points.shape[1] >= 2:
+                layer_points.append(points)
+        
+    except Exception as e:
+        print(f"Error processing {clf_info['name']} for platform view: {str(e)}")
+    
+    return clf_info, layer_points
+
+
+def _extract_all_layer_shapes(clf_files, height, pool=None):
+    """Extract the layer shapes of every CLF file, parsing the files on pool (see create_layer_pool).
+    CLF parsing is mostly pure-Python work that holds the GIL, so separate processes are used when
+    the caller passes a pool; without one the files are parsed in-line. Either way the layers land
+    in this process's layer cache. Results keep the clf_files order so the drawing z-order stays
+    deterministic."""
+    _prefetch_layer_points(clf_files, height, pool)
+    return [_extract_layer_shapes(clf_info, height) for clf_info in clf_files]
+
+
+def create_platform_composite_with_folders(clf_files, output_dir, height=1.0, fill_closed=False, create_transparent_png=False,
+                                           pool=None):
+    """Create a composite view with unique colors per folder and a legend.
+    CLF files are parsed on pool (see create_layer_pool) when one is given, else in-line."""    
+    import matplotlib.pyplot as plt
+    # Create figure
+    setup_platform_figure()
+    ax = plt.gca()
+    
+    # Get unique folders and assign colors using a colormap
+    folders = sorted(list(set(clf_info['folder'] for clf_info in clf_files)))
+    colors = plt.cm.tab20(np.linspace(0, 1, len(folders)))  # Use tab20 for distinct colors
+    folder_colors = {folder: tuple(map(float, rgba)) for folder, rgba in zip(folders, colors)}
+    
+    # Add standard platform elements
+    draw_platform_boundary(plt)
+    add_reference_lines(plt)
+    
+    # Track which folders we've seen for legend
+    folders_seen = set()
+    
+    # Collect all shapes to reuse in transparent version
+    all_shapes = []
+    
+    # Closed shapes are batched into one PolyCollection after the loop, open ones into a LineCollection
+    closed_verts, closed_colors = [], []
+    line_paths, line_colors, line_closed = [], [], []
+    point_xy, point_colors = [], []
+    legend_handles = []
+    
+    # Parse the CLF files on the caller's pool, then draw in this process (pyplot is not process-safe)
+    for clf_info, layer_points in _extract_all_layer_shapes(clf_files, height, pool=pool):
+        folder = clf_info['folder']
+        color = folder_colors[folder]
+        
+        for points in layer_points:
+            # Closure is tested once here and reused by both drawings
+            should_close = should_close_path(points)
+            
+            # Both drawings only read the points, so the transparent copy shares the read-only cached array
+            all_shapes.append((points, color, folder, should_close))
+            
+            # Draw shape with folder's color
+            if fill_closed and should_close:
+                closed_verts.append(points)
+                closed_colors.append(color)
+            elif len(points) >= 2:
+                line_paths.append(points)
+                line_colors.append(color)
+                line_closed.append(should_close)
+            elif len(points) == 1:
+                point_xy.append(points[0])
+                point_colors.append(color)
+                
+            # Add to legend (only once per folder)
+            if folder not in folders_seen:
+                legend_handles.append(Line2D([], [], color=color, label=folder))
+                folders_seen.add(folder)
+    
+    _add_polygon_collection(ax, closed_verts, closed_colors, closed_colors)
+    draw_shapes_collection(ax, line_paths, line_colors, should_close=line_closed)
+    _scatter_points(ax, point_xy, point_colors)
+    
+    plt.title(f'Platform Composite View at Height {height}mm')
+    add_platform_labels(plt)
+    set_platform_limits(plt)
+    
+    # Create legend with folder names
+    boundary_handles, _ = ax.get_legend_handles_labels()
+    plt.legend(handles=boundary_handles + legend_handles, 
+               bbox_to_anchor=(1.05, 1), loc='upper left', borderaxespad=0.)
+    
+    filename = f'platform_composite_folders_{height}mm.png'
+    output_path = os.path.join(output_dir, "composite_platforms", filename)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    save_platform_figure(plt, output_path)
+    
+    # Create transparent version only if enabled
+    if create_transparent_png:
+        create_transparent_composite_folders(all_shapes, output_dir, height, fill_closed)
+    
+    return os.path.join("composite_platforms", filename)
+
+
+def create_transparent_composite_folders(shapes, output_dir, height, fill_closed=False, dpi=100, backend='pillow'):
+    """Create a transparent composite view with paths from all folders without chart elements.
+    shapes holds (points, color, folder, should_close) tuples as collected by
+    create_platform_composite_with_folders.
+    The overlay is 15in square, so the default dpi=100 gives a 1500x1500px PNG.
+    It is rasterized with Pillow by default; backend='matplotlib' renders it through a figure instead."""
+    try:
+        # Sort the shapes into filled polygons, lines and single points
+        closed_verts, closed_colors = [], []
+        line_paths, line_colors, line_closed = [], [], []
+        point_xy, point_colors = [], []
+        for points, color, folder, should_close in shapes:
+            if fill_closed and should_close:
+                closed_verts.append(points)
+                closed_colors.append(color)
+            elif len(points) >= 2:
+                line_paths.append(points)
+                line_colors.append(color)
+                line_closed.append(should_close)
+            elif len(points) == 1:
+                point_xy.append(points[0])
+                point_colors.append(color)
+        
+        filename = f'transparent_composite_folders_{height}mm.png'
+        output_path = os.path.join(output_dir, "composite_platforms", filename)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        
+        if backend == 'matplotlib':
+            # Transparent 15in figure with the axes filling it; closed shapes go into one
+            # PolyCollection and the rest into a LineCollection
+            fig, ax = _transparent_platform_axes((15, 15))
+            _add_polygon_collection(ax, closed_verts, closed_colors, closed_colors, rasterized=True)
+            draw_shapes_collection(ax, line_paths, line_colors, should_close=line_closed, rasterized=True)
+            _scatter_points(ax, point_xy, point_colors)
+            _save_fig_fast(fig, output_path, dpi=dpi)
+        else:
+            # Same alphas as the matplotlib artists: 0.5 for filled shapes, 0.7 for lines and points
+            _rasterize_paths_to_png(line_paths, _rgba_u8(line_colors, alpha=0.7),
+                                    np.asarray(point_xy).reshape(-1, 2), _rgba_u8(point_colors, alpha=0.7),
+                                    [], [], size_px=15 * dpi, output_path=output_path,
+                                    width=max(1, round(0.5 * dpi / 72)), path_should_close=line_closed,
+                                    polygons=closed_verts, polygon_colors=_rgba_u8(closed_colors, alpha=0.5))
+        
+        print(f"Created transparent composite folders view at: {output_path}")
+        return os.path.join("composite_platforms", filename)
+        
+    except Exception as e:
+        print(f"Error creating transparent composite folders view: {str(e)}")
+        return None
+
+
+def create_platform_composite(clf_files, output_dir, height=1.0, fill_closed=False, pool=None):
+    """Create a composite view of all shapes at specified height.
+    CLF files are parsed on pool (see create_layer_pool) when one is given, else in-line."""
+    import matplotlib.pyplot as plt
+
+    # Create a standard platform view with title
+    title = f'Platform Composite View at Height {height}mm'
+    setup_standard_platform_view(title)
+    ax = plt.gca()
+    
+    colors = _CLF_COLORS
+    
+    shapes_found = False
+    closed_verts, closed_edge_colors = [], []
+    line_paths, line_colors, line_closed = [], [], []
+    point_xy, point_colors = [], []
+    legend_handles = []
+    # Parse the CLF files on the caller's pool, then draw in this process (pyplot is not process-safe)
+    for clf_info, layer_points in _extract_all_layer_shapes(clf_files, height, pool=pool):
+        color = colors.get(clf_info['name'], 'gray')
+        
+        for points in layer_points:
+            # Check if shape should be closed
+            should_close = should_close_path(points)
+            if fill_closed and should_close:
+                # Filled shapes are drawn together in one PolyCollection below
+                closed_verts.append(points)
+                closed_edge_colors.append(color)
+            elif len(points) >= 2:
+                # Unfilled shapes are drawn together in one LineCollection below
+                line_paths.append(points)
+                line_colors.append(color)
+                line_closed.append(should_close)
+            elif len(points) == 1:
+                point_xy.append(points[0])
+                point_colors.append(color)
+                
+            if not shapes_found:
+                legend_handles.append(Line2D([], [], color=color, label=clf_info['name']))
+                shapes_found = True
+    
+    _add_polygon_collection(ax, closed_verts, 'black', closed_edge_colors)
+    draw_shapes_collection(ax, line_paths, line_colors, should_close=line_closed)
+    _scatter_points(ax, point_xy, point_colors)
+    
+    # Add legend
+    handles, labels = ax.get_legend_handles_labels()
+    by_label = dict(zip(labels, handles))
+    by_label.update((handle.get_label(), handle) for handle in legend_handles)
+    plt.legend(by_label.values(), by_label.keys())
+    
+    # Save figure
+    filename = f'platform_composite_{height}mm.png'
+    output_path = os.path.join(output_dir, "composite_platforms", filename)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    save_platform_figure(plt, output_path)
+    
+    return os.path.join("composite_platforms", filename)
+
+
+def process_layer_data(clf_info, height, colors, fill_closed=True):
+    """Helper function to process a single layer and extract shape data.
+    Used by create_clean_platform on the cached layer of each file; fill_closed is recorded on every shape.
+    Now includes hole detection using Shape[1] Path[0] logic exactly as in baseline_visualization_test_v2.py."""
+    shape_data_list = []
+    
+    try:
+        shapes = _load_layer_points(clf_info['path'], height)
+        if shapes is None:
+            return shape_data_list
+            
+        if shapes:
+            print(f"    Found {len(shapes)} shapes in layer at {height}mm for {clf_info['name']}")
+            
+            # Check if this folder can contain holes (must contain "Skin" in folder name)
+            folder_name = clf_info['folder']
+            can_have_holes = 'Skin' in folder_name
+            color = colors.get(clf_info['name'], 'gray')
+            
+            # Validate every path first; the layer cache hands out float32 ndarrays, so only the shape needs checking
+            candidates = []
+            for i, (shape_identifier, shape_paths) in enumerate(shapes):
+                for path_idx, points in enumerate(shape_paths):
+                    if points.ndim == 2 and points.shape[0] >= 3 and points.shape[1] >= 2:
+                        candidates.append((i, path_idx, points))
+            
+            # Closure test for all paths in one (numba-parallel when available) kernel call
+            should_close_mask = []
+            if candidates:
+                offsets = np.zeros(len(candidates) + 1, dtype=np.int64)
+                np.cumsum([len(points) for _, _, points in candidates], out=offsets[1:])
+                verts = np.concatenate([points[:, :2] for _, _, points in candidates])
+                should_close_mask, _, _ = process_shapes(verts, offsets)
+                should_close_mask = should_close_mask.tolist()
+            
+            # Process each path in the layer using the exact logic from baseline_visualization_test_v2.py
+            for (i, path_idx, points), should_close in zip(candidates, should_close_mask):
+                shape_identifier, shape_paths = shapes[i]
+                
+                # Create unique identifier for this path
+                path_id = f"{shape_identifier}_path_{path_idx}" if shape_identifier else f"shape_{i}_path_{path_idx}"
+                
+                # Determine if this path is a hole using exact logic from baseline_visualization_test_v2.py:
+                # Holes are Shape[1] Path[0] (second shape, first path) in files with at least 2 shapes
+                # AND the folder must contain "Skin"
+                is_hole = (i == 1 and path_idx == 0 and len(shapes) >= 2 and can_have_holes)
+                
+                if is_hole:
+                    print(f"  Found hole: Shape[1] Path[0] with {len(points)} points in {folder_name}")
+                
+                # Create shape data for this path
+                shape_data = {
+                    'type': 'path',
+                    'shape_type': 'interior' if is_hole else 'exterior',
+                    'points': points,  # Read-only float32 ndarray shared via the layer cache
+                    'color': color,
+                    'clf_name': clf_info['name'],
+                    'clf_folder': clf_info['folder'],
+                    'fill_closed': fill_closed,
+                    'should_close': should_close,
+                    'identifier': path_id,
+                    'parent_shape_id': f"{shape_identifier}_path_0" if is_hole else None,
+                    'parent_shape_index': 0 if is_hole else None,  # Parent is Shape[0]
+                    'is_hole': is_hole,
+                    'path_index': path_idx,
+                    'shape_index': i,
+                    'total_paths_in_shape': len(shape_paths)
+                }
+                shape_data_list.append(shape_data)
+
+            # Count holes found using the exact same logic
+            holes_found = sum(1 for shape in shape_data_list if shape.get('is_hole', False))
+            print(f"  Processed {len(shapes)} shapes, found {holes_found} holes in {clf_info['name']}")
+                        
+    except Exception as e:
+        print(f"Error processing {clf_info['name']} at height {height}mm: {str(e)}")
+        import traceback
+        traceback.print_exc()
+    
+    return shape_data_list
+
+
+def _process_all_layer_data(clf_files, height, colors, fill_closed=True, pool=None):
+    """Run process_layer_data for every CLF file and return all their shape data in clf_files order.
+    Files are independent, so they are parsed on pool (see create_layer_pool) when one is given;
+    the shape data is then built here from the layer cache. Without a pool files are parsed in-line."""
+    _prefetch_layer_points(clf_files, height, pool)
+    
+    results = []
+    for clf_info in clf_files:
+        try:
+            results.append(process_layer_data(clf_info, height, colors, fill_closed))
+        except Exception as e:
+            print(f"Error processing {clf_info['name']} at height {height}mm: {str(e)}")
+    
+    return [shape_data for result in results for shape_data in result]
+
+
+def build_shape_columns(shapes):
+    """
+    Split an identifier's shape_info dicts into per-kind numpy columns for batched drawing
+    
+    Args:
+        shapes: list of shape_info dicts as stored in shapes_by_identifier[identifier]['shapes']
+        
+    Returns:
+        dict: 'path_points' (list of (N, 2) arrays, N >= 2), 'path_should_close' (the stored
+        closure flag of each path, None where ingest did not record one), 'point_xy' (M, 2),
+        'circle_centers' (K, 2), 'circle_radii' (K,) and 'num_shapes' (len(shapes))
+    """
+    path_points, path_should_close, point_xy, circle_centers, circle_radii = [], [], [], [], []
+    for shape_info in shapes:
+        points = shape_info['points']
+        if points is not None:
+            if shape_info['type'] == 'point' or len(points) < 2:
+                point_xy.append(points[0, :2])
+            else:
+                path_points.append(points)
+                path_should_close.append(shape_info.get('should_close'))
+        elif shape_info['type'] == 'circle':
+            circle_centers.append(shape_info['center'])
+            circle_radii.append(shape_info['radius'])
+    
+    return {
+        'path_points': path_points,
+        'path_should_close': path_should_close,
+        'point_xy': np.asarray(point_xy, dtype=float).reshape(-1, 2),
+        'circle_centers': np.asarray(circle_centers, dtype=float).reshape(-1, 2),
+        'circle_radii': np.asarray(circle_radii, dtype=float),
+        'num_shapes': len(shapes)
+    }
+
+
+class ShapeBatch:
+    """
+    Structure-of-arrays form of a layer's shape dicts for batched drawing
+    
+    Shape i's vertices are verts[offsets[i]:offsets[i + 1]]; the per-shape columns
+    (type_code, color_idx, should_close, identifier) are indexed the same way.
+    Circles are tessellated with circle_vertices so every shape is a polyline.
+    """
+    PATH, POINT, CIRCLE, INVALID = 0, 1, 2, 3
+    
+    def __init__(self, verts, offsets, type_code, color_idx, should_close, palette, identifier):
+        self.verts = verts                  # (N, 2) float32
+        self.offsets = offsets              # (M + 1,) int32
+        self.type_code = type_code          # (M,) int8
+        self.color_idx = color_idx          # (M,) int32, indexes palette
+        self.should_close = should_close    # (M,) bool
+        self.palette = palette
+        self.identifier = identifier        # list of M identifier strings
+    
+    def __len__(self):
+        return len(self.type_code)
+    
+    @property
+    def lengths(self):
+        return np.diff(self.offsets)
+    
+    @functools.cached_property
+    def bbox(self):
+        """(M, 4) per-shape bounding boxes as x_min, y_min, x_max, y_max (NaN for empty shapes),
+        computed for the whole batch in one process_shapes call"""
+        return process_shapes(self.verts, self.offsets)[2]
+    
+    def on_platform(self, half_size=PLATFORM_HALF_SIZE_MM):
+        """Boolean mask of the shapes whose bounding box overlaps the +-half_size platform square"""
+        bbox = self.bbox
+        return ~((bbox[:, 2] < -half_size) | (bbox[:, 0] > half_size) | 
+                 (bbox[:, 3] < -half_size) | (bbox[:, 1] > half_size))
+    
+    def segments(self, mask=None):
+        """Return the vertex views of every shape, or of the shapes selected by a boolean mask"""
+        indices = range(len(self)) if mask is None else np.flatnonzero(mask)
+        return [self.verts[self.offsets[i]:self.offsets[i + 1]] for i in indices]
+    
+    def simplified(self, tolerance, min_points=8, mask=None):
+        """Return a batch whose paths of at least min_points vertices (and selected by mask, if given)
+        are Douglas-Peucker simplified to tolerance (see simplify_path). Only verts and offsets are
+        rebuilt; the other columns, including the closure flags of the original paths, are shared."""
+        lengths = self.lengths
+        simplify = (self.type_code == self.PATH) & (lengths >= min_points)
+        if mask is not None:
+            simplify &= mask
+        chunks = []
+        offsets = np.zeros_like(self.offsets)
+        for i in range(len(self)):
+            points = self.verts[self.offsets[i]:self.offsets[i + 1]]
+            if simplify[i]:
+                points = simplify_path(points, tolerance).astype(np.float32)
+            chunks.append(points)
+            offsets[i + 1] = offsets[i] + len(points)
+        
+        verts = np.concatenate(chunks) if chunks else np.empty((0, 2), dtype=np.float32)
+        return ShapeBatch(verts, offsets, self.type_code, self.color_idx, self.should_close, 
+                          self.palette, self.identifier)
+    
+    @classmethod
+    def from_shape_data(cls, shape_data_list):
+        """Build a batch from shape dicts as produced by process_layer_data"""
+        type_codes = {'path': cls.PATH, 'point': cls.POINT, 'circle': cls.CIRCLE}
+        num_shapes = len(shape_data_list)
+        
+        chunks = []
+        offsets = np.zeros(num_shapes + 1, dtype=np.int32)
+        type_code = np.full(num_shapes, cls.INVALID, dtype=np.int8)
+        color_idx = np.zeros(num_shapes, dtype=np.int32)
+        should_close = np.zeros(num_shapes, dtype=bool)
+        palette, palette_index, identifier = [], {}, []
+        
+        for i, shape_data in enumerate(shape_data_list):
+            code = type_codes.get(shape_data.get('type'), cls.INVALID)
+            if code == cls.CIRCLE:
+                center = shape_data['center']
+                points = circle_vertices(center[0], center[1], shape_data['radius'])
+            else:
+                points = shape_data.get('points')
+            
+            if points is None or len(points) == 0:
+                code = cls.INVALID
+                num_verts = 0
+            else:
+                chunks.append(np.asarray(points, dtype=np.float32)[:, :2])
+                num_verts = len(points)
+            
+            color = shape_data.get('color')
+            if color not in palette_index:
+                palette_index[color] = len(palette)
+                palette.append(color)
+            
+            offsets[i + 1] = offsets[i] + num_verts
+            type_code[i] = code
+            color_idx[i] = palette_index[color]
+            should_close[i] = bool(shape_data.get('should_close', False))
+            identifier.append(shape_data.get('identifier'))
+        
+        # One allocation for all vertices
+        verts = np.concatenate(chunks) if chunks else np.empty((0, 2), dtype=np.float32)
+        return cls(verts, offsets, type_code, color_idx, should_close, palette, identifier)
+
+
+def _get_shape_columns(shapes_data):
+    """Return the columns attached at ingest, rebuilding them if missing or stale"""
+    columns = shapes_data.get('columns')
+    if columns is None or columns['num_shapes'] != len(shapes_data['shapes']) or 'path_should_close' not in columns:
+        columns = build_shape_columns(shapes_data['shapes'])
+        shapes_data['columns'] = columns
+    return columns
+
+
+# Fixed-point step of quantize='int16' path data: 0.01mm, so int16 covers +-327.67mm
+_POINTS_INT16_SCALE = 0.01
+
+# 'format' value of the columnar path-data JSON; bump it when the layout changes
+_PATH_DATA_FORMAT = 'columns-v1'
+
+
+def _quantize_points(points, quantize):
+    """Points as the ndarray written to the path-data JSON for the given quantize mode"""
+    if quantize is None:
+        return np.ascontiguousarray(points, dtype=np.float64)
+    if quantize == 'float32':
+        return np.ascontiguousarray(points, dtype=np.float32)
+    if quantize == 'int16':
+        scaled = np.rint(np.asarray(points, dtype=np.float64) / _POINTS_INT16_SCALE)
+        if scaled.size and np.abs(scaled).max() > np.iinfo(np.int16).max:
+            raise ValueError("Path coordinates exceed the int16 range of quantize='int16'")
+        return scaled.astype(np.int16)
+    raise ValueError(f"Unknown quantize mode: {quantize}")
+
+
+def shape_data_to_columns(shape_data_list, quantize=None):
+    """
+    Convert a list of shape dicts into columnar form for the path-data JSON
+    
+    Args:
+        shape_data_list: list of shape dicts as produced by process_layer_data
+        quantize: None keeps points as float64 (exactly the float32 CLF values, written with
+            float64 digits); 'float32' writes them with the shortest float32 digits (orjson
+            only); 'int16' stores integer multiples of points_scale (0.01mm)
+        
+    Returns:
+        dict: {'format': 'columns-v1', 'palette': [color, ...], 'columns': {field: [value per
+        shape, ...]}}, plus 'points_scale' when quantize='int16'.
+        Colors are stored once in the palette and referenced by 'color_idx'; fields a
+        shape does not have (e.g. 'radius' for paths) are None in its row.
+    """
+    fields = []
+    for shape_data in shape_data_list:
+        for field in shape_data:
+            if field not in fields:
+                fields.append(field)
+    
+    palette = []
+    palette_index = {}
+    columns = {('color_idx' if field == 'color' else field): [] for field in fields}
+    for shape_data in shape_data_list:
+        for field in fields:
+            value = shape_data.get(field)
+            if field == 'color':
+                if value not in palette_index:
+                    palette_index[value] = len(palette)
+                    palette.append(value)
+                columns['color_idx'].append(palette_index[value])
+            elif field == 'points' and value is not None:
+                columns['points'].append(_quantize_points(value, quantize))
+            else:
+                columns[field].append(value)
+    
+    data = {'format': _PATH_DATA_FORMAT, 'palette': palette, 'columns': columns}
+    if quantize == 'int16':
+        data['points_scale'] = _POINTS_INT16_SCALE
+    return data
+
+
+def columns_to_shape_data(data):
+    """Rebuild the list of shape dicts from columnar path data (inverse of shape_data_to_columns).
+    For consumers that still expect one dict per shape; missing fields come back as None.
+    int16-quantized points are scaled back to mm as float arrays. Raises ValueError for
+    data in any other format than the one shape_data_to_columns writes."""
+    if data.get('format') != _PATH_DATA_FORMAT:
+        raise ValueError(f"Unsupported path data format: {data.get('format')!r}")
+    palette = data['palette']
+    columns = data['columns']
+    points_scale = data.get('points_scale')
+    num_shapes = len(next(iter(columns.values()), []))
+    
+    shape_data_list = []
+    for i in range(num_shapes):
+        shape_data = {}
+        for field, values in columns.items():
+            if field == 'color_idx':
+                shape_data['color'] = palette[values[i]]
+            elif field == 'points' and points_scale is not None and values[i] is not None:
+                shape_data['points'] = np.asarray(values[i], dtype=np.float64) * points_scale
+            else:
+                shape_data[field] = values[i]
+        shape_data_list.append(shape_data)
+    return shape_data_list
+
+
+def is_shape_inside_shape(inner_points, outer_points, inner_bbox=None, outer_bbox=None):
+    """
+    Check if inner_points shape is geometrically contained within outer_points shape
+    
+    Args:
+        inner_points: numpy array or list of points for the inner shape
+        outer_points: numpy array or list of points for the outer shape
+        inner_bbox: optional precomputed (xmin, ymin, xmax, ymax) of the inner shape
+        outer_bbox: optional precomputed (xmin, ymin, xmax, ymax) of the outer shape
+        
+    Returns:
+        bool: True if inner shape is inside outer shape
+    """
+    try:
+        # Convert to numpy arrays if they're lists
+        if isinstance(inner_points, list):
+            inner_points = np.array(inner_points)
+        if isinstance(outer_points, list):
+            outer_points = np.array(outer_points)
+        
+        # Hand stride-friendly memory to matplotlib's Path (avoids a hidden copy)
+        inner_points = np.ascontiguousarray(inner_points)
+        outer_points = np.ascontiguousarray(outer_points)
+        
+        # Ensure we have valid 2D arrays
+        if inner_points.ndim != 2 or outer_points.ndim != 2:
+            return False
+        if inner_points.shape[1] != 2 or outer_points.shape[1] != 2:
+            return False
+        if len(inner_points) == 0 or len(outer_points) == 0:
+            return False
+        
+        # Disjoint bounding boxes cannot contain each other
+        if inner_bbox is not None and outer_bbox is not None:
+            if (inner_bbox[0] > outer_bbox[2] or inner_bbox[2] < outer_bbox[0] or
+                    inner_bbox[1] > outer_bbox[3] or inner_bbox[3] < outer_bbox[1]):
+                return False
+        
+        # Check if all points of the inner shape are inside the outer path
+        # We'll check a few sample points to be efficient
+        num_samples = min(10, len(inner_points))
+        if num_samples <= 1:
+            sample_points = inner_points
+        else:
+            # Same evenly spaced indices as linspace(..., dtype=int), without the float temporary
+            sample_indices = np.arange(num_samples) * (len(inner_points) - 1) // (num_samples - 1)
+            sample_points = inner_points[sample_indices]
+        
+        # A sample outside the outer bounding box is outside the shape, so too few samples
+        # in the box rules the pair out before building the Path
+        if outer_bbox is not None:
+            in_box = ((sample_points[:, 0] >= outer_bbox[0]) & (sample_points[:, 0] <= outer_bbox[2]) &
+                      (sample_points[:, 1] >= outer_bbox[1]) & (sample_points[:, 1] <= outer_bbox[3]))
+            if in_box.mean() < 0.8:
+                return False
+        
+        # Create a path from the outer shape
+        outer_path = Path(outer_points)
+        
+        # All sample points should be inside (allowing for edge cases)
+        inside_checks = outer_path.contains_points(sample_points)
+        
+        # Return True if most points are inside (allowing for edge cases)
+        return bool(inside_checks.mean() >= 0.8)
+        
+    except Exception as e:
+        print(f"Error in geometric containment check: {e}")
+        return False
+
+
+def create_transparent_paths_view(shapes_by_identifier, output_dir, dpi=100, backend='pillow'):
+    """Create a transparent PNG with just the path data from all identifiers, without any chart elements.
+    The overlay is 15in square, so the default dpi=100 gives a 1500x1500px PNG.
+    It is rasterized with Pillow by default; backend='matplotlib' renders it through a figure instead."""
+    try:
+        # Skip the 'no_identifier' key if it exists
+        identifiers = [id for id in shapes_by_identifier.keys() if id != 'no_identifier']
+        
+        if not identifiers:
+            print("No identifiers found for transparent paths view")
+            return None
+            
+        # One float32 RGBA row per identifier; integer input indexes the tab10 table directly
+        colors = matplotlib.colormaps['tab10'](np.arange(len(identifiers)) % 10).astype(np.float32)
+        
+        identifier_dir = os.path.join(output_dir, "identifier_views")
+        os.makedirs(identifier_dir, exist_ok=True)
+        filename = f'transparent_all_pathdata.png'
+        output_path = os.path.join(identifier_dir, filename)
+        
+        paths_by_id, closed_by_id = [], []
+        point_xy, point_color_idx = [], []
+        circles, circle_color_idx = [], []
+        
+        # Gather each identifier's precomputed shape columns
+        for id_idx, identifier in enumerate(identifiers):
+            columns = _get_shape_columns(shapes_by_identifier[identifier])
+            paths_by_id.append(columns['path_points'])
+            closed_by_id.append(columns['path_should_close'])
+            
+            point_xy.append(columns['point_xy'])
+            point_color_idx.append(np.full(len(columns['point_xy']), id_idx))
+            circles.extend(zip(columns['circle_centers'], columns['circle_radii']))
+            circle_color_idx.extend([id_idx] * len(columns['circle_radii']))
+        
+        point_xy = np.concatenate(point_xy)
+        point_color_idx = np.concatenate(point_color_idx)
+        
+        if backend == 'matplotlib':
+            # Transparent 15in figure with the axes filling it
+            fig, ax = _transparent_platform_axes((15, 15))
+            
+            # One artist per identifier color instead of one per shape; plain float tuples are
+            # hashable, so matplotlib's color cache skips re-parsing them
+            identifier_colors = [tuple(map(float, rgba)) for rgba in colors]
+            for id_idx, identifier_paths in enumerate(paths_by_id):
+                draw_shapes_batched(ax, identifier_paths, identifier_colors[id_idx], 
+                                    should_close=closed_by_id[id_idx], rasterized=True)
+            
+            _scatter_points(ax, point_xy, colors[point_color_idx])
+            _add_circle_collection(ax, circles, colors[circle_color_idx])
+            
+            # Save the transparent plot
+            _save_fig_fast(fig, output_path, dpi=dpi)
+        else:
+            # 8-bit RGBA per identifier, converted once for the whole overlay
+            colors_u8 = _rgba_u8(colors, alpha=0.7)
+            path_colors = [colors_u8[id_idx] for id_idx, paths in enumerate(paths_by_id) for _ in paths]
+            _rasterize_paths_to_png([p for paths in paths_by_id for p in paths], path_colors,
+                                    point_xy, [colors_u8[i] for i in point_color_idx],
+                                    circles, [colors_u8[i] for i in circle_color_idx],
+                                    size_px=15 * dpi, output_path=output_path, width=max(1, round(0.5 * dpi / 72)),
+                                    path_should_close=[flag for flags in closed_by_id for flag in flags])
+        
+        # ALSO create a 2100x2100 version
+        create_transparent_paths_view_2100px(shapes_by_identifier, output_dir, backend=backend)
+        
+        print(f"Created transparent paths view at: {output_path}")
+        return os.path.join("identifier_views", filename)
+        
+    except Exception as e:
+        print(f"Error creating transparent paths view: {str(e)}")
+        return None
+        
+
+def create_transparent_paths_view_2100px(shapes_by_identifier, output_dir, backend='pillow'):
+    """Create a 2100x2100 transparent PNG with just the path data from all identifiers, without chart elements.
+    Rasterized with Pillow by default; backend='matplotlib' renders it through a figure instead."""
+    try:
+        print(f"\n=== DEBUGGING create_transparent_paths_view_2100px ===")
+        
+        # Debug: Show all keys in shapes_by_identifier
+        all_keys = list(shapes_by_identifier.keys())
+        print(f"All keys in shapes_by_identifier: {all_keys}")
+        
+        # Check if 'no_identifier' exists and what it contains
+        if 'no_identifier' in shapes_by_identifier:
+            no_id_data = shapes_by_identifier['no_identifier']
+            print(f"'no_identifier' contains {no_id_data.get('count', 0)} shapes")
+            print(f"'no_identifier' height range: {no_id_data.get('height_range', 'unknown')}")
+        else:
+            print("'no_identifier' key not found in data")
+        
+        # Skip the 'no_identifier' key if it exists
+        identifiers = [id for id in shapes_by_identifier.keys() if id != 'no_identifier']
+        print(f"Identifiers after filtering 'no_identifier': {identifiers}")
+        
+        # ALSO track shapes without identifiers
+        no_identifier_shapes = shapes_by_identifier.get('no_identifier', {}).get('shapes', [])
+        print(f"Number of shapes without identifiers: {len(no_identifier_shapes)}")
+        
+        if not identifiers:
+            print("No identifiers found for 2500px transparent paths view")
+            # But let's still check if we should draw 'no_identifier' shapes
+            if no_identifier_shapes:
+                print(f"WARNING: Found {len(no_identifier_shapes)} shapes without identifiers that are being excluded!")
+            return None
+            
+        # One float32 RGBA row per identifier; integer input indexes the tab10 table directly
+        colors = matplotlib.colormaps['tab10'](np.arange(len(identifiers)) % 10).astype(np.float32)
+        print(f"Generated colors for {len(identifiers)} identifiers")
+        
+        # Tracking variables
+        total_shapes_processed = 0
+        total_paths_drawn = 0
+        total_circles_drawn = 0
+        shapes_with_null_points = 0
+        point_type_shapes = 0
+        other_type_shapes = 0
+        paths_by_id, closed_by_id = [], []
+        point_xy, point_color_idx = [], []
+        circles, circle_color_idx = [], []
+        
+        # Gather each identifier's shapes; they are drawn in one go once the summary is printed
+        for id_idx, identifier in enumerate(identifiers):
+            shapes_data = shapes_by_identifier[identifier]
+            identifier_paths, identifier_closed = [], []
+            print(f"\n--- Processing identifier: {identifier} ---")
+            print(f"  Shapes data keys: {shapes_data.keys()}")
+            print(f"  Number of shapes: {shapes_data.get('count', 'unknown')}")
+            
+            height_range = shapes_data.get('height_range', [0, 0])
+            print(f"  Height range: {height_range[0]:.2f} to {height_range[1]:.2f} mm")
+            
+            # Check if this identifier covers the problematic 141.3mm height
+            if height_range[1] >= 141.0:
+                print(f"  *** This identifier SHOULD include shapes around 141.3mm! ***")
+            
+            shapes_list = shapes_data.get('shapes', [])
+            print(f"  Actual shapes list length: {len(shapes_list)}")
+            
+            # Sample a few shapes to show their heights
+            if len(shapes_list) > 0:
+                print(f"  Sample shape heights:")
+                for i in range(min(3, len(shapes_list))):
+                    shape_height = shapes_list[i].get('height', 'unknown')
+                    print(f"    Shape {i}: height = {shape_height}")
+            
+            identifier_paths_drawn = 0
+            identifier_circles_drawn = 0
+            identifier_null_points = 0
+            identifier_point_types = 0
+            identifier_other_types = 0
+            
+            # Draw all shapes for this identifier
+            for i, shape_info in enumerate(shapes_list):
+                total_shapes_processed += 1
+                
+                # Debug each shape
+                shape_type = shape_info.get('type', 'unknown')
+                has_points = shape_info.get('points') is not None
+                
+                print(f"    Shape {i}: type='{shape_type}', has_points={has_points}")
+                
+                if shape_info.get('points') is not None:
+                    points = shape_info['points']
+                    print(f"      Points shape: {np.shape(points) if isinstance(points, (list, np.ndarray)) else 'not array-like'}")
+                    
+                    if shape_info.get('type') == 'point':
+                        print(f"      Drawing point at: {points[0] if len(points) > 0 else 'no points'}")
+                        point_xy.append(points[0])
+                        point_color_idx.append(id_idx)
+                        point_type_shapes += 1
+                        identifier_point_types += 1
+                    else:
+                        print(f"      Drawing path with {len(points) if hasattr(points, '__len__') else 'unknown'} points")
+                        if len(points) < 2:
+                            point_xy.append(points[0])
+                            point_color_idx.append(id_idx)
+                        else:
+                            identifier_paths.append(points)
+                            identifier_closed.append(shape_info.get('should_close'))
+                        total_paths_drawn += 1
+                        identifier_paths_drawn += 1
+                        other_type_shapes += 1
+                        identifier_other_types += 1
+                        
+                elif shape_info.get('type') == 'circle':
+                    center = shape_info.get('center', 'unknown')
+                    radius = shape_info.get('radius', 'unknown')
+                    print(f"      Drawing circle at center={center}, radius={radius}")
+                    circles.append((shape_info['center'], shape_info['radius']))
+                    circle_color_idx.append(id_idx)
+                    total_circles_drawn += 1
+                    identifier_circles_drawn += 1
+                else:
+                    print(f"      SKIPPED: No points and not a circle")
+                    shapes_with_null_points += 1
+                    identifier_null_points += 1
+            
+            paths_by_id.append(identifier_paths)
+            closed_by_id.append(identifier_closed)
+            
+            print(f"  Identifier {identifier} summary:")
+            print(f"    Paths drawn: {identifier_paths_drawn}")
+            print(f"    Circles drawn: {identifier_circles_drawn}")
+            print(f"    Point types: {identifier_point_types}")
+            print(f"    Other types: {identifier_other_types}")
+            print(f"    Null points: {identifier_null_points}")
+        
+        print(f"\n=== FINAL SUMMARY ===")
+        print(f"Total shapes processed: {total_shapes_processed}")
+        print(f"Total paths drawn: {total_paths_drawn}")
+        print(f"Total circles drawn: {total_circles_drawn}")
+        print(f"Point type shapes: {point_type_shapes}")
+        print(f"Other type shapes: {other_type_shapes}")
+        print(f"Shapes with null points (skipped): {shapes_with_null_points}")
+        print(f"Shapes without identifiers (excluded): {len(no_identifier_shapes)}")
+        
+        # Show details of excluded shapes
+        if no_identifier_shapes:
+            print(f"\n=== EXCLUDED SHAPES WITHOUT IDENTIFIERS ===")
+            for i, shape_info in enumerate(no_identifier_shapes[:5]):  # Show first 5
+                shape_type = shape_info.get('type', 'unknown')
+                has_points = shape_info.get('points') is not None
+                print(f"  Excluded shape {i}: type='{shape_type}', has_points={has_points}")
+            if len(no_identifier_shapes) > 5:
+                print(f"  ... and {len(no_identifier_shapes) - 5} more excluded shapes")
+        print(f"======================\n")
+        
+        # Save the transparent plot
+        identifier_dir = os.path.join(output_dir, "identifier_views")
+        os.makedirs(identifier_dir, exist_ok=True)
+        filename = _TRANSPARENT_2100PX_FILENAME
+        output_path = os.path.join(identifier_dir, filename)
+        if backend == 'matplotlib':
+            # Transparent figure sized for 2100px output: 7.0 inches * 300 DPI (for 210mm platform)
+            fig, ax = _transparent_platform_axes((7.0, 7.0))
+            
+            # One artist per identifier color instead of one per shape; plain float tuples are
+            # hashable, so matplotlib's color cache skips re-parsing them
+            identifier_colors = [tuple(map(float, rgba)) for rgba in colors]
+            for id_idx, identifier_paths in enumerate(paths_by_id):
+                draw_shapes_batched(ax, identifier_paths, identifier_colors[id_idx], 
+                                    should_close=closed_by_id[id_idx])
+            _scatter_points(ax, point_xy, colors[point_color_idx])
+            _add_circle_collection(ax, circles, colors[circle_color_idx])
+            
+            _save_fig_fast(fig, output_path)
+        else:
+            # 8-bit RGBA per identifier, converted once for the whole overlay
+            colors_u8 = _rgba_u8(colors, alpha=0.7)
+            path_colors = [colors_u8[id_idx] for id_idx, paths in enumerate(paths_by_id) for _ in paths]
+            _rasterize_paths_to_png([p for paths in paths_by_id for p in paths], path_colors,
+                                    point_xy, [colors_u8[i] for i in point_color_idx],
+                                    circles, [colors_u8[i] for i in circle_color_idx],
+                                    size_px=2100, output_path=output_path, width=2,
+                                    path_should_close=[flag for flags in closed_by_id for flag in flags])
+        
+        # ALSO create version that includes 'no_identifier' shapes for comparison
+        create_transparent_paths_view_2100px_including_no_id(shapes_by_identifier, output_dir, backend=backend)
+        
+        print(f"Created 2100px transparent paths view at: {output_path}")
+        return os.path.join("identifier_views", filename)
+        
+    except Exception as e:
+        print(f"Error creating 2500px transparent paths view: {str(e)}")
+        return None
+
+
+def create_transparent_paths_view_2100px_including_no_id(shapes_by_identifier, output_dir, backend='pillow'):
+    """Create a 2100x2100 transparent PNG with path data from ALL shapes, including those without identifiers.
+    Rasterized with Pillow by default; backend='matplotlib' renders it through a figure instead."""
+    try:
+        print(f"\n=== DEBUGGING create_transparent_paths_view_2100px_including_no_id ===")
+        
+        # Get ALL keys including 'no_identifier'
+        all_keys = list(shapes_by_identifier.keys())
+        print(f"All keys in shapes_by_identifier: {all_keys}")
+        
+        # Process ALL identifiers (including 'no_identifier')
+        identifiers = list(shapes_by_identifier.keys())
+        print(f"Processing ALL identifiers: {identifiers}")
+        
+        if not identifiers:
+            print("No identifiers found at all")
+            return None
+            
+        # Generate a color for each identifier (including special color for no_identifier)
+        # Keep the colors as one (N, 4) RGBA array indexed by identifier position
+        colors = matplotlib.colormaps['tab10'](np.arange(len(identifiers)) % 10).astype(np.float32)
+        
+        # Use a distinct color for 'no_identifier' shapes if present
+        if 'no_identifier' in identifiers:
+            colors[identifiers.index('no_identifier')] = to_rgba('gray')  # Use gray for shapes without IDs
+        
+        print(f"Generated colors for {len(identifiers)} identifiers")
+        
+        # Tracking variables
+        total_shapes_processed = 0
+        total_paths_drawn = 0
+        total_circles_drawn = 0
+        shapes_with_null_points = 0
+        point_type_shapes = 0
+        other_type_shapes = 0
+        paths_by_id, closed_by_id = [], []
+        point_xy, point_color_idx = [], []
+        circles, circle_color_idx = [], []
+        
+        # Gather each identifier's shapes; they are drawn in one go once the summary is printed
+        for id_idx, identifier in enumerate(identifiers):
+            shapes_data = shapes_by_identifier[identifier]
+            identifier_paths, identifier_closed = [], []
+            print(f"\n--- Processing identifier: {identifier} ---")
+            print(f"  Shapes data keys: {shapes_data.keys()}")
+            print(f"  Number of shapes: {shapes_data.get('count', 'unknown')}")
+            print(f"  Height range: {shapes_data.get('height_range', 'unknown')}")
+            
+            shapes_list = shapes_data.get('shapes', [])
+            print(f"  Actual shapes list length: {len(shapes_list)}")
+            
+            identifier_paths_drawn = 0
+            identifier_circles_drawn = 0
+            identifier_null_points = 0
+            identifier_point_types = 0
+            identifier_other_types = 0
+            
+            # Draw all shapes for this identifier
+            for i, shape_info in enumerate(shapes_list):
+                total_shapes_processed += 1
+                
+                # Debug each shape
+                shape_type = shape_info.get('type', 'unknown')
+                has_points = shape_info.get('points') is not None
+                
+                print(f"    Shape {i}: type='{shape_type}', has_points={has_points}")
+                
+                if shape_info.get('points') is not None:
+                    points = shape_info['points']
+                    print(f"      Points shape: {np.shape(points) if isinstance(points, (list, np.ndarray)) else 'not array-like'}")
+                    
+                    if shape_info.get('type') == 'point':
+                        print(f"      Drawing point at: {points[0] if len(points) > 0 else 'no points'}")
+                        point_xy.append(points[0])
+                        point_color_idx.append(id_idx)
+                        point_type_shapes += 1
+                        identifier_point_types += 1
+                    else:
+                        print(f"      Drawing path with {len(points) if hasattr(points, '__len__') else 'unknown'} points")
+                        if len(points) < 2:
+                            point_xy.append(points[0])
+                            point_color_idx.append(id_idx)
+                        else:
+                            identifier_paths.append(points)
+                            identifier_closed.append(shape_info.get('should_close'))
+                        total_paths_drawn += 1
+                        identifier_paths_drawn += 1
+                        other_type_shapes += 1
+                        identifier_other_types += 1
+                        
+                elif shape_info.get('type') == 'circle':
+                    center = shape_info.get('center', 'unknown')
+                    radius = shape_info.get('radius', 'unknown')
+                    print(f"      Drawing circle at center={center}, radius={radius}")
+                    circles.append((shape_info['center'], shape_info['radius']))
+                    circle_color_idx.append(id_idx)
+                    total_circles_drawn += 1
+                    identifier_circles_drawn += 1
+                else:
+                    print(f"      SKIPPED: No points and not a circle")
+                    shapes_with_null_points += 1
+                    identifier_null_points += 1
+            
+            paths_by_id.append(identifier_paths)
+            closed_by_id.append(identifier_closed)
+            
+            print(f"  Identifier {identifier} summary:")
+            print(f"    Paths drawn: {identifier_paths_drawn}")
+            print(f"    Circles drawn: {identifier_circles_drawn}")
+            print(f"    Point types: {identifier_point_types}")
+            print(f"    Other types: {identifier_other_types}")
+            print(f"    Null points: {identifier_null_points}")
+        
+        print(f"\n=== FINAL SUMMARY (INCLUDING NO_ID) ===")
+        print(f"Total shapes processed: {total_shapes_processed}")
+        print(f"Total paths drawn: {total_paths_drawn}")
+        print(f"Total circles drawn: {total_circles_drawn}")
+        print(f"Point type shapes: {point_type_shapes}")
+        print(f"Other type shapes: {other_type_shapes}")
+        print(f"Shapes with null points (skipped): {shapes_with_null_points}")
+        print(f"============================================\n")
+        
+        # Save the transparent plot
+        identifier_dir = os.path.join(output_dir, "identifier_views")
+        os.makedirs(identifier_dir, exist_ok=True)
+        filename = _TRANSPARENT_2100PX_WITH_NO_ID_FILENAME
+        output_path = os.path.join(identifier_dir, filename)
+        if backend == 'matplotlib':
+            # Transparent figure sized for 2100px output: 7.0 inches * 300 DPI (for 210mm platform)
+            fig, ax = _transparent_platform_axes((7.0, 7.0))
+            
+            # One artist per identifier color instead of one per shape; plain float tuples are
+            # hashable, so matplotlib's color cache skips re-parsing them
+            identifier_colors = [tuple(map(float, rgba)) for rgba in colors]
+            for id_idx, identifier_paths in enumerate(paths_by_id):
+                draw_shapes_batched(ax, identifier_paths, identifier_colors[id_idx], 
+                                    should_close=closed_by_id[id_idx])
+            _scatter_points(ax, point_xy, colors[point_color_idx])
+            _add_circle_collection(ax, circles, colors[circle_color_idx])
+            
+            _save_fig_fast(fig, output_path)
+        else:
+            # 8-bit RGBA per identifier, converted once for the whole overlay
+            colors_u8 = _rgba_u8(colors, alpha=0.7)
+            path_colors = [colors_u8[id_idx] for id_idx, paths in enumerate(paths_by_id) for _ in paths]
+            _rasterize_paths_to_png([p for paths in paths_by_id for p in paths], path_colors,
+                                    point_xy, [colors_u8[i] for i in point_color_idx],
+                                    circles, [colors_u8[i] for i in circle_color_idx],
+                                    size_px=2100, output_path=output_path, width=2,
+                                    path_should_close=[flag for flags in closed_by_id for flag in flags])
+        
+        print(f"Created 2100px transparent paths view (WITH NO_ID) at: {output_path}")
+        return os.path.join("identifier_views", filename)
+        
+    except Exception as e:
+        print(f"Error creating 2100px transparent paths view (WITH NO_ID): {str(e)}")
+        return None
+
+
+def _clean_platform_data_path(output_dir, height):
+    """Return (raw data directory, path-data JSON path) for a clean platform layer"""
+    # Extract build number from ABP filename
+    abp_name = os.path.basename(output_dir)
+    build_number = abp_name.split('-')[1].split('.')[0] if '-' in abp_name else ''
+    
+    # Directory with build number
+    raw_data_dir = os.path.join(output_dir, f"imagePathRawData-{build_number}")
+    data_filename = f'platform_layer_pathdata_{height}mm.json'
+    return raw_data_dir, os.path.join(raw_data_dir, data_filename)
+
+
+def _clean_platform_cache_key(clf_files, height, *options):
+    """Digest of the CLF files' paths, mtimes and sizes plus the height and the options the
+    path-data JSON depends on; equal keys mean the JSON would come out the same"""
+    parts = []
+    for clf_info in clf_files:
+        stat = os.stat(clf_info['path'])
+        parts.append((clf_info['path'], stat.st_mtime_ns, stat.st_size))
+    parts.append((height,) + options)
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+def create_clean_platform(clf_files, output_dir, height=1.0, fill_closed=False, alignment_style_only=False, save_clean_png=True, pretty_json=False, 
+                          quantize_json=None, pool=None):
+    """Create a clean platform view without any chart elements, just shapes, and save raw path data.
+    CLF files are parsed on pool (see create_layer_pool) when one is given, else in-line.
+    The path data JSON is written compact for machine reading; pass pretty_json=True to indent it.
+    quantize_json='float32' or 'int16' writes smaller point data (see shape_data_to_columns).
+    A .cache_key file next to the JSON records the inputs it was built from, so a JSON-only
+    call (save_clean_png=False) with unchanged CLF files and options returns without re-parsing."""
+    import matplotlib.pyplot as plt
+    
+    # Colors per CLF file name
+    colors = _CLF_COLORS
+    
+    raw_data_dir, data_output_path = _clean_platform_data_path(output_dir, height)
+    cache_key_path = data_output_path + '.cache_key'
+    try:
+        cache_key = _clean_platform_cache_key(clf_files, height, fill_closed, pretty_json, quantize_json,
+                                              _PATH_DATA_FORMAT)
+    except OSError as e:
+        print(f"Could not stat CLF files for the path data cache at height {height}mm: {str(e)}")
+        cache_key = None
+    
+    # Nothing to draw and the JSON on disk already matches these inputs
+    if not save_clean_png and cache_key is not None and os.path.exists(data_output_path):
+        try:
+            with open(cache_key_path, 'r') as f:
+                if f.read() == cache_key:
+                    print(f"Path data for height {height}mm is up to date, skipping")
+                    return None
+        except OSError:
+            pass
+    
+    # Parse the CLF files on the caller's pool, or in-line without one
+    shape_data_list = _process_all_layer_data(clf_files, height, colors, fill_closed, pool=pool)
+    
+    # Only create plot if save_clean_png is True
+    if save_clean_png:
+        # If alignment_style_only, declare midpoints list
+        if alignment_style_only:
+            midpoints = []
+            
+        # Chart-less axes at the platform limits, reused from the previous height with only its shapes removed
+        fig, ax, fig_cached = _get_clean_platform_axes((15, 15))
+        
+        # Draw from the structure-of-arrays batch: one artist per primitive kind
+        batch = ShapeBatch.from_shape_data(shape_data_list)
+        # Shapes entirely off the platform would only be clipped away, so cull them up front
+        on_platform = batch.on_platform()
+        drawable = ((batch.type_code == ShapeBatch.PATH) | (batch.type_code == ShapeBatch.CIRCLE)) & on_platform
+        
+        if alignment_style_only:
+            is_path = (batch.type_code == ShapeBatch.PATH) & on_platform
+            draw_aligned_shapes(ax, batch.segments(is_path), 
+                                [batch.palette[c] for c in batch.color_idx[is_path]], midpoints=midpoints)
+        else:
+            # Drop vertices closer than half an output pixel (15in at 300dpi) to the simplified path
+            batch = batch.simplified(0.5 * PLATFORM_SIZE_MM / (15 * 300), mask=drawable)
+            lengths = batch.lengths
+            is_point = ((batch.type_code == ShapeBatch.POINT) & on_platform) | (drawable & (lengths < 2))
+            is_closed = drawable & (lengths >= 2) & batch.should_close & fill_closed
+            is_line = drawable & (lengths >= 2) & ~is_closed
+            
+            # The view is only ever a PNG, so the collections are marked rasterized like the transparent
+            # composite's: a vector export of this figure would embed them as images, not per-segment paths
+            palette = batch.palette
+            draw_shapes_collection(ax, batch.segments(is_line), 
+                                   to_rgba_array([palette[c] for c in batch.color_idx[is_line]]),
+                                   should_close=batch.should_close[is_line].tolist(), rasterized=True)
+            _add_polygon_collection(ax, batch.segments(is_closed), 'black', 
+                                    [palette[c] for c in batch.color_idx[is_closed]], rasterized=True)
+            _scatter_points(ax, batch.verts[batch.offsets[:-1][is_point]], 
+                            [palette[c] for c in batch.color_idx[is_point]])
+                
+        filename = f'clean_platform_{height}mm.png'
+        output_path = os.path.join(output_dir, "clean_platforms", filename)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        # Axes already fill the canvas, so encode the Agg buffer directly instead of going through savefig
+        _save_fig_fast(fig, output_path, compress_level=3)
+        if not fig_cached:
+            plt.close(fig)
+        png_path = os.path.join("clean_platforms", filename)
+    else:
+        png_path = None
+    
+    # Save the shape data to a file
+    try:
+        os.makedirs(raw_data_dir, exist_ok=True)
+        
+        # Add debugging information
+        print(f"\nWriting shape data to: {data_output_path}")
+        print(f"Number of shapes being written: {len(shape_data_list)}")
+        
+        # Drop the old key first so a failed write never leaves a JSON that looks up to date
+        if os.path.exists(cache_key_path):
+            os.remove(cache_key_path)
+        _write_shape_data_json(shape_data_list, data_output_path, pretty=pretty_json, quantize=quantize_json)
+        if cache_key is not None:
+            with open(cache_key_path, 'w') as f:
+                f.write(cache_key)
+        
+        print(f"Successfully wrote shape data for height {height}mm")
+        
+    except Exception as e:
+        print(f"Error saving shape data for clean platform at height {height}mm: {str(e)}")
+        
+    return png_path
+
+
+def _skin_debug_style(shape_data, only_skin_files):
+    """(color, linewidth, alpha) for a path in the skin-only debug views"""
+    if not only_skin_files:
+        # For all files, use original color scheme
+        return shape_data['color'], 1, 0.7
+    
+    # For skin files, use different colors based on path index and hole status
+    if shape_data.get('is_hole', False):
+        # Holes are bright red with thick lines
+        print(f"  Drawing HOLE: Path {shape_data.get('path_index', '?')} in Shape {shape_data.get('shape_index', '?')} from {shape_data['clf_name']}")
+        return 'red', 3, 0.9
+    
+    # Exterior paths: color by path index for debugging
+    path_idx = shape_data.get('path_index', 0)
+    if path_idx == 0:
+        color = 'blue'  # First path (exterior) is blue
+    elif path_idx == 1:
+        color = 'green'  # Second path is green
+    elif path_idx == 2:
+        color = 'orange'  # Third path is orange
+    else:
+        color = 'purple'  # Additional paths are purple
+    print(f"  Drawing EXTERIOR: Path {path_idx} in Shape {shape_data.get('shape_index', '?')} from {shape_data['clf_name']} (total paths: {shape_data.get('total_paths_in_shape', '?')})")
+    return color, 2, 0.7
+
+
+def _draw_skin_debug_shapes(ax, shape_data_list, fill_closed, only_skin_files, midpoints=None):
+    """Draw the skin-only debug views' shapes as one PolyCollection, one LineCollection and one
+    ring collection instead of one artist per shape. Each shape's alpha is folded into its RGBA
+    colors so the collections can vary it per item. Passing midpoints draws the alignment style
+    (axis-aligned segments only) and collects the segment midpoints into it."""
+    aligned_paths, aligned_colors = [], []
+    polygons, poly_faces, poly_edges, poly_widths = [], [], [], []
+    line_paths, line_colors, line_widths, line_closed = [], [], [], []
+    circles, circle_colors = [], []
+    
+    for shape_data in shape_data_list:
+        if shape_data['type'] == 'path' and 'points' in shape_data:
+            points = shape_data['points']
+            color, linewidth, alpha = _skin_debug_style(shape_data, only_skin_files)
+            
+            if midpoints is not None:
+                aligned_paths.append(points)
+                aligned_colors.append(color)
+            elif fill_closed and shape_data.get('should_close', False):
+                polygons.append(points)
+                poly_faces.append((0.0, 0.0, 0.0, alpha))
+                poly_edges.append(to_rgba(color, alpha))
+                poly_widths.append(linewidth)
+            elif len(points) >= 2:
+                line_paths.append(points)
+                line_colors.append(to_rgba(color, alpha))
+                line_widths.append(linewidth)
+                line_closed.append(bool(shape_data.get('should_close', False)))
+                
+        elif shape_data['type'] == 'circle':
+            color = shape_data['color'] if not only_skin_files else 'cyan'  # Circles in cyan for skin files
+            circles.append((shape_data['center'], shape_data['radius']))
+            circle_colors.append(color)
+    
+    if midpoints is not None:
+        draw_aligned_shapes(ax, aligned_paths, aligned_colors, midpoints=midpoints)
+    # alpha=None keeps the per-item alpha already folded into the colors
+    _add_polygon_collection(ax, polygons, poly_faces, poly_edges, alpha=None, linewidths=poly_widths)
+    draw_shapes_collection(ax, line_paths, line_colors, alpha=None, linewidth=line_widths, 
+                           should_close=line_closed)
+    _add_circle_collection(ax, circles, circle_colors)
+
+
+def create_clean_platform_skin_only(clf_files, output_dir, height=1.0, fill_closed=False, alignment_style_only=False, save_clean_png=True, only_skin_files=True, 
+                                    pretty_json=False):
+    """DEBUG VERSION: Create a clean platform view with option to filter for skin files only.
+    This is a separate function for testing and debugging purposes.
+    The shape data JSON is written compact; pass pretty_json=True to indent it."""
+    import matplotlib.pyplot as plt
+    
+    # Colors per CLF file name
+    colors = _CLF_COLORS
+    
+    # Filter files if only_skin_files is True
+    if only_skin_files:
+        original_count = len(clf_files)
+        clf_files = [clf_info for clf_info in clf_files if 'skin' in clf_info['folder'].lower()]
+        print(f"Filtering for skin files only: {len(clf_files)} out of {original_count} files")
+        if len(clf_files) > 0:
+            print("Example skin files:")
+            for i, clf_info in enumerate(clf_files[:3]):
+                print(f"  {i+1}: {clf_info['name']} in folder {clf_info['folder']}")
+    
+    
+    # Process all CLF files sequentially (avoiding nested multiprocessing)
+    shape_data_list = []
+    for clf_info in clf_files:
+        try:
+            # Log which folder and file are being processed for skin_files_only
+            if only_skin_files:
+                print(f"Processing skin file: '{clf_info['name']}' from folder: '{clf_info['folder']}'")
+            
+            result = process_layer_data(clf_info, height, colors, fill_closed)
+            shape_data_list.extend(result)
+        except Exception as e:
+            print(f"Error processing {clf_info['name']} at height {height}mm: {str(e)}")
+    
+    # Only create plot if save_clean_png is True
+    if save_clean_png:
+        # If alignment_style_only, declare midpoints list
+        if alignment_style_only:
+            midpoints = []
+            
+        # Create figure with equal aspect ratio
+        fig = setup_platform_figure(figsize=(15, 15))
+        
+        # Remove all margins and spacing
+        ax = plt.gca()
+        ax.set_position([0, 0, 1, 1])
+        
+        # Set exact, square limits for platform size
+        ax.set_xlim(-125, 125)
+        ax.set_ylim(-125, 125)
+        ax.set_aspect('equal', adjustable='box')
+        
+        # Turn off all chart elements (ticks, labels and frame) in one call
+        ax.set_axis_off()
+        
+        # Draw all shapes with enhanced colorization for debugging, one collection per kind
+        _draw_skin_debug_shapes(ax, shape_data_list, fill_closed, only_skin_files, 
+                                midpoints if alignment_style_only else None)
+                
+        filename = f'clean_platform_enhanced_{height}mm.png'
+        output_path = os.path.join(output_dir, "clean_platforms", filename)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        # Axes already fill the canvas, so encode the Agg buffer directly instead of going through savefig
+        _save_fig_fast(fig, output_path, compress_level=3)
+        plt.close(fig)
+        png_path = os.path.join("clean_platforms", filename)
+    else:
+        png_path = None
+    
+    # Save the shape data to a file
+    try:
+        # Extract build number from ABP filename
+        abp_name = os.path.basename(output_dir)
+        build_number = abp_name.split('-')[1].split('.')[0] if '-' in abp_name else ''
+        
+        # Create directory with build number
+        raw_data_dir = os.path.join(output_dir, f"imagePathRawData-{build_number}")
+        os.makedirs(raw_data_dir, exist_ok=True)
+
+        # Construct filename
+        data_filename = f'platform_layer_pathdata_enhanced_{height}mm.json'
+        data_output_path = os.path.join(raw_data_dir, data_filename)
+        
+        # Add debugging information
+        print(f"\nWriting enhanced shape data to: {data_output_path}")
+        print(f"Number of shapes being written: {len(shape_data_list)}")
+        
+        _write_json(shape_data_list, data_output_path, pretty=pretty_json, native_numpy=False)
+        
+        print(f"Successfully wrote enhanced shape data for height {height}mm")
+        
+    except Exception as e:
+        print(f"Error saving enhanced shape data for clean platform at height {height}mm: {str(e)}")
+        
+    return png_path
+
+
+def _process_holes_for_clf(clf_info, height, color):
+    """Find the exterior and hole paths of one CLF file at the given height.
+    Returns (exteriors, holes, file_detail); file_detail is None if the file has no usable layer."""
+    exteriors = []
+    holes = []
+    try:
+        shapes = _load_layer_points(clf_info['path'], height)
+        if shapes is None:
+            return exteriors, holes, None
+        
+        # Check if this file can contain holes (must contain 'skin' in folder name, case-insensitive)
+        can_have_holes = 'skin' in clf_info['folder'].lower()
+        
+        # Process each shape to find holes - use correct hole detection logic (Shape[1] Path[0])
+        for i, (model_id, shape_paths) in enumerate(shapes):
+            if not shape_paths:
+                continue
+                
+            # Get identifier for shape
+            identifier = "unknown" if model_id is None else str(model_id)
+            
+            # Process each path in the shape
+            for path_idx, points in enumerate(shape_paths):
+                # Check if this is a hole using the correct logic: Shape[1] Path[0]
+                is_hole = (i == 1 and path_idx == 0 and len(shapes) >= 2 and can_have_holes)
+                
+                if is_hole:
+                    # This is a hole: Shape[1] Path[0] in a skin file
+                    print(f"    Found hole: Shape[{i}] Path[{path_idx}] (ID:{identifier}) in {clf_info['name']}")
+                    
+                    holes.append({
+                        'type': 'hole',
+                        'points': points,
+                        'identifier': f"{identifier}_shape_{i}_path_{path_idx}",
+                        'clf_file': clf_info['name'],
+                        'clf_folder': clf_info['folder'],
+                        'color': color,
+                        'shape_index': i,
+                        'path_index': path_idx,
+                        'parent_shape_index': i,
+                        'parent_identifier': identifier
+                    })
+                else:
+                    # This is a regular exterior shape
+                    exteriors.append({
+                        'type': 'exterior',
+                        'points': points,
+                        'identifier': f"{identifier}_shape_{i}_path_{path_idx}",
+                        'clf_file': clf_info['name'],
+                        'clf_folder': clf_info['folder'],
+                        'color': color,
+                        'shape_index': i,
+                        'path_index': path_idx
+                    })
+        
+        file_detail = {
+            'filename': clf_info['name'],
+            'folder': clf_info['folder'],
+            'exteriors': len(exteriors),
+            'holes': len(holes),
+            'can_have_holes': can_have_holes
+        }
+        return exteriors, holes, file_detail
+        
+    except Exception as e:
+        print(f"Error processing {clf_info['name']} for holes: {e}")
+        return [], [], None
+
+
+def create_combined_holes_platform_view(clf_files, output_dir, height=134.0, pool=None):
+    """Create a platform view showing all detected holes across all CLF files at a specific height.
+    Uses the corrected hole detection logic (multiple paths within same shape).
+    CLF files are parsed on pool (see create_layer_pool) when one is given, else in-line."""
+    import matplotlib.pyplot as plt
+    try:
+        print(f"Creating combined holes platform view at {height}mm...")
+        
+        # Define colors for different CLF files
+        colors = _HOLE_VIEW_COLORS
+        
+        all_exteriors = []
+        all_holes = []
+        holes_stats = {
+            'total_files': len(clf_files),
+            'files_with_holes': 0,
+            'total_exteriors': 0,
+            'total_holes': 0,
+            'file_details': []
+        }
+        
+        # Process each CLF file to find holes; files are independent, so parse them on the
+        # caller's pool when there is one, then find the holes here from the layer cache
+        _prefetch_layer_points(clf_files, height, pool)
+        results = [_process_holes_for_clf(clf_info, height, colors.get(clf_info['name'], '#666666')) 
+                   for clf_info in clf_files]
+        
+        for exteriors, holes, file_detail in results:
+            if file_detail is None:
+                continue
+            all_exteriors.extend(exteriors)
+            all_holes.extend(holes)
+            if file_detail['holes'] > 0:
+                holes_stats['files_with_holes'] += 1
+            holes_stats['file_details'].append(file_detail)
+        
+        # Update summary statistics
+        holes_stats['total_exteriors'] = len(all_exteriors)
+        holes_stats['total_holes'] = len(all_holes)
+        
+        print(f"Holes analysis summary:")
+        print(f"  - Total files: {holes_stats['total_files']}")
+        print(f"  - Files with holes: {holes_stats['files_with_holes']}")
+        print(f"  - Total exterior shapes: {holes_stats['total_exteriors']}")
+        print(f"  - Total holes found: {holes_stats['total_holes']}")
+        
+        # Create the visualization if we found any shapes
+        if all_exteriors or all_holes:
+            # Create figure
+            setup_platform_figure(figsize=(15, 15))
+            ax = plt.gca()
+            
+            # Add standard platform elements
+            draw_platform_boundary(plt)
+            add_reference_lines(plt)
+            
+            # Draw exterior shapes (semi-transparent), one PolyCollection for all of them
+            ext_colors = [ext['color'] for ext in all_exteriors]
+            _add_polygon_collection(ax, [ext['points'] for ext in all_exteriors], ext_colors, ext_colors, 
+                                    alpha=0.3, linewidths=1)
+            
+            # Draw holes as solid red polygons on top for high visibility
+            _add_polygon_collection(ax, [hole['points'] for hole in all_holes], 'red', 'darkred', 
+                                    alpha=0.8, linewidths=2)
+            
+            # Create legend (CLF files with exteriors collected once, not scanned per entry)
+            legend_elements = []
+            present_clf_files = {ext['clf_file'] for ext in all_exteriors}
+            for clf_name, color in colors.items():
+                if clf_name in present_clf_files:
+                    legend_elements.append(plt.Rectangle((0,0),1,1, facecolor=color, alpha=0.3, 
+                                                       edgecolor=color, label=f'{clf_name} (Exteriors)'))
+            
+            if all_holes:
+                legend_elements.append(plt.Rectangle((0,0),1,1, facecolor='red', alpha=0.8, 
+                                                   edgecolor='darkred', label='Holes'))
+            
+            if legend_elements:
+                plt.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.05, 1), borderaxespad=0.)
+            
+            plt.title(f'Combined Holes Platform View at {height}mm\n'
+                     f'Total Files: {holes_stats["total_files"]} | '
+                     f'Files with Holes: {holes_stats["files_with_holes"]}\n'
+                     f'Exterior Shapes: {holes_stats["total_exteriors"]} | '
+                     f'Holes Found: {holes_stats["total_holes"]}')
+            
+            add_platform_labels(plt)
+            set_platform_limits(plt)
+            
+            # Save the holes view
+            holes_dir = os.path.join(output_dir, "holes_views")
+            os.makedirs(holes_dir, exist_ok=True)
+            filename = f'combined_holes_platform_view_{height}mm.png'
+            output_path = os.path.join(holes_dir, filename)
+            save_platform_figure(plt, output_path)
+            
+            print(f"Created combined holes view at: {output_path}")
+            return os.path.join("holes_views", filename), holes_stats
+        
+        else:
+            print("No shapes found for holes visualization")
+            return None, holes_stats
+            
+    except Exception as e:
+        print(f"Error creating combined holes platform view: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return None, None
+
+
+def create_clean_platform_skin_only_enhanced(clf_files, output_dir, height=1.0, fill_closed=False, alignment_style_only=False, save_clean_png=True, only_skin_files=True, 
+                                             pretty_json=False):
+    """DEBUG VERSION: Create a clean platform view with enhanced colorization for hole detection debugging.
+    This function adds color coding to distinguish different paths and holes.
+    The shape data JSON is written compact; pass pretty_json=True to indent it."""
+    import matplotlib.pyplot as plt
+    
+    # Colors per CLF file name
+    colors = _CLF_COLORS
+    
+    # Filter files if only_skin_files is True
+    if only_skin_files:
+        original_count = len(clf_files)
+        clf_files = [clf_info for clf_info in clf_files if 'skin' in clf_info['folder'].lower()]
+        print(f"Filtering for skin files only: {len(clf_files)} out of {original_count} files")
+        if len(clf_files) > 0:
+            print("Example skin files:")
+            for i, clf_info in enumerate(clf_files[:3]):
+                print(f"  {i+1}: {clf_info['name']} in folder {clf_info['folder']}")
+    
+    # Process all CLF files sequentially (avoiding nested multiprocessing)
+    shape_data_list = []
+    for clf_info in clf_files:
+        try:
+            # Log which folder and file are being processed for skin_files_only
+            if only_skin_files:
+                print(f"Processing skin file: '{clf_info['name']}' from folder: '{clf_info['folder']}'")
+            
+            result = process_layer_data(clf_info, height, colors, fill_closed)
+            shape_data_list.extend(result)
+        except Exception as e:
+            print(f"Error processing {clf_info['name']} at height {height}mm: {str(e)}")
+    
+    # Only create plot if save_clean_png is True
+    if save_clean_png:
+        # If alignment_style_only, declare midpoints list
+        if alignment_style_only:
+            midpoints = []
+            
+        # Create figure with equal aspect ratio
+        fig = setup_platform_figure(figsize=(15, 15))
+        
+        # Remove all margins and spacing
+        ax = plt.gca()
+        ax.set_position([0, 0, 1, 1])
+        
+        # Set exact, square limits for platform size
+        ax.set_xlim(-125, 125)
+        ax.set_ylim(-125, 125)
+        ax.set_aspect('equal', adjustable='box')
+        
+        # Turn off all chart elements (ticks, labels and frame) in one call
+        ax.set_axis_off()
+        
+        # Draw all shapes with enhanced colorization for debugging, one collection per kind
+        _draw_skin_debug_shapes(ax, shape_data_list, fill_closed, only_skin_files, 
+                                midpoints if alignment_style_only else None)
+                
+        filename = f'clean_platform_enhanced_{height}mm.png'
+        output_path = os.path.join(output_dir, "clean_platforms", filename)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        # Axes already fill the canvas, so encode the Agg buffer directly instead of going through savefig
+        _save_fig_fast(fig, output_path, compress_level=3)
+        plt.close(fig)
+        png_path = os.path.join("clean_platforms", filename)
+    else:
+        png_path = None
+    
+    # Save the shape data to a file
+    try:
+        # Extract build number from ABP filename
+        abp_name = os.path.basename(output_dir)
+        build_number = abp_name.split('-')[1].split('.')[0] if '-' in abp_name else ''
+        
+        # Create directory with build number
+        raw_data_dir = os.path.join(output_dir, f"imagePathRawData-{build_number}")
+        os.makedirs(raw_data_dir, exist_ok=True)
+
+        # Construct filename
+        data_filename = f'platform_layer_pathdata_enhanced_{height}mm.json'
+        data_output_path = os.path.join(raw_data_dir, data_filename)
+        
+        # Add debugging information
+        print(f"\nWriting enhanced shape data to: {data_output_path}")
+        print(f"Number of shapes being written: {len(shape_data_list)}")
+        
+        _write_json(shape_data_list, data_output_path, pretty=pretty_json, native_numpy=False)
+        
+        print(f"Successfully wrote enhanced shape data for height {height}mm")
+        
+    except Exception as e:
+        print(f"Error saving enhanced shape data for clean platform at height {height}mm: {str(e)}")
+        
     return png_path
\ No newline at end of file
@@ -7,6 +7,82 @@ import os
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson  # Optional: faster encode/decode of the process log
+except ImportError:
+    orjson = None
+
+
+# processes_file -> ((st_mtime_ns, st_size), parsed data) as this process last read or wrote it
+_LOG_CACHE = {}
+
+# processes_file -> {program_name: {run_id: run entry}}; the entries are the dicts inside the
+# cached data, so the index is dropped whenever that data is re-read from disk
+_RUN_INDEX = {}
+
+
+def _file_signature(processes_file):
+    stat = processes_file.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_processes_data(processes_file):
+    """
+    Load processes_run.json, reusing this process's parsed copy while the file is unchanged on disk.
+    Other programs may write the log between our start and finish calls, so the cached copy is
+    only trusted while the file's mtime and size still match what we last read or wrote.
+    
+    Raises:
+        FileNotFoundError, json.JSONDecodeError: if the file is missing or not valid JSON
+    """
+    signature = _file_signature(processes_file)
+    cached = _LOG_CACHE.get(processes_file)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    raw = processes_file.read_bytes()  # Bytes straight to the parser, no text decode layer
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either the same way
+    processes_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    _LOG_CACHE[processes_file] = (signature, processes_data)
+    _RUN_INDEX.pop(processes_file, None)
+    return processes_data
+
+
+def _get_run_index(processes_file, processes_data, program_name):
+    """
+    Return {run_id: run entry} for a program's runs, building it from the runs list on first use.
+    When run_ids repeat, the first entry wins, as with a front-to-back scan of the list.
+    """
+    indexes = _RUN_INDEX.setdefault(processes_file, {})
+    index = indexes.get(program_name)
+    if index is None:
+        index = {}
+        for run_entry in processes_data[program_name]["runs"]:
+            index.setdefault(run_entry.get("run_id"), run_entry)
+        indexes[program_name] = index
+    return index
+
+
+def _write_processes_data(processes_file, processes_data):
+    """
+    Write processes_run.json atomically (temporary file, then os.replace) so external monitors
+    never read a half-written log, and remember the written copy for the next read.
+    """
+    tmp_file = processes_file.with_suffix('.json.tmp')
+    try:
+        if orjson is not None:
+            payload = orjson.dumps(processes_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(processes_data, indent=2).encode('utf-8')
+        tmp_file.write_bytes(payload)  # One write of the whole encoded log
+        os.replace(tmp_file, processes_file)
+    except Exception:
+        # The in-memory copy may now differ from the file, so make the next read go to disk
+        _LOG_CACHE.pop(processes_file, None)
+        _RUN_INDEX.pop(processes_file, None)
+        raise
+    _LOG_CACHE[processes_file] = (_file_signature(processes_file), processes_data)
+
 
 def create_process_log_start(build_path, program_name, start_time):
     """
@@ -28,6 +104,7 @@ def create_process_log_start(build_path, program_name, start_time):
     run_entry = {
         "run_id": run_id,
         "start_time": start_time.isoformat(),
+        "start_time_epoch": start_time.timestamp(),  # Lets the finish call skip re-parsing start_time
         "end_time": None,
         "duration_seconds": None,
         "status": "running",
@@ -37,14 +114,17 @@ def create_process_log_start(build_path, program_name, start_time):
     # Load existing data or create new structure
     if processes_file.exists():
         try:
-            with open(processes_file, 'r') as f:
-                processes_data = json.load(f)
+            processes_data = _read_processes_data(processes_file)
         except (json.JSONDecodeError, FileNotFoundError):
             processes_data = {}
     else:
         processes_data = {}
+    if not processes_data:
+        _RUN_INDEX.pop(processes_file, None)
     
     # Initialize program entry if it doesn't exist or has old structure
+    if program_name not in processes_data or "runs" not in processes_data[program_name]:
+        _RUN_INDEX.get(processes_file, {}).pop(program_name, None)
     if program_name not in processes_data:
         processes_data[program_name] = {
             "description": "CLF analysis and platform path processing",
@@ -71,13 +151,13 @@ def create_process_log_start(build_path, program_name, start_time):
                 }
                 processes_data[program_name]["runs"].append(legacy_run)
     
-    # Add this run to the program's history
+    # Add this run to the program's history and to the run_id index used by update_process_log_finish
     processes_data[program_name]["runs"].append(run_entry)
+    _get_run_index(processes_file, processes_data, program_name).setdefault(run_id, run_entry)
     
     # Save the updated data
     try:
-        with open(processes_file, 'w') as f:
-            json.dump(processes_data, f, indent=2)
+        _write_processes_data(processes_file, processes_data)
         return run_id
     except Exception as e:
         # Don't fail the main program if logging fails
@@ -105,8 +185,7 @@ def update_process_log_finish(build_path, program_name, run_id, end_time, status
         return False
     
     try:
-        with open(processes_file, 'r') as f:
-            processes_data = json.load(f)
+        processes_data = _read_processes_data(processes_file)
     except (json.JSONDecodeError, FileNotFoundError):
         print(f"Warning: Could not read process log file: {processes_file}")
         return False
@@ -122,33 +201,31 @@ def update_process_log_finish(build_path, program_name, run_id, end_time, status
         return False
     
     # Find the run entry with matching run_id
-    run_found = False
-    for run_entry in processes_data[program_name]["runs"]:
-        if run_entry.get("run_id") == run_id:
-            # Parse start time to calculate duration
-            try:
-                start_time_str = run_entry["start_time"]
-                start_time = datetime.fromisoformat(start_time_str)
-                duration_seconds = (end_time - start_time).total_seconds()
-            except Exception as e:
-                print(f"Warning: Could not calculate duration: {e}")
-                duration_seconds = None
-            
-            # Update the entry
-            run_entry["end_time"] = end_time.isoformat()
-            run_entry["duration_seconds"] = duration_seconds
-            run_entry["status"] = status
-            run_found = True
-            break
-    
-    if not run_found:
+    run_entry = _get_run_index(processes_file, processes_data, program_name).get(run_id)
+    if run_entry is None:
         print(f"Warning: Run with ID {run_id} not found for program {program_name}")
         return False
     
+    # Calculate duration from the stored epoch seconds, parsing the ISO start time only for older entries
+    try:
+        if run_entry.get("start_time_epoch") is not None:
+            duration_seconds = end_time.timestamp() - run_entry["start_time_epoch"]
+        else:
+            start_time_str = run_entry["start_time"]
+            start_time = datetime.fromisoformat(start_time_str)
+            duration_seconds = (end_time - start_time).total_seconds()
+    except Exception as e:
+        print(f"Warning: Could not calculate duration: {e}")
+        duration_seconds = None
+    
+    # Update the entry
+    run_entry["end_time"] = end_time.isoformat()
+    run_entry["duration_seconds"] = duration_seconds
+    run_entry["status"] = status
+    
     # Save the updated data
     try:
-        with open(processes_file, 'w') as f:
-            json.dump(processes_data, f, indent=2)
+        _write_processes_data(processes_file, processes_data)
         return True
     except Exception as e:
         print(f"Warning: Could not update process log finish: {e}")
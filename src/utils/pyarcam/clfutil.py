@@ -1,10 +1,18 @@
 import struct
+import bisect
 from enum import Enum
 import numpy as np
 import io
-import cv2
-import shapely.geometry as geo
-from matplotlib.path import Path
+import mmap
+import functools
+
+# cv2, shapely and matplotlib are imported where they are used, so that reading CLF 
+# headers and seek tables (Build/CLFFile with load=False) does not pay for them
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 '''Utilities to read and display the content of CLF files 
 
@@ -42,9 +50,14 @@ class Build:
         else: 
             raise Exception("Not valid input format")
         
-        # Box
-        self.box = self.files[0].box
-        for elem in self.files[1:]: self.box = self.box + elem.box
+        # Box, reduced over all files at once
+        if len(self.files) == 1: 
+            self.box = self.files[0].box
+        else: 
+            self.box = Box(
+                min=np.stack([elem.box.min for elem in self.files]).min(axis=0), 
+                max=np.stack([elem.box.max for elem in self.files]).max(axis=0)
+                )
         
         # Thickness
         self.thickness = min([elem.thickness for elem in self.files])
@@ -52,13 +65,21 @@ class Build:
     def find(self, z, merge=True): 
         
         if merge: 
-            layer = None
-            for elem in self.files:
-                if layer is None: 
-                    layer = elem.find(z)
-                else: 
-                    layer = layer + elem.find(z)
-            return layer
+            # Consecutive forward()/show() calls often ask for the same z again; the cache is 
+            # keyed on the file tuple so in-place edits of self.files are noticed
+            key = (z, tuple(self.files))
+            last = getattr(self, '_last', None)
+            if last is None or last[0] != key: 
+                # Only files whose z range holds z can contribute shapes
+                files = [elem for elem in self.files if elem.box.min[2] <= z <= elem.box.max[2]]
+                if not files: 
+                    # Same part convention as below: a single file keeps its part, a merge has none
+                    return Layer(z, [], self.files[0] if len(self.files) == 1 else None)
+                layer = functools.reduce(Layer.__add__, [elem.find(z) for elem in files])
+                last = self._last = (key, layer.z, layer.part, tuple(layer.shapes))
+            # A fresh Layer per call, so callers cannot change the cached one; a layer from a 
+            # single file keeps that file's z and part, as CLFFile.find returned it
+            return Layer(last[1], list(last[3]), last[2])
         else: 
             return LayerList([elem.find(z) for elem in self.files])
 
@@ -150,10 +171,19 @@ class CLFFile:
             self._read_seek_table()
  
         self.layers.sort(key = lambda elem: elem.z)
+        self._zs = [elem.z for elem in self.layers]
 
     def find(self, z): 
         if z > self.box.max[2] or z < self.box.min[2]: return Layer(z, [], self)
-        layer = min(self.layers, key=lambda elem:abs(elem.z - z))
+        # Layers are sorted by z; rebuild the z list if layers were added since
+        if len(self._zs) != len(self.layers): 
+            self.layers.sort(key = lambda elem: elem.z)
+            self._zs = [elem.z for elem in self.layers]
+        if not self._zs: return Layer(z, [], self)
+        i = bisect.bisect_left(self._zs, z)
+        if i == len(self._zs) or (i > 0 and z - self._zs[i - 1] <= self._zs[i] - z): 
+            i -= 1
+        layer = self.layers[i]
         if abs(layer.z - z) > self.thickness: 
             return Layer(z, [], self)
         else: 
@@ -193,6 +223,19 @@ class CLFFile:
         f = self.buffer
         ilast = f.last()
 
+        if _decode_seek_table is not None: 
+            # Whole table decoded in one compiled pass, then LayerPointers built from the arrays
+            buf = np.frombuffer(f.data, dtype=np.uint8)
+            zs, indices, pos, bad = _decode_seek_table(buf, f.tell(), ilast)
+            del buf
+            if bad == -2: 
+                raise Exception("Seek table entry without z")
+            if bad >= 0: 
+                raise UknownSectionException(bad)
+            f.seek(pos)
+            self.layers += [LayerPointer.from_seek(self, z, index) for z, index in zip(zs.tolist(), indices.tolist())]
+            return
+
         while f.tell() < ilast: 
             sid = f.lf_int()
             assert(sid == 0)
@@ -231,89 +274,181 @@ class ClusterType(Enum):
         if self == ClusterType.MODEL: 
             poly_type, _, n = polygons.pop(0)
             assert(poly_type == PolygonType.OUTLOOP)
-            points = [buffer.get(n)] + [buffer.get(n) for poly_type, poly_format, n in polygons]
-            return [ModelCluster(model, points)]
+            coords, offsets = buffer.get_many([n] + [n for poly_type, poly_format, n in polygons])
+            return [ModelCluster(model, coords=coords, offsets=offsets)]
         elif self == ClusterType.WEB:
             return [poly_format.construct(model, buffer.get(n)) for poly_type, poly_format, n in polygons]
         else: 
             raise Exception("Does not yet support type {}".format(self)) 
 
+# (gray, RGB) images reused by Layer.show, keyed by mask shape
+_SHOW_BUFFERS = {}
+
 class Shape: 
+    '''Polygons of one shape, stored as a single (M, 2) coords array plus polygon offsets
 
-    def __init__(self, model, points):
+    Construct either from a list of (m, 2) arrays (points) or directly from coords and 
+    offsets, where polygon i is coords[offsets[i]:offsets[i + 1]]. 
+    self.points gives the per-polygon views.
+    '''
+
+    def __init__(self, model, points=None, coords=None, offsets=None):
         self.model = model 
-        self.points = points
+        if coords is None: 
+            points = list(points)
+            offsets = np.zeros(len(points) + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum([elem.shape[0] for elem in points])
+            coords = np.concatenate(points, axis=0) if points else np.empty((0, 2), dtype=np.float32)
+        self.coords = coords
+        self.offsets = offsets
+        self._points = None
+        self._int = None
+        self._int_coords = None
+        self._int_points = None
+
+    def _split(self, coords): 
+        return [coords[i:j] for i, j in zip(self.offsets[:-1].tolist(), self.offsets[1:].tolist())]
+
+    @property
+    def points(self): 
+        if self._points is None: 
+            self._points = self._split(self.coords)
+        return self._points
+
+    def _rounded_coords(self): 
+        if self._int_coords is None: 
+            self._int_coords = np.rint(self.coords).astype(np.int32)
+        return self._int_coords
+
+    def _int_contours(self): 
+        '''Cached int32 polygons for cv2 drawing, without building an asint() Shape'''
+        if self.coords.dtype == np.int32: 
+            return self.points
+        if self._int_points is None: 
+            self._int_points = self._split(self._rounded_coords())
+        return self._int_points
 
     def transform(self, func): 
-        return type(self)(
-            self.model, 
-            [np.stack(func(elem[:, 0], elem[:, 1]), axis=1) for elem in self.points]
-            )
+        # One call to func over all polygons at once, straight on the (M, 2) block if func offers it
+        xform = getattr(func, 'xy', None)
+        if xform is not None: 
+            out = xform(self.coords)
+        else: 
+            out = np.stack(func(self.coords[:, 0], self.coords[:, 1]), axis=1)
+        return type(self)(self.model, coords=out, offsets=self.offsets)
 
     def asint(self):
-        return type(self)( 
-            self.model, 
-            [np.round(elem).astype(np.int32) for elem in self.points]
-            )
+        # Rounded once and reused, since mask/plot/show round the same shape on every call
+        if self.coords.dtype == np.int32: 
+            return self
+        if self._int is None: 
+            self._int = type(self)(self.model, coords=self._rounded_coords(), offsets=self.offsets)
+        return self._int
 
     def box(self): 
 
-        minval = (
-            min([elem[:, 0].min() for elem in self.points]),
-            min([elem[:, 1].min() for elem in self.points]), 
-            0.0
-        )
-
-        maxval = (
-            max([elem[:, 0].max() for elem in self.points]),
-            max([elem[:, 1].max() for elem in self.points]), 
-            0.0
-        )
+        minval = (self.coords[:, 0].min(), self.coords[:, 1].min(), 0.0)
+        maxval = (self.coords[:, 0].max(), self.coords[:, 1].max(), 0.0)
 
         return Box(min=minval, max=maxval)
 
     def mask(self, res, color=False, filled=True): 
         output = np.zeros((res[0], res[1]), dtype=np.uint8)
         self.asint().plot(output, 255, filled=filled)
-        if color: return cv2.cvtColor(output, cv2.COLOR_GRAY2RGB)
+        if color: 
+            import cv2
+            return cv2.cvtColor(output, cv2.COLOR_GRAY2RGB)
         return output
 
 
 class ModelCluster(Shape): 
 
     def plot(self, img, color, filled=True):
+        import cv2
         if filled: 
-            cv2.fillPoly(img, self.points, color)
+            cv2.fillPoly(img, self._int_contours(), color)
         else:
-            cv2.polylines(img, self.points, True, color)
+            cv2.polylines(img, self._int_contours(), True, color)
 
     def shapely(self): 
+        '''Single shapely Polygon of this cluster; prefer layer_to_shapely for a whole layer'''
+        import shapely.geometry as geo
         return geo.Polygon(self.points[0], self.points[1:])
 
     def path(self): 
-        gen = ([Path.MOVETO] + [Path.LINETO] * (elem.shape[0] - 1) + [Path.CLOSEPOLY] for elem in self.points)
-        p = [np.concatenate([elem, np.expand_dims(elem[-1, :], axis=0)]) for elem in self.points]
-        return Path(np.concatenate(p), [elem for vec in gen for elem in vec])
+        from matplotlib.path import Path
+        # Each ring is followed by a repeat of its last point for CLOSEPOLY
+        ring_lengths = np.diff(self.offsets)
+        nrings = len(ring_lengths)
+        starts = self.offsets[:-1] + np.arange(nrings)
+        closes = self.offsets[1:] + np.arange(nrings)
+
+        vertices = np.empty((len(self.coords) + nrings, 2), dtype=self.coords.dtype)
+        vertices[np.arange(len(self.coords)) + np.repeat(np.arange(nrings), ring_lengths)] = self.coords
+        vertices[closes] = self.coords[self.offsets[1:] - 1]
+
+        codes = np.full(len(vertices), Path.LINETO, dtype=Path.code_type)
+        codes[starts] = Path.MOVETO
+        codes[closes] = Path.CLOSEPOLY
+        return Path(vertices, codes)
        
 
 class ClosedLine(Shape): 
 
     def plot(self, img, color, filled):
+        import cv2
         cv2.polylines(img, self.points[0], True, color)
 
 class OpenLine(Shape): 
 
     def plot(self, img, color, filled):
+        import cv2
         for p in self.points[0]: 
             cv2.circle(img, (p[0], p[1]), 1, color) 
 
 class DashedLine(Shape): 
 
     def plot(self, img, color, filled):
+        import cv2
         for i in range(0, len(self.points[0]), 2):
             cv2.polylines(img, [self.points[0][i:i + 2]], False, color)
 
 
+def plot_shapes(img, shapes, color, filled=True): 
+    '''Plot shapes in one color and in layer order
+
+    Each ModelCluster is drawn with one fillPoly/polylines call over all of its contours, 
+    read from the cached integer contours instead of an asint() copy. Parity filling is 
+    what makes a cluster's inner loops holes, so it is kept within a cluster and never 
+    applied across clusters: overlapping clusters stay filled.
+    '''
+    for elem in shapes: 
+        if type(elem) is ModelCluster: 
+            elem.plot(img, color, filled)
+        else: 
+            elem.asint().plot(img, color, filled)
+
+
+def layer_to_shapely(layer): 
+    '''Shapely Polygons of all ModelClusters in a layer, built with two vectorized GEOS calls
+
+    Returns an object array with one polygon per ModelCluster, in layer order; the first loop 
+    of each cluster is the exterior and the rest are holes, as in ModelCluster.shapely.
+    '''
+    import shapely
+    clusters = [elem for elem in layer if type(elem) is ModelCluster]
+    if not clusters: 
+        return np.empty(0, dtype=object)
+
+    coords = np.concatenate([elem.coords for elem in clusters], axis=0)
+    ring_lengths = np.concatenate([np.diff(elem.offsets) for elem in clusters])
+    ring_indices = np.repeat(np.arange(len(ring_lengths)), ring_lengths)
+    polygon_indices = np.repeat(np.arange(len(clusters)), [len(elem.offsets) - 1 for elem in clusters])
+
+    rings = shapely.linearrings(coords, indices=ring_indices)
+    return shapely.polygons(rings, indices=polygon_indices)
+
+
 class LayerList(list): 
 
     def __init__(self, *argv):
@@ -339,7 +474,7 @@ class LayerList(list):
     def mask(self, res): 
         output = np.zeros((res[0], res[1]), dtype=np.uint8)
         for index, part in enumerate(self): 
-            for elem in part.shapes: elem.asint().plot(output, color=(index + 1), filled=True)
+            plot_shapes(output, part.shapes, color=(index + 1), filled=True)
         return output
 
 class Layer: 
@@ -348,6 +483,7 @@ class Layer:
         self.z = z
         self.shapes = shapes
         self.part = part
+        self._by_type = None
 
     def __add__(self, other):
         if other is None: return self 
@@ -360,6 +496,13 @@ class Layer:
         return Layer(self.z, [elem.asint() for elem in self.shapes])
 
     def filter(self, *argv): 
+        if len(argv) == 1: 
+            # Shapes partitioned by type on first use, so filter(ModelCluster) is a lookup
+            if self._by_type is None: 
+                self._by_type = {}
+                for elem in self.shapes: 
+                    self._by_type.setdefault(type(elem), []).append(elem)
+            return Layer(self.z, list(self._by_type.get(argv[0], ())), self.part)
         include = set(argv)
         return Layer(self.z, [elem for elem in self.shapes if type(elem) in include], self.part)
 
@@ -370,16 +513,30 @@ class Layer:
         return self.shapes[key]
 
     def mask(self, res, color=False, filled=True): 
-        output = np.zeros((res[0], res[1]), dtype=np.uint8)
-        for elem in self.shapes: elem.asint().plot(output, color=255, filled=filled)
-        if color: return cv2.cvtColor(output, cv2.COLOR_GRAY2RGB)
+        output = self.mask_into(np.empty((res[0], res[1]), dtype=np.uint8), filled=filled)
+        if color: 
+            import cv2
+            return cv2.cvtColor(output, cv2.COLOR_GRAY2RGB)
         return output
 
+    def mask_into(self, out, filled=True): 
+        '''Render the mask into an existing uint8 image, clearing it first, and return it'''
+        out.fill(0)
+        plot_shapes(out, self.shapes, color=255, filled=filled)
+        return out
+
     def plot(self, img, color, filled=False): 
-        for elem in self.shapes: elem.asint().plot(img, color=color, filled=filled)
+        plot_shapes(img, self.shapes, color=color, filled=filled)
 
     def show(self, res):
-        img = self.mask(res, color=True)
+        import cv2
+        # Gray mask and the writable RGB image for putText are reused per resolution across calls
+        shape = (res[0], res[1])
+        if shape not in _SHOW_BUFFERS: 
+            _SHOW_BUFFERS[shape] = (np.empty(shape, dtype=np.uint8), np.empty(shape + (3,), dtype=np.uint8))
+        output, img = _SHOW_BUFFERS[shape]
+        self.mask_into(output)
+        img[...] = output[..., None]
         cv2.putText(img, "%.2f" % self.z, (0, 30), cv2.FONT_HERSHEY_SIMPLEX, 1,  (255, 255, 255), 1, cv2.LINE_AA, False)
         cv2.imshow("Layer", img)
 
@@ -400,6 +557,15 @@ class LayerPointer:
             else: 
                 raise UknownSectionException(sid)
 
+    @classmethod
+    def from_seek(cls, parent, z, index): 
+        '''LayerPointer from already decoded seek table values'''
+        out = cls.__new__(cls)
+        out.parent = parent
+        out.z = z
+        out.index = index
+        return out
+
     def load(self): 
         self.parent.buffer.seek(self.index)
         sid = self.parent.buffer.lf_int()
@@ -416,8 +582,7 @@ class Box:
             self.min = min
             self.max = max 
         else: 
-            self.min = np.array(f.lf_float(3))
-            self.max = np.array(f.lf_float(3))
+            self.min, self.max = f.box()
 
     def copy(self): 
         return Box(min=self.min.copy(), max=self.max.copy())
@@ -445,7 +610,21 @@ class Box:
             dy = height / (self.max[1] - self.min[1])
             pixels = (height, width)
      
-        return lambda x, y: ( dx * (x - self.min[0]), pixels[0] - dy * (y - self.min[1]) ), pixels
+        mx, my = self.min[0], self.min[1]
+        func = lambda x, y: ( dx * (x - mx), pixels[0] - dy * (y - my) )
+
+        def xform(xy): 
+            out = np.empty(xy.shape, dtype=np.result_type(xy, mx, dx))
+            np.subtract(xy[:, 0], mx, out=out[:, 0])
+            out[:, 0] *= dx
+            np.subtract(xy[:, 1], my, out=out[:, 1])
+            out[:, 1] *= -dy
+            out[:, 1] += pixels[0]
+            return out
+
+        # Whole (M, 2) block variant, picked up by Shape.transform
+        func.xy = xform
+        return func, pixels
 
     def transform(self, func): 
 
@@ -483,48 +662,104 @@ class ModelInfo:
     def __str__(self):  
         return "Name: {}\nIdentifier: {}\nLayer Thickness: {}\nBox: \n{}\n".format(self.name, self.id, self.thickness, self.box) 
 
-class ByteStream(io.BufferedReader): 
+# Number of bytes following the first byte of an lf_number, indexed by that first byte
+_LF_LEN = bytes([(i >> 5) for i in range(256)])
+
+# Precompiled float layouts: one lf_float, and a Box (min xyz then max xyz)
+_F1 = struct.Struct('f')
+_F6 = struct.Struct('6f')
+
+class ByteStream: 
     '''Utility to read clf file datatypes
 
     The CLF file format features some strange data format features. 
     This utility can be used to read raw bytes but also to read out lf_number and lf_float types. 
+    Files are memory-mapped, so reads and seeks are offsets into the mapping rather than 
+    buffered file I/O. 
     
     Example: 
     >> stream = ByteStream(filename)
     >> sid, num = stream.header() # read section identifier and number of bytes
     >> my_int = stream.lf_int() # read lf_number type
-    >> print(stream.nread) # see number of bytes read
+    >> print(stream.tell()) # see number of bytes read
     >> stream.close() 
     '''
 
     def __init__(self, filename, buffer=1024): 
+        # buffer is unused since the file is mapped; kept so existing calls still work
         if type(filename) is str: 
-            file = io.FileIO(filename)
+            with io.open(filename, 'rb') as file: 
+                self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
         elif type(filename) is io.BytesIO: 
-            file = filename
+            self.data = filename.getvalue()
         elif type(filename) is bytes: 
-            file = io.BytesIO(filename)
+            self.data = filename
         else: 
             raise Exception('Unsupported input type')
-        super().__init__(file, buffer * 8)
+        self.pos = 0
+
+    def read(self, n=-1): 
+        start = self.pos
+        self.pos = len(self.data) if n < 0 else min(start + n, len(self.data))
+        return self.data[start:self.pos]
+
+    def seek(self, offset, whence=io.SEEK_SET): 
+        if whence == io.SEEK_CUR: 
+            offset += self.pos
+        elif whence == io.SEEK_END: 
+            offset += len(self.data)
+        self.pos = offset
+        return offset
+
+    def tell(self): 
+        return self.pos
+
+    def close(self): 
+        if type(self.data) is mmap.mmap: 
+            self.data.close()
 
     def lf_int(self, n=None):
 
+        data = self.data
         if n is None:  
-            b0 = self.read(1)
-            n = b0[0] >> 5
-            b = bytes([b0[0] & 0x1F]) + self.read(n)
-            return int.from_bytes(b, "big")
+            b0 = data[self.pos]
+            n = _LF_LEN[b0]
+            start = self.pos + 1
+            self.pos = start + n
+            if n == 0: 
+                return b0 & 0x1F
+            return ((b0 & 0x1F) << (8 * n)) | int.from_bytes(data[start:self.pos], "big")
         else: 
-            return [self.lf_int() for i in range(n)]
+            pos = self.pos
+            out = []
+            for i in range(n): 
+                b0 = data[pos]
+                m = _LF_LEN[b0]
+                out.append(b0 & 0x1F if m == 0 else ((b0 & 0x1F) << (8 * m)) | int.from_bytes(data[pos + 1:pos + 1 + m], "big"))
+                pos += 1 + m
+            self.pos = pos
+            return out
+
+    def float32_array(self, n): 
+        '''Read n float32 values straight from the mapping into a new (writable) array'''
+        out = np.frombuffer(self.data, dtype=np.float32, count=n, offset=self.pos).copy()
+        self.pos += 4 * n
+        return out
 
     def lf_float(self, n=None):
         if n is None: 
-            b = self.read(4)
-            output = struct.unpack('f', b)[0]
+            output = _F1.unpack_from(self.data, self.pos)[0]
+            self.pos += 4
             return output
         else: 
-            return [self.lf_float() for i in range(n)]
+            # float64 like the Python floats the scalar form returns
+            return self.float32_array(n).astype(np.float64)
+
+    def box(self): 
+        '''Read the 6 floats of a Box as (min, max) float64 arrays'''
+        values = _F6.unpack_from(self.data, self.pos)
+        self.pos += _F6.size
+        return np.array(values[:3]), np.array(values[3:])
 
     def skip(self): 
         n = self.lf_int()
@@ -613,6 +848,61 @@ class ByteStream(io.BufferedReader):
         shapes = [elem for i_model, cluster_type, polygons in clusters for elem in cluster_type.construct(parent.models[i_model], polygons, points)] 
         return Layer(z, shapes, parent)
 
+def _lf_int_at(buf, pos): 
+    # lf_number at buf[pos] -> (value, position after it), as ByteStream.lf_int
+    b0 = buf[pos]
+    value = b0 & 0x1F
+    for k in range(b0 >> 5): 
+        value = (value << 8) | buf[pos + 1 + k]
+    return value, pos + 1 + (b0 >> 5)
+
+def _decode_seek_table_loop(buf, pos, end): 
+    '''Decode seek table entries in buf[pos:end] into (zs, indices, end position, bad id)
+
+    bad is -1 when every section was recognised, otherwise the unknown identifier 
+    (decoding stops there), or -2 for an entry without a z value.
+    '''
+    # The smallest entry is 2 bytes (id and a zero length), so this bounds the entry count
+    cap = (end - pos) // 2 + 1
+    zs = np.empty(cap, dtype=np.float32)
+    indices = np.empty(cap, dtype=np.int64)
+    tmp = np.empty(4, dtype=np.uint8)
+    count = 0
+    while pos < end and count < cap: 
+        sid, pos = _lf_int_at(buf, pos)
+        if sid != 0: 
+            return zs[:count], indices[:count], pos, sid
+        nbytes, pos = _lf_int_at(buf, pos)
+        last = pos + nbytes
+        z = np.float32(0.0)
+        has_z = False
+        index = -1
+        while pos < last: 
+            tag, pos = _lf_int_at(buf, pos)
+            num, pos = _lf_int_at(buf, pos)
+            if tag == 0: 
+                tmp[:] = buf[pos:pos + 4]
+                z = tmp.view(np.float32)[0]
+                has_z = True
+                pos += 4
+            elif tag == 1: 
+                index, pos = _lf_int_at(buf, pos)
+            else: 
+                return zs[:count], indices[:count], pos, tag
+        if not has_z: 
+            return zs[:count], indices[:count], pos, -2
+        zs[count] = z
+        indices[count] = index
+        count += 1
+    return zs[:count], indices[:count], pos, -1
+
+if njit is not None: 
+    _lf_int_at = njit(cache=True)(_lf_int_at)
+    _decode_seek_table = njit(cache=True)(_decode_seek_table_loop)
+else: 
+    # Interpreted, this is slower than ByteStream over the mmap, so _read_seek_table keeps that path
+    _decode_seek_table = None
+
 class UknownSectionException(Exception): 
     def __init__(self, sid): 
         super().__init__("Uknown section identifier: " + str(sid))
@@ -622,16 +912,24 @@ class PointBuffer:
     def __init__(self, f, n): 
         self.nread = 0
         ilast = f.last()
-        self.points = [(f.lf_float(), f.lf_float()) for i in range(n)]
+        # One bulk read of n (x, y) float32 pairs
+        self.points = f.float32_array(2 * n).reshape(-1, 2)
         assert(f.tell() == ilast)
     
     def get(self, n): 
         iend = self.nread + n
-        out = np.array(self.points[self.nread:iend])
+        out = self.points[self.nread:iend]
         self.nread = iend
         return out
 
+    def get_many(self, lengths): 
+        '''Read consecutive polygons as one (sum(lengths), 2) view plus offsets into it'''
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(lengths)
+        return self.get(int(offsets[-1])), offsets
+
 if __name__ == "__main__": 
+    import cv2
     #filename = sys.argv[1]
     build = Build("C:/Data/Cups/Models/Cup body Voronoi_%i/Part.clf", range(1, 49))
     (func, res) = build.box.toimage(1024)
@@ -7,6 +7,11 @@ from shapely.geometry import MultiPoint
 from ctypes import Union
 from typing import Callable, Iterator, List
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 class Image: 
     """
     Pointer to image file
@@ -102,10 +107,10 @@ class CalibrationPattern:
         v = v[index]
 
         A = np.stack((x**3, x**2 * y, x * y**2, y**3, x**2, x * y, y**2, x, y, np.ones(x.shape)), axis = 1)
-        AT = A.transpose()
-        ATA = AT.dot(A)
+        # Least squares on A itself for both u and v at once, rather than the normal equations
+        solution = np.linalg.lstsq(A, np.column_stack((u, v)), rcond=None)[0]
 
-        coeff = ( np.linalg.solve(ATA, AT.dot(u)), np.linalg.solve(ATA, AT.dot(v)) )
+        coeff = ( solution[:, 0], solution[:, 1] )
         return lambda x, y: polymap(coeff, x, y)
 
 class CartesianPattern(CalibrationPattern): 
@@ -146,11 +151,35 @@ def polymap(coefficients : Union[np.array, list[float]], x : Union[np.array, flo
     Transformed x-coordinates
     Transformed y-coordinates
     """
-    c = coefficients[0] 
-    u = c[0] * x**3 + c[1] * x**2 * y + c[2] * x * y**2 + c[3] * y**3 + c[4] * x**2 + c[5] * x * y + c[6] * y**2 + c[7] * x + c[8] * y + c[9]
-    c = coefficients[1]
-    v = c[0] * x**3 + c[1] * x**2 * y + c[2] * x * y**2 + c[3] * y**3 + c[4] * x**2 + c[5] * x * y + c[6] * y**2 + c[7] * x + c[8] * y + c[9]
-    return u, v
+    if _polymap_kernel is not None and (np.ndim(x) > 0 or np.ndim(y) > 0): 
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+        u = np.empty(x.size)
+        v = np.empty(x.size)
+        _polymap_kernel(np.asarray(coefficients, dtype=np.float64), np.ascontiguousarray(x).ravel(), 
+                        np.ascontiguousarray(y).ravel(), u, v)
+        return u.reshape(x.shape), v.reshape(x.shape)
+
+    return _cubic(coefficients[0], x, y), _cubic(coefficients[1], x, y)
+
+def _cubic(c, x, y): 
+    # c[0] x^3 + c[1] x^2 y + c[2] x y^2 + c[3] y^3 + c[4] x^2 + c[5] x y + c[6] y^2 + c[7] x + c[8] y + c[9], in Horner form
+    return ((c[0] * x + c[1] * y + c[4]) * x + c[5] * y + c[7]) * x + ((c[2] * x + c[3] * y + c[6]) * y + c[8]) * y + c[9]
+
+def _polymap_loop(coefficients, x, y, u, v): 
+    # Both polynomials of polymap evaluated in one pass over flat float64 arrays. Compiled 
+    # without fastmath, so it rounds like _cubic and NaN calibration points stay NaN
+    a = coefficients[0]
+    b = coefficients[1]
+    for k in range(x.size): 
+        xk = x[k]
+        yk = y[k]
+        u[k] = ((a[0] * xk + a[1] * yk + a[4]) * xk + a[5] * yk + a[7]) * xk + ((a[2] * xk + a[3] * yk + a[6]) * yk + a[8]) * yk + a[9]
+        v[k] = ((b[0] * xk + b[1] * yk + b[4]) * xk + b[5] * yk + b[7]) * xk + ((b[2] * xk + b[3] * yk + b[6]) * yk + b[8]) * yk + b[9]
+
+if njit is not None: 
+    _polymap_kernel = njit(cache=True)(_polymap_loop)
+else: 
+    _polymap_kernel = None
 
 class Points: 
     """
@@ -310,10 +339,9 @@ class CalibrationPoints(Points):
         dy = np.array([np.median(np.abs(yi - y[i])) for (yi, i) in zip(y, index)])
 
         A = np.stack((x, y, np.ones(x.shape)), axis = 1)
-        AT = A.transpose()
-        ATA = AT.dot(A)
-        dxcoeff = np.linalg.solve(ATA, AT.dot(dx))
-        dycoeff = np.linalg.solve(ATA, AT.dot(dy))
+        solution = np.linalg.lstsq(A, np.column_stack((dx, dy)), rcond=None)[0]
+        dxcoeff = solution[:, 0]
+        dycoeff = solution[:, 1]
 
         Nx = int(self.dimensions[0] / np.median(dx)) + 1
         Ny = int(self.dimensions[1] / np.median(dy)) + 1
@@ -323,40 +351,47 @@ class CalibrationPoints(Points):
         U = np.full((Nx, Ny), np.nan)
         V = np.full((Nx, Ny), np.nan)
 
-        for i in range(Nx): 
-            for j in range(Ny):
-                n = 0
-
-                if i > 0:  
-                    dx = X[i - 1, j] * dxcoeff[0] + Y[i - 1, j] * dxcoeff[1] + dxcoeff[2]
-                    X[i, j] += X[i - 1, j] + dx
-                    Y[i, j] += Y[i - 1, j]
-                    n += 1
-
-                if j > 0: 
-                    dy = X[i, j - 1] * dycoeff[0] + Y[i, j - 1] * dycoeff[1] + dycoeff[2]
-                    X[i, j] += X[i, j - 1]
-                    Y[i, j] += Y[i, j - 1] + dy
-                    n += 1
-
-                if n > 0: 
-                    X[i, j] = X[i, j] / n
-                    Y[i, j] = Y[i, j] / n
-
-                dx = X[i, j] * dxcoeff[0] + Y[i, j] * dxcoeff[1] + dxcoeff[2]
-                dy = X[i, j] * dycoeff[0] + Y[i, j] * dycoeff[1] + dycoeff[2]
-
-                xdiff = X[i, j] - x
-                ydiff = Y[i, j] - y
-                imin = np.argmin(np.square(xdiff) + np.square(ydiff))
-                ok = np.abs(xdiff[imin]) / dx < precision and np.abs(ydiff[imin]) / dy < precision
-
-                if not ok: continue
-                X[i, j] = x[imin] 
-                Y[i, j] = y[imin]
-                U[i, j] = uv[0, imin] 
-                V[i, j] = uv[1, imin]
-                
+        # Cell (i, j) is predicted from (i - 1, j) and (i, j - 1) only, so all cells on one 
+        # anti-diagonal i + j = k can be predicted and matched to their nearest point together
+        for k in range(Nx + Ny - 1): 
+            i = np.arange(max(0, k - Ny + 1), min(k, Nx - 1) + 1)
+            j = k - i
+            Xk = np.zeros(i.shape)
+            Yk = np.zeros(i.shape)
+            n = np.zeros(i.shape)
+
+            up = i > 0
+            Xp = X[i[up] - 1, j[up]]
+            Yp = Y[i[up] - 1, j[up]]
+            Xk[up] += Xp + (Xp * dxcoeff[0] + Yp * dxcoeff[1] + dxcoeff[2])
+            Yk[up] += Yp
+            n[up] += 1
+
+            left = j > 0
+            Xl = X[i[left], j[left] - 1]
+            Yl = Y[i[left], j[left] - 1]
+            Xk[left] += Xl
+            Yk[left] += Yl + (Xl * dycoeff[0] + Yl * dycoeff[1] + dycoeff[2])
+            n[left] += 1
+
+            nonzero = n > 0
+            Xk[nonzero] = Xk[nonzero] / n[nonzero]
+            Yk[nonzero] = Yk[nonzero] / n[nonzero]
+
+            dx = Xk * dxcoeff[0] + Yk * dxcoeff[1] + dxcoeff[2]
+            dy = Xk * dycoeff[0] + Yk * dycoeff[1] + dycoeff[2]
+
+            xdiff = Xk[:, None] - x[None, :]
+            ydiff = Yk[:, None] - y[None, :]
+            imin = np.argmin(np.square(xdiff) + np.square(ydiff), axis=1)
+            rows = np.arange(len(i))
+            ok = (np.abs(xdiff[rows, imin]) / dx < precision) & (np.abs(ydiff[rows, imin]) / dy < precision)
+
+            X[i, j] = np.where(ok, x[imin], Xk)
+            Y[i, j] = np.where(ok, y[imin], Yk)
+            U[i[ok], j[ok]] = uv[0, imin[ok]]
+            V[i[ok], j[ok]] = uv[1, imin[ok]]
+
 
         while True:
             if np.isnan(U[-1, :]).all(): 
@@ -0,0 +1,134 @@
+# test_clf_layer.py
+"""
+Check Layer drawing in clfutil
+"""
+import os
+import sys
+
+import numpy as np
+
+# Add the src directory to the path to find our utils
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(script_dir, "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from utils.pyarcam.clfutil import Box, Build, Layer, ModelCluster, layer_to_shapely
+
+
+def square(x0, y0, size):
+    return np.array([[x0, y0], [x0 + size, y0], [x0 + size, y0 + size], [x0, y0 + size]], dtype=np.float32)
+
+
+def test_mask_fills_overlapping_clusters():
+    """Overlapping clusters stay filled, while a cluster's own inner loop is a hole"""
+    print("Testing Layer.mask...")
+
+    with_hole = ModelCluster(None, [square(10, 10, 40), square(20, 20, 10)])
+    overlapping = ModelCluster(None, [square(40, 40, 40)])
+    mask = Layer(0.0, [with_hole, overlapping]).mask((100, 100))
+
+    assert mask[45, 45] == 255, "Overlap of two clusters should be filled"
+    assert mask[25, 25] == 0, "Inner loop of a cluster should be a hole"
+    assert mask[15, 15] == 255 and mask[70, 70] == 255
+    assert mask[5, 5] == 0
+    print("✓ overlapping clusters are filled")
+
+
+def test_color_mask_is_writable():
+    """mask(color=True) returns an RGB image that can be drawn on"""
+    import cv2
+
+    layer = Layer(0.0, [ModelCluster(None, [square(10, 10, 40)])])
+    rgb = layer.mask((64, 64), color=True)
+    assert rgb.shape == (64, 64, 3) and rgb.flags.writeable
+    cv2.rectangle(rgb, (0, 0), (5, 5), (255, 0, 0), -1)
+    assert tuple(rgb[2, 2]) == (255, 0, 0)
+
+    gray = layer.mask((64, 64))
+    np.testing.assert_array_equal(rgb[10:, 10:], np.repeat(gray[10:, 10:, None], 3, axis=2))
+    print("✓ color masks are writable")
+
+
+def test_layer_to_shapely():
+    """layer_to_shapely builds one polygon per cluster, matching ModelCluster.shapely"""
+    cluster = ModelCluster(None, [square(0, 0, 10), square(2, 2, 3)[:3]])
+    polygons = layer_to_shapely([cluster, ModelCluster(None, [square(20, 20, 5)])])
+    assert len(polygons) == 2
+    assert polygons[0].equals(cluster.shapely())
+    assert abs(polygons[0].area - (100.0 - 4.5)) < 1e-9 and abs(polygons[1].area - 25.0) < 1e-9
+    assert len(layer_to_shapely([])) == 0
+    print("✓ layer_to_shapely")
+
+
+def test_model_cluster_path():
+    """ModelCluster.path closes every ring with a CLOSEPOLY on a repeated last vertex"""
+    from matplotlib.path import Path
+
+    rings = [square(0, 0, 10), square(2, 2, 3)[:3]]
+    path = ModelCluster(None, rings).path()
+    expected_vertices = np.concatenate([np.vstack([ring, ring[-1:]]) for ring in rings])
+    expected_codes = []
+    for ring in rings:
+        expected_codes += [Path.MOVETO] + [Path.LINETO] * (len(ring) - 1) + [Path.CLOSEPOLY]
+    np.testing.assert_array_equal(path.vertices, expected_vertices)
+    np.testing.assert_array_equal(path.codes, expected_codes)
+    print("✓ ModelCluster.path")
+
+
+class FakeCLFFile:
+    """Stand-in for CLFFile that counts find calls and returns one cluster per layer"""
+
+    def __init__(self, z_min, z_max):
+        self.box = Box(min=np.array([0.0, 0.0, z_min]), max=np.array([10.0, 10.0, z_max]))
+        self.calls = 0
+
+    def find(self, z):
+        self.calls += 1
+        return Layer(z, [ModelCluster(None, [square(0, 0, 1)])], self)
+
+
+def make_build(files):
+    build = Build.__new__(Build)
+    build.files = files
+    return build
+
+
+def test_build_find_returns_fresh_layers():
+    """Repeat finds reuse the parsed shapes but never hand out the cached Layer itself"""
+    print("Testing Build.find...")
+
+    part = FakeCLFFile(0.0, 5.0)
+    build = make_build([part, FakeCLFFile(6.0, 9.0)])
+
+    first = build.find(1.0)
+    assert first.part is part and first.z == 1.0 and len(first.shapes) == 1, "One file keeps its part"
+    first.shapes.append('changed by the caller')
+
+    second = build.find(1.0)
+    assert second is not first
+    assert len(second.shapes) == 1, "Changing a returned layer should not change the cache"
+    assert part.calls == 1, "Same z should reuse the parsed shapes"
+    print("✓ repeat finds return fresh layers")
+
+    # Files added in place invalidate the cached layer
+    build.files.append(FakeCLFFile(0.0, 5.0))
+    merged = build.find(1.0)
+    assert len(merged.shapes) == 2 and merged.part is None, "A merge of several files has no part"
+    assert part.calls == 2
+    print("✓ in-place changes to the file list are noticed")
+
+    # Nothing in range: the single-file build keeps its part, a multi-file build has none
+    assert build.find(20.0).part is None and build.find(20.0).shapes == []
+    single = make_build([part])
+    assert single.find(20.0).part is part
+    print("✓ empty layers follow the same part convention")
+
+
+if __name__ == "__main__":
+    test_mask_fills_overlapping_clusters()
+    test_color_mask_is_writable()
+    test_layer_to_shapely()
+    test_model_cluster_path()
+    test_build_find_returns_fresh_layers()
+    print("\n🎉 All layer tests passed!")
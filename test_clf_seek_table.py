@@ -0,0 +1,93 @@
+# test_clf_seek_table.py
+"""
+Check the compiled CLF seek table decoder against the ByteStream reader
+"""
+import os
+import struct
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add the src directory to the path to find our utils
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(script_dir, "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from utils.pyarcam.clfutil import ByteStream, LayerPointer, _decode_seek_table, _decode_seek_table_loop
+
+
+def lf_int(value):
+    """Encode value as a CLF lf_number: 5 value bits in the first byte, then big-endian bytes"""
+    extra = 0
+    while value >> (8 * extra) >= 32:
+        extra += 1
+    high = value >> (8 * extra)
+    return bytes([(extra << 5) | high]) + (value & ((1 << (8 * extra)) - 1)).to_bytes(extra, 'big')
+
+
+def seek_entry(z=None, index=None):
+    """One seek table entry: section 0 holding the z (tag 0) and layer index (tag 1) sections"""
+    body = b''
+    if z is not None:
+        body += lf_int(0) + lf_int(4) + struct.pack('f', z)
+    if index is not None:
+        encoded = lf_int(index)
+        body += lf_int(1) + lf_int(len(encoded)) + encoded
+    return lf_int(0) + lf_int(len(body)) + body
+
+
+def read_with_bytestream(data):
+    """Seek table decoded the way CLFFile does without numba"""
+    f = ByteStream(data)
+    parent = SimpleNamespace(buffer=f)
+    pointers = []
+    while f.tell() < len(data):
+        sid = f.lf_int()
+        assert sid == 0
+        pointers.append(LayerPointer(parent))
+    return pointers
+
+
+def test_seek_table_matches_bytestream():
+    """The kernel decodes the same z values and indices as LayerPointer over a ByteStream"""
+    print("Testing seek table decoding...")
+
+    entries = [(0.05, 17), (0.1, 300), (0.15, 70000), (12.5, 5_000_000)]
+    data = b''.join(seek_entry(z, index) for z, index in entries)
+    buf = np.frombuffer(data, dtype=np.uint8)
+
+    zs, indices, pos, bad = _decode_seek_table_loop(buf, 0, len(data))
+    pointers = read_with_bytestream(data)
+    assert bad == -1 and pos == len(data)
+    assert zs.tolist() == [p.z for p in pointers]
+    assert indices.tolist() == [p.index for p in pointers] == [index for _, index in entries]
+
+    if _decode_seek_table is not None:
+        compiled = _decode_seek_table(buf, 0, len(data))
+        assert compiled[0].tolist() == zs.tolist() and compiled[1].tolist() == indices.tolist()
+        assert compiled[2:] == (pos, bad)
+    print("✓ kernel matches ByteStream")
+
+
+def test_seek_table_small_entries():
+    """Entries smaller than 8 bytes do not overrun the output arrays and a missing z is rejected"""
+    data = seek_entry(1.0, 3) + seek_entry(index=5) + b''.join(lf_int(0) + lf_int(0) for _ in range(20))
+    buf = np.frombuffer(data, dtype=np.uint8)
+
+    zs, indices, pos, bad = _decode_seek_table_loop(buf, 0, len(data))
+    assert bad == -2, "An entry without z should be rejected"
+    assert zs.tolist() == [1.0] and indices.tolist() == [3]
+    if _decode_seek_table is not None:
+        assert _decode_seek_table(buf, 0, len(data))[3] == -2
+
+    pointers = read_with_bytestream(data)
+    assert not hasattr(pointers[1], 'z')
+    print("✓ entries without z are rejected")
+
+
+if __name__ == "__main__":
+    test_seek_table_matches_bytestream()
+    test_seek_table_small_entries()
+    print("\n🎉 All seek table tests passed!")
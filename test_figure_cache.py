@@ -0,0 +1,97 @@
+# test_figure_cache.py
+"""
+Check that the reused view figures are kept per thread and can be released
+"""
+import os
+import sys
+import tempfile
+import threading
+
+import numpy as np
+
+# Add the src directory to the path to find our utils
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(script_dir, "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import matplotlib.pyplot as plt
+
+import utils.platform_analysis.visualization_utils as vu
+
+
+def test_figures_are_per_thread():
+    """A thread reuses its own figure, never another thread's"""
+    print("Testing the per-thread figure cache...")
+
+    main_fig, cached = vu._get_cached_figure((4, 4))
+    assert cached and vu._get_cached_figure((4, 4))[0] is main_fig
+
+    other = []
+
+    def other_thread():
+        other.append(vu._get_cached_figure((4, 4))[0])
+        other.append(vu._get_clean_platform_axes((4, 4))[0])
+        vu.release_cached_figures()
+
+    thread = threading.Thread(target=other_thread)
+    thread.start()
+    thread.join()
+
+    assert other[0] is not main_fig, "Another thread should get its own figure"
+    assert not plt.fignum_exists(other[0].number) and not plt.fignum_exists(other[1].number)
+    assert plt.fignum_exists(main_fig.number), "Releasing in one thread should leave other threads' figures"
+    print("✓ figures are cached per thread")
+
+    vu.release_cached_figures()
+    assert not plt.fignum_exists(main_fig.number)
+    assert vu._get_cached_figure((4, 4))[0] is not main_fig, "A released figure should not come back"
+    vu.release_cached_figures()
+    print("✓ release_cached_figures closes this thread's figures")
+
+
+def test_clean_platform_from_threads():
+    """Clean platforms drawn from two threads at once match one drawn alone"""
+    def fake_parse(path, height):
+        squares = [np.array([[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]], dtype=np.float32) * (i + 1)
+                   for i in range(5)]
+        return tuple((None, (points,)) for points in squares)
+
+    def run(clf_files, output_dir):
+        vu.create_clean_platform(clf_files, output_dir, height=1.0, fill_closed=True)
+        vu.release_cached_figures()
+
+    def read_png(output_dir):
+        with open(os.path.join(output_dir, "clean_platforms", "clean_platform_1.0mm.png"), 'rb') as f:
+            return f.read()
+
+    original_parse = vu._parse_layer_points
+    vu._parse_layer_points = fake_parse
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'Part.clf')
+            with open(path, 'wb') as f:
+                f.write(b'a')
+            clf_files = [{'path': path, 'name': 'Part.clf', 'folder': 'Skin'}]
+
+            output_dirs = [os.path.join(temp_dir, name) for name in ('alone', 'a', 'b')]
+            run(clf_files, output_dirs[0])
+            threads = [threading.Thread(target=run, args=(clf_files, output_dir)) for output_dir in output_dirs[1:]]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            expected = read_png(output_dirs[0])
+            for output_dir in output_dirs[1:]:
+                assert read_png(output_dir) == expected, "Concurrent clean platforms should not share a figure"
+    finally:
+        vu._parse_layer_points = original_parse
+        vu.clear_layer_cache()
+    print("✓ concurrent clean platforms match")
+
+
+if __name__ == "__main__":
+    test_figures_are_per_thread()
+    test_clean_platform_from_threads()
+    print("\n🎉 All figure cache tests passed!")
@@ -0,0 +1,81 @@
+# test_identifier_views.py
+"""
+Check that the batched identifier views write one PNG per identifier
+"""
+import os
+import sys
+import tempfile
+import threading
+
+import numpy as np
+
+# Add the src directory to the path to find our utils
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(script_dir, "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from utils.platform_analysis.visualization_utils import create_identifier_platform_view_batch, release_cached_figures
+
+
+def _shapes_data(offset):
+    square = np.array([[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]], dtype=np.float32) + offset
+    shapes = [
+        {'type': 'path', 'points': square, 'should_close': True},
+        {'type': 'point', 'points': np.array([[offset, offset]], dtype=np.float32)},
+        {'type': 'circle', 'points': None, 'center': (offset, -offset), 'radius': 5.0},
+    ]
+    return {'shapes': shapes, 'count': len(shapes), 'height_range': (1.0, 2.0)}
+
+
+def test_identifier_platform_view_batch():
+    """Every identifier gets its own view, and a failing identifier does not stop the rest"""
+    print("Testing create_identifier_platform_view_batch...")
+
+    shapes_by_identifier = {'7': _shapes_data(0.0), '12': _shapes_data(20.0), 'broken': {'shapes': []}}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results = create_identifier_platform_view_batch(['7', 'broken', '12'], shapes_by_identifier, temp_dir)
+
+        assert results['broken'] is None, "An identifier with bad data should fail on its own"
+        for identifier in ('7', '12'):
+            filename = results[identifier]
+            assert filename == os.path.join("identifier_views", f"identifier_{identifier}_platform_view.png")
+            assert os.path.getsize(os.path.join(temp_dir, filename)) > 0
+    print("✓ one view per identifier")
+
+
+def test_identifier_views_from_threads():
+    """Batches run from two threads at once write the same PNGs as a batch run alone"""
+    shapes_by_identifier = {str(i): _shapes_data(5.0 * i) for i in range(6)}
+    identifiers = list(shapes_by_identifier)
+
+    def run_batch(output_dir):
+        create_identifier_platform_view_batch(identifiers, shapes_by_identifier, output_dir)
+        release_cached_figures()
+
+    def read_views(output_dir):
+        views = {}
+        for identifier in identifiers:
+            with open(os.path.join(output_dir, "identifier_views", f"identifier_{identifier}_platform_view.png"), 'rb') as f:
+                views[identifier] = f.read()
+        return views
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dirs = [os.path.join(temp_dir, name) for name in ('alone', 'a', 'b')]
+        run_batch(output_dirs[0])
+        threads = [threading.Thread(target=run_batch, args=(output_dir,)) for output_dir in output_dirs[1:]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expected = read_views(output_dirs[0])
+        for output_dir in output_dirs[1:]:
+            assert read_views(output_dir) == expected, "Concurrent batches should not draw into each other"
+    print("✓ concurrent batches write the same views")
+
+
+if __name__ == "__main__":
+    test_identifier_platform_view_batch()
+    test_identifier_views_from_threads()
+    print("\n🎉 All identifier view tests passed!")
@@ -0,0 +1,117 @@
+# test_layer_cache.py
+"""
+Check that the parsed-layer cache in visualization_utils notices rewritten CLF files
+and only keeps the most recent height
+"""
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+# Add the src directory to the path to find our utils
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(script_dir, "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import utils.platform_analysis.visualization_utils as vu
+
+
+def test_layer_cache():
+    """Repeat loads hit the cache; a rewrite or a new height parses again"""
+    print("Testing _load_layer_points cache...")
+
+    parsed = []
+
+    def fake_parse(path, height):
+        parsed.append((path, height))
+        return ((None, ()),) * len(parsed)
+
+    original_parse = vu._parse_layer_points
+    vu._parse_layer_points = fake_parse
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'Part.clf')
+            with open(path, 'wb') as f:
+                f.write(b'a')
+
+            vu.clear_layer_cache()
+            first = vu._load_layer_points(path, 1.0)
+            assert vu._load_layer_points(path, 1.0) is first, "Same file and height should be cached"
+            assert len(parsed) == 1
+            print("✓ repeat loads are cached")
+
+            # Rewrite with a different size and a newer mtime
+            with open(path, 'wb') as f:
+                f.write(b'bb')
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            assert vu._load_layer_points(path, 1.0) is not first, "Rewritten file should be parsed again"
+            assert len(parsed) == 2
+            print("✓ rewritten files are parsed again")
+
+            vu._load_layer_points(path, 2.0)
+            assert len(vu._LAYER_CACHE) == 1, "Moving to a new height should drop the previous one"
+            vu.clear_layer_cache()
+            assert not vu._LAYER_CACHE
+            print("✓ cache only holds the current height")
+    finally:
+        vu._parse_layer_points = original_parse
+        vu.clear_layer_cache()
+
+
+class InlinePool:
+    """Stand-in for a multiprocessing.Pool that runs map in this process and counts the calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def map(self, func, iterable):
+        self.calls += 1
+        return [func(args) for args in iterable]
+
+
+def test_pool_fills_parent_cache():
+    """Layers parsed on a pool land in this process's cache, so the next view at that height reuses them"""
+    print("Testing the multi-file layer cache...")
+
+    parsed = []
+
+    def fake_parse(path, height):
+        parsed.append((path, height))
+        return ((7, (np.zeros((3, 2), dtype=np.float32),)),)  # Writeable, like an unpickled result
+
+    original_parse = vu._parse_layer_points
+    vu._parse_layer_points = fake_parse
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            clf_files = []
+            for name in ('Part.clf', 'Net.clf'):
+                path = os.path.join(temp_dir, name)
+                with open(path, 'wb') as f:
+                    f.write(b'a')
+                clf_files.append({'path': path, 'name': name, 'folder': 'Skin'})
+
+            vu.clear_layer_cache()
+            pool = InlinePool()
+            extracted = vu._extract_all_layer_shapes(clf_files, 1.0, pool=pool)
+            assert pool.calls == 1 and len(parsed) == 2
+            assert [len(points) for _, points in extracted] == [1, 1]
+            assert not extracted[0][1][0].flags.writeable, "Cached arrays should be read-only"
+            print("✓ the pool parses each file once")
+
+            shape_data = vu._process_all_layer_data(clf_files, 1.0, vu._CLF_COLORS, pool=pool)
+            assert len(shape_data) == 2
+            assert pool.calls == 1 and len(parsed) == 2, "A second view at the same height should hit the cache"
+            assert shape_data[0]['points'] is extracted[0][1][0]
+            print("✓ the next view reuses the parsed layers")
+    finally:
+        vu._parse_layer_points = original_parse
+        vu.clear_layer_cache()
+
+
+if __name__ == "__main__":
+    test_layer_cache()
+    test_pool_fills_parent_cache()
+    print("\n🎉 All layer cache tests passed!")
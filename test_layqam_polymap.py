@@ -0,0 +1,83 @@
+# test_layqam_polymap.py
+"""
+Check layqam.polymap against the plain 10-term calibration polynomial
+"""
+import os
+import sys
+
+import numpy as np
+
+# Add the src directory to the path to find our utils
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(script_dir, "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from utils.pyarcam.layqam import CalibrationPattern, CartesianPattern, _cubic, polymap
+
+
+def baseline_cubic(c, x, y):
+    """The calibration polynomial written out term by term"""
+    return (c[0] * x**3 + c[1] * x**2 * y + c[2] * x * y**2 + c[3] * y**3 + c[4] * x**2
+            + c[5] * x * y + c[6] * y**2 + c[7] * x + c[8] * y + c[9])
+
+
+def _coefficients():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(2, 10)) * np.array([1e-6, 1e-6, 1e-6, 1e-6, 1e-4, 1e-4, 1e-4, 2.0, 0.1, 256.0])
+
+
+def test_polymap_matches_baseline():
+    """Arrays and scalars map to the term-by-term sum, and arrays match _cubic exactly"""
+    print("Testing polymap...")
+
+    coefficients = _coefficients()
+    x, y = np.meshgrid(np.linspace(-90, 90, 37), np.linspace(-90, 90, 29))
+    u, v = polymap(coefficients, x, y)
+
+    assert u.shape == x.shape and v.shape == x.shape
+    np.testing.assert_allclose(u, baseline_cubic(coefficients[0], x, y), rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(v, baseline_cubic(coefficients[1], x, y), rtol=1e-12, atol=1e-9)
+    np.testing.assert_array_equal(u, _cubic(coefficients[0], x, y))
+    np.testing.assert_array_equal(v, _cubic(coefficients[1], x, y))
+
+    us, vs = polymap(coefficients, 12.5, -3.0)
+    np.testing.assert_allclose(us, baseline_cubic(coefficients[0], 12.5, -3.0), rtol=1e-12)
+    np.testing.assert_allclose(vs, baseline_cubic(coefficients[1], 12.5, -3.0), rtol=1e-12)
+    print("✓ polymap matches the baseline polynomial")
+
+
+def test_polymap_propagates_nan():
+    """NaN calibration points map to NaN"""
+    coefficients = _coefficients()
+    x = np.array([1.0, np.nan, 3.0])
+    y = np.array([np.nan, 2.0, 3.0])
+    u, v = polymap(coefficients, x, y)
+    assert np.isnan(u[:2]).all() and np.isnan(v[:2]).all()
+    assert np.isfinite(u[2]) and np.isfinite(v[2])
+    print("✓ polymap propagates NaN")
+
+
+def test_polyfit_recovers_polynomial():
+    """polyfit reproduces a mapping that is itself a calibration polynomial, skipping NaN points"""
+    coefficients = _coefficients()
+    cartesian = CartesianPattern(11)
+    u, v = polymap(coefficients, cartesian.X, cartesian.Y)
+    u[0, 0] = np.nan
+    v[0, 0] = np.nan
+    image = CalibrationPattern(u, v)
+
+    func = cartesian.polyfit(image)
+    x, y = np.meshgrid(np.linspace(-10, 10, 5), np.linspace(-12, 8, 5))
+    fitted_u, fitted_v = func(x, y)
+    expected_u, expected_v = polymap(coefficients, x, y)
+    np.testing.assert_allclose(fitted_u, expected_u, rtol=0, atol=1e-8)
+    np.testing.assert_allclose(fitted_v, expected_v, rtol=0, atol=1e-8)
+    print("✓ polyfit recovers the polynomial")
+
+
+if __name__ == "__main__":
+    test_polymap_matches_baseline()
+    test_polymap_propagates_nan()
+    test_polyfit_recovers_polynomial()
+    print("\n🎉 All polymap tests passed!")
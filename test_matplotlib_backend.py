@@ -0,0 +1,44 @@
+# test_matplotlib_backend.py
+"""
+Check that importing the plotting helpers keeps a matplotlib backend chosen by the caller
+"""
+import os
+import subprocess
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(script_dir, "src")
+
+_IMPORT_AND_REPORT = (
+    "import sys; sys.path.insert(0, {src!r}); "
+    "import utils.myfuncs.plotTools, utils.myfuncs.print_utils, utils.platform_analysis.visualization_utils; "
+    "import matplotlib; print(matplotlib.get_backend().lower())"
+)
+
+
+def _backend_after_import(mplbackend):
+    env = dict(os.environ)
+    env.pop('MPLBACKEND', None)
+    if mplbackend is not None:
+        env['MPLBACKEND'] = mplbackend
+    result = subprocess.run([sys.executable, '-c', _IMPORT_AND_REPORT.format(src=src_dir)],
+                            env=env, capture_output=True, text=True, check=True)
+    return result.stdout.strip().splitlines()[-1]
+
+
+def test_backend_defaults_to_agg():
+    """Without a caller choice the helpers select Agg"""
+    assert _backend_after_import(None) == 'agg'
+    print("✓ Agg is the default backend")
+
+
+def test_caller_backend_wins():
+    """A backend set through MPLBACKEND before import is kept"""
+    assert _backend_after_import('svg') == 'svg'
+    print("✓ caller's backend is kept")
+
+
+if __name__ == "__main__":
+    test_backend_defaults_to_agg()
+    test_caller_backend_wins()
+    print("\n🎉 All backend tests passed!")
@@ -0,0 +1,78 @@
+# test_path_data_columns.py
+"""
+Check that the columnar path-data format round-trips shape data
+"""
+import json
+import os
+import sys
+
+import numpy as np
+
+# Add the src directory to the path to find our utils
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(script_dir, "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from utils.platform_analysis.visualization_utils import columns_to_shape_data, shape_data_to_columns
+
+
+def _shape_data_list():
+    """Two path shapes and a circle shape, as written to platform_layer_pathdata_*.json"""
+    rng = np.random.default_rng(1)
+    return [
+        {'type': 'path', 'points': (rng.uniform(-120, 120, (6, 2))).astype(np.float32), 'color': 'blue',
+         'identifier': '7_path_0', 'should_close': True, 'is_hole': False},
+        {'type': 'path', 'points': (rng.uniform(-120, 120, (3, 2))).astype(np.float32), 'color': 'red',
+         'identifier': 'shape_1_path_0', 'should_close': False, 'is_hole': True},
+        {'type': 'circle', 'points': None, 'center': [1.5, -2.25], 'radius': 4.0, 'color': 'blue',
+         'identifier': 'circle_0'},
+    ]
+
+
+def _assert_round_trip(original, restored, atol):
+    fields = set().union(*original)
+    assert len(restored) == len(original)
+    for expected, actual in zip(original, restored):
+        assert set(actual) == fields, "Every field should come back, missing ones as None"
+        for field in fields:
+            value = expected.get(field)
+            if field == 'points' and value is not None:
+                np.testing.assert_allclose(np.asarray(actual[field], dtype=np.float64), value, rtol=0, atol=atol)
+            else:
+                assert actual[field] == value, (field, actual[field], value)
+
+
+def test_columns_round_trip():
+    """columns_to_shape_data inverts shape_data_to_columns for every quantize mode"""
+    print("Testing columnar path data round trip...")
+
+    original = _shape_data_list()
+    for quantize, atol in ((None, 0.0), ('float32', 0.0), ('int16', 0.005 + 1e-9)):
+        data = shape_data_to_columns(original, quantize=quantize)
+        assert data['format'] == 'columns-v1'
+        assert data['palette'] == ['blue', 'red']
+        _assert_round_trip(original, columns_to_shape_data(data), atol)
+
+        # And through JSON text, as the file on disk is read back
+        text = json.dumps(data, default=lambda o: o.tolist())
+        _assert_round_trip(original, columns_to_shape_data(json.loads(text)), atol)
+        print(f"✓ round trip with quantize={quantize}")
+
+
+def test_columns_rejects_unknown_format():
+    """Data without the expected format key is refused instead of misread"""
+    data = shape_data_to_columns(_shape_data_list())
+    del data['format']
+    try:
+        columns_to_shape_data(data)
+    except ValueError:
+        print("✓ unknown formats are rejected")
+        return
+    raise AssertionError("Missing format should raise ValueError")
+
+
+if __name__ == "__main__":
+    test_columns_round_trip()
+    test_columns_rejects_unknown_format()
+    print("\n🎉 All path data tests passed!")
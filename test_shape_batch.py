@@ -0,0 +1,130 @@
+# test_shape_batch.py
+"""
+Check the batched shape helpers in visualization_utils
+"""
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+# Add the src directory to the path to find our utils
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(script_dir, "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from utils.platform_analysis.visualization_utils import (
+    ShapeBatch,
+    _clean_platform_cache_key,
+    build_shape_columns,
+    is_shape_inside_shape,
+)
+from utils.myfuncs.shape_things import CIRCLE_POINTS
+
+
+def _square(x0, y0, size, n_side=1):
+    t = np.linspace(0, size, n_side + 1)[:-1]
+    return np.concatenate([
+        np.column_stack([x0 + t, np.full_like(t, y0)]),
+        np.column_stack([np.full_like(t, x0 + size), y0 + t]),
+        np.column_stack([x0 + size - t, np.full_like(t, y0 + size)]),
+        np.column_stack([np.full_like(t, x0), y0 + size - t]),
+        [[x0, y0]],
+    ])
+
+
+def _shape_data_list():
+    return [
+        {'type': 'path', 'points': _square(0, 0, 10, n_side=4), 'color': 'blue', 'should_close': True,
+         'identifier': 'a'},
+        {'type': 'point', 'points': np.array([[500.0, 500.0]]), 'color': 'red', 'identifier': 'b'},
+        {'type': 'circle', 'points': None, 'center': (5.0, 5.0), 'radius': 2.0, 'color': 'blue', 'identifier': 'c'},
+        {'type': 'path', 'points': None, 'color': 'green', 'identifier': 'd'},
+    ]
+
+
+def test_shape_batch_from_shape_data():
+    """Columns, offsets, bounding boxes and platform mask follow the shape dicts"""
+    print("Testing ShapeBatch...")
+
+    shapes = _shape_data_list()
+    batch = ShapeBatch.from_shape_data(shapes)
+
+    assert len(batch) == 4
+    assert batch.type_code.tolist() == [ShapeBatch.PATH, ShapeBatch.POINT, ShapeBatch.CIRCLE, ShapeBatch.INVALID]
+    assert batch.lengths.tolist() == [17, 1, CIRCLE_POINTS, 0]
+    assert batch.palette == ['blue', 'red', 'green'] and batch.color_idx.tolist() == [0, 1, 0, 2]
+    assert batch.should_close.tolist() == [True, False, False, False]
+    assert batch.identifier == ['a', 'b', 'c', 'd']
+
+    np.testing.assert_allclose(batch.bbox[0], [0, 0, 10, 10])
+    np.testing.assert_allclose(batch.bbox[2], [3, 3, 7, 7], atol=5e-3)
+    assert np.isnan(batch.bbox[3]).all()
+    assert batch.on_platform().tolist()[:3] == [True, False, True]
+
+    segments = batch.segments(batch.type_code == ShapeBatch.PATH)
+    np.testing.assert_array_equal(segments[0], shapes[0]['points'].astype(np.float32))
+    print("✓ ShapeBatch.from_shape_data")
+
+
+def test_shape_batch_simplified():
+    """Only long enough paths are simplified; other shapes and columns are kept"""
+    batch = ShapeBatch.from_shape_data(_shape_data_list())
+    simple = batch.simplified(0.01)
+
+    np.testing.assert_array_equal(simple.segments()[0], _square(0, 0, 10).astype(np.float32))
+    assert simple.lengths.tolist() == [5, 1, CIRCLE_POINTS, 0]
+    assert simple.should_close is batch.should_close
+    print("✓ ShapeBatch.simplified")
+
+
+def test_build_shape_columns():
+    """Shape dicts split into path, point and circle columns"""
+    columns = build_shape_columns(_shape_data_list()[:3])
+    assert len(columns['path_points']) == 1 and columns['path_should_close'] == [True]
+    np.testing.assert_array_equal(columns['point_xy'], [[500.0, 500.0]])
+    np.testing.assert_array_equal(columns['circle_centers'], [[5.0, 5.0]])
+    np.testing.assert_array_equal(columns['circle_radii'], [2.0])
+    assert columns['num_shapes'] == 3
+    print("✓ build_shape_columns")
+
+
+def test_is_shape_inside_shape():
+    """Containment holds for a nested square and fails for a disjoint one, with or without bboxes"""
+    outer = _square(0, 0, 10)
+    inner = _square(2, 2, 3)
+    far = _square(50, 50, 3)
+    assert is_shape_inside_shape(inner, outer)
+    assert is_shape_inside_shape(inner.tolist(), outer.tolist())
+    assert not is_shape_inside_shape(outer, inner)
+    assert not is_shape_inside_shape(far, outer, inner_bbox=(50, 50, 53, 53), outer_bbox=(0, 0, 10, 10))
+    print("✓ is_shape_inside_shape")
+
+
+def test_clean_platform_cache_key():
+    """The key is stable for unchanged inputs and changes with file contents, height or options"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'Part.clf')
+        with open(path, 'wb') as f:
+            f.write(b'a')
+        clf_files = [{'path': path}]
+
+        key = _clean_platform_cache_key(clf_files, 1.0, True, False, None)
+        assert key == _clean_platform_cache_key(clf_files, 1.0, True, False, None)
+        assert key != _clean_platform_cache_key(clf_files, 2.0, True, False, None)
+        assert key != _clean_platform_cache_key(clf_files, 1.0, True, False, 'int16')
+
+        with open(path, 'wb') as f:
+            f.write(b'bb')
+        assert key != _clean_platform_cache_key(clf_files, 1.0, True, False, None)
+    print("✓ _clean_platform_cache_key")
+
+
+if __name__ == "__main__":
+    test_shape_batch_from_shape_data()
+    test_shape_batch_simplified()
+    test_build_shape_columns()
+    test_is_shape_inside_shape()
+    test_clean_platform_cache_key()
+    print("\n🎉 All shape batch tests passed!")
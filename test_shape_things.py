@@ -0,0 +1,128 @@
+# test_shape_things.py
+"""
+Check that the compiled and NumPy shape kernels in shape_things agree
+"""
+import os
+import sys
+
+import numpy as np
+
+# Add the src directory to the path to find our utils
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(script_dir, "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from utils.myfuncs.shape_things import (
+    CIRCLE_POINTS,
+    _process_shapes_loop,
+    _process_shapes_numpy,
+    _should_close_path_numpy,
+    _simplify_mask_loop,
+    _simplify_mask_numpy,
+    circle_vertices,
+    circle_vertices_batch,
+    process_shapes,
+    should_close_path,
+    simplify_path,
+)
+
+
+def _build_layer():
+    """Empty, 1-, 2- and 3-point shapes plus a closed ring, back to back"""
+    shapes = [
+        np.empty((0, 2)),
+        np.array([[1.0, 2.0]]),
+        np.array([[0.0, 0.0], [3.0, 4.0]]),
+        np.array([[0.0, 0.0], [10.0, 0.0], [10.0, 5.0]]),
+        np.array([[0.0, 0.0], [10.0, 0.0], [10.0, 10.0], [0.0, 10.0], [0.0, 0.1]]),
+        np.empty((0, 2)),
+    ]
+    verts = np.concatenate(shapes)
+    offsets = np.concatenate([[0], np.cumsum([len(s) for s in shapes])]).astype(np.int64)
+    return verts, offsets
+
+
+def _assert_same(expected, actual):
+    for e, a in zip(expected, actual):
+        np.testing.assert_array_equal(np.asarray(e), np.asarray(a))
+
+
+def test_process_shapes_loop_matches_numpy():
+    """The loop kernel and the NumPy fallback give the same closure, validity and bbox"""
+    print("Testing process_shapes kernels...")
+
+    verts, offsets = _build_layer()
+    expected = _process_shapes_numpy(verts, offsets)
+    _assert_same(expected, _process_shapes_loop(verts, offsets))
+    _assert_same(expected, process_shapes(verts, offsets))
+
+    should_close, has_valid, bbox = expected
+    assert has_valid.tolist() == [False, False, False, True, True, False]
+    assert should_close.tolist() == [False, False, False, False, True, False]
+    assert np.isnan(bbox[0]).all() and np.isnan(bbox[-1]).all()
+    np.testing.assert_array_equal(bbox[1], [1.0, 2.0, 1.0, 2.0])
+    np.testing.assert_array_equal(bbox[2], [0.0, 0.0, 3.0, 4.0])
+    print("✓ process_shapes kernels agree")
+
+
+def test_process_shapes_no_shapes():
+    """A layer without shapes returns empty results from both kernels"""
+    verts = np.empty((0, 2))
+    offsets = np.array([0], dtype=np.int64)
+    for result in (_process_shapes_numpy(verts, offsets), _process_shapes_loop(verts, offsets)):
+        should_close, has_valid, bbox = result
+        assert len(should_close) == 0 and len(has_valid) == 0
+        assert bbox.shape == (0, 4)
+    print("✓ process_shapes handles an empty layer")
+
+
+def test_circle_vertices_match_batch():
+    """circle_vertices and circle_vertices_batch tessellate a circle into the same closed ring"""
+    ring = circle_vertices(1.0, -2.0, 3.0)
+    batch = circle_vertices_batch([[1.0, -2.0], [0.0, 0.0]], [3.0, 1.0])
+    assert ring.shape == (CIRCLE_POINTS, 2)
+    assert batch.shape == (2, CIRCLE_POINTS, 2)
+    np.testing.assert_allclose(ring, batch[0])
+    np.testing.assert_allclose(ring[0], ring[-1], atol=1e-12)
+    np.testing.assert_allclose(np.hypot(ring[:, 0] - 1.0, ring[:, 1] + 2.0), 3.0)
+    print("✓ circle_vertices matches circle_vertices_batch")
+
+
+def test_should_close_path_matches_numpy():
+    """The compiled closure test agrees with the NumPy one for float32, float64 and lists"""
+    rng = np.random.default_rng(2)
+    for _ in range(20):
+        points = np.cumsum(rng.normal(size=(int(rng.integers(3, 40)), 2)), axis=0)
+        points[-1] = points[0] + rng.normal(scale=0.3, size=2)
+        expected = bool(_should_close_path_numpy(points))
+        assert should_close_path(points) == expected
+        assert should_close_path(points.astype(np.float32)) == bool(_should_close_path_numpy(points.astype(np.float32)))
+        assert should_close_path(points.tolist()) == expected
+    assert should_close_path(np.zeros((2, 2))) is False
+    print("✓ should_close_path matches the NumPy test")
+
+
+def test_simplify_path():
+    """The loop and NumPy Douglas-Peucker masks agree, and straight runs collapse to their ends"""
+    rng = np.random.default_rng(3)
+    for _ in range(20):
+        points = np.cumsum(rng.normal(size=(int(rng.integers(3, 60)), 2)), axis=0)
+        np.testing.assert_array_equal(_simplify_mask_loop(points, 0.5), _simplify_mask_numpy(points, 0.5))
+
+    line = np.column_stack([np.linspace(0, 10, 11), np.zeros(11)])
+    np.testing.assert_array_equal(simplify_path(line, 0.01), [[0.0, 0.0], [10.0, 0.0]])
+
+    corner = np.array([[0.0, 0.0], [5.0, 0.0], [10.0, 0.0], [10.0, 5.0], [10.0, 10.0]])
+    np.testing.assert_array_equal(simplify_path(corner, 0.01), [[0.0, 0.0], [10.0, 0.0], [10.0, 10.0]])
+    assert simplify_path(corner, 0) is corner, "A zero tolerance leaves the path alone"
+    print("✓ simplify_path keeps the corners")
+
+
+if __name__ == "__main__":
+    test_process_shapes_loop_matches_numpy()
+    test_process_shapes_no_shapes()
+    test_circle_vertices_match_batch()
+    test_should_close_path_matches_numpy()
+    test_simplify_path()
+    print("\n🎉 All shape_things tests passed!")
@@ -30,7 +30,7 @@ if root_dir not in sys.path:
 import setup_paths
 from utils.pyarcam.clfutil import CLFFile
 from utils.myfuncs.file_utils import find_clf_files, load_exclusion_patterns, should_skip_folder
-from utils.platform_analysis.visualization_utils import create_clean_platform
+from utils.platform_analysis.visualization_utils import create_clean_platform, clear_layer_cache, release_cached_figures
 from config import PROJECT_ROOT
 
 class CLFWebAnalyzer:
@@ -187,6 +187,8 @@ class CLFWebAnalyzer:
                     temp_dir,
                     height=height_mm
                 )
+                # The server outlives this request, so don't keep its parsed layers around
+                clear_layer_cache()
                 
                 if clean_file:
                     # Convert relative path to absolute
@@ -251,6 +253,9 @@ class CLFWebAnalyzer:
             except Exception as viz_error:
                 print(f"Error generating visualization: {viz_error}")
                 analysis_results["visualizations"]["error"] = str(viz_error)
+            finally:
+                # Each request runs on its own server thread, so close the clean platform figure it cached
+                release_cached_figures()
             
             # Add file details to results
             analysis_results["processed_files"] = []
@@ -518,6 +523,8 @@ class CLFWebAnalyzer:
         Returns:
             tuple: (holes_visualization_path, holes_statistics_dict)
         """
+        import numpy as np
+        
         try:
             print(f"Starting geometric holes analysis at {height}mm...")
             print("🔍 USING NEW GEOMETRIC CONTAINMENT METHOD 🔍")
@@ -544,18 +551,31 @@ class CLFWebAnalyzer:
                     
                     print(f"  Found {total_shapes} shapes in {clf_info['name']}")
                     
-                    # Process each shape pair to find holes using geometric containment
-                    for i, shape1 in enumerate(shapes):
-                        if not hasattr(shape1, 'points') or not shape1.points:
+                    # First path, identifier and bounding box of every shape, computed once
+                    candidates = []
+                    for i, shape in enumerate(shapes):
+                        if not hasattr(shape, 'points') or not shape.points:
                             continue
-                            
-                        # Get identifier for shape1
-                        identifier1 = "unknown"
-                        if hasattr(shape1, 'model') and hasattr(shape1.model, 'id'):
-                            identifier1 = str(shape1.model.id)
-                        
+                        identifier = "unknown"
+                        if hasattr(shape, 'model') and hasattr(shape.model, 'id'):
+                            identifier = str(shape.model.id)
+                        candidates.append((i, identifier, np.asarray(shape.points[0])))
+                    
+                    # Empty paths get an inverted box so they never overlap anything
+                    bboxes = np.array([[p[:, 0].min(), p[:, 1].min(), p[:, 0].max(), p[:, 1].max()] 
+                                       if len(p) else [np.inf, np.inf, -np.inf, -np.inf] 
+                                       for _, _, p in candidates]).reshape(-1, 4)
+                    
+                    # overlaps[a, b]: boxes of shapes a and b intersect. A shape whose box misses the
+                    # exterior's box cannot have any sample point inside it, so only overlapping
+                    # pairs need the point-in-polygon test
+                    overlaps = ((bboxes[None, :, 0] <= bboxes[:, None, 2]) & (bboxes[None, :, 2] >= bboxes[:, None, 0]) &
+                                (bboxes[None, :, 1] <= bboxes[:, None, 3]) & (bboxes[None, :, 3] >= bboxes[:, None, 1]))
+                    np.fill_diagonal(overlaps, False)
+                    
+                    # Process each shape pair to find holes using geometric containment
+                    for a, (i, identifier1, exterior_points) in enumerate(candidates):
                         # Shape1 first path is always an exterior (like main visualization)
-                        exterior_points = shape1.points[0]
                         exterior_info = {
                             'type': 'exterior',
                             'points': exterior_points,
@@ -568,22 +588,11 @@ class CLFWebAnalyzer:
                         exteriors_found += 1
                         
                         # Look for other shapes that might be holes inside this shape
-                        for j, shape2 in enumerate(shapes):
-                            if i == j:  # Skip same shape
-                                continue
-                                
-                            if not hasattr(shape2, 'points') or not shape2.points:
-                                continue
-                            
-                            # Get identifier for shape2  
-                            identifier2 = "unknown"
-                            if hasattr(shape2, 'model') and hasattr(shape2.model, 'id'):
-                                identifier2 = str(shape2.model.id)
+                        for b in np.flatnonzero(overlaps[a]):
+                            j, identifier2, shape2_points = candidates[b]
                             
                             # Check if shape2 is inside shape1 using geometric containment
-                            shape2_points = shape2.points[0]  # Use first path of shape2
-                            
-                            if self.is_shape_inside_shape(shape2_points, exterior_points):
+                            if self.is_shape_inside_shape(shape2_points, exterior_points, outer_bbox=bboxes[a]):
                                 print(f"    Found geometric hole: Shape {j} (ID:{identifier2}) inside Shape {i} (ID:{identifier1})")
                                 
                                 hole_info = {
@@ -704,13 +713,14 @@ class CLFWebAnalyzer:
             traceback.print_exc()
             return None, None
     
-    def is_shape_inside_shape(self, inner_points, outer_points):
+    def is_shape_inside_shape(self, inner_points, outer_points, outer_bbox=None):
         """
         Check if inner_points shape is geometrically contained within outer_points shape
         
         Args:
             inner_points: numpy array of points for the inner shape
             outer_points: numpy array of points for the outer shape
+            outer_bbox: optional precomputed (xmin, ymin, xmax, ymax) of the outer shape
             
         Returns:
             bool: True if inner shape is inside outer shape
@@ -719,14 +729,22 @@ class CLFWebAnalyzer:
             import numpy as np
             from matplotlib.path import Path
             
-            # Create a path from the outer shape
-            outer_path = Path(outer_points)
-            
             # Check if all points of the inner shape are inside the outer path
             # We'll check a few sample points to be efficient
             sample_indices = np.linspace(0, len(inner_points)-1, min(10, len(inner_points)), dtype=int)
             sample_points = inner_points[sample_indices]
             
+            # A sample outside the outer bounding box is outside the shape, so too few samples
+            # in the box rules the pair out before building the Path
+            if outer_bbox is not None and len(sample_points):
+                in_box = ((sample_points[:, 0] >= outer_bbox[0]) & (sample_points[:, 0] <= outer_bbox[2]) &
+                          (sample_points[:, 1] >= outer_bbox[1]) & (sample_points[:, 1] <= outer_bbox[3]))
+                if np.sum(in_box) < len(in_box) * 0.8:
+                    return False
+            
+            # Create a path from the outer shape
+            outer_path = Path(outer_points)
+            
             # All sample points should be inside the outer shape
             inside_checks = outer_path.contains_points(sample_points)
             